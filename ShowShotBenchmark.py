@@ -0,0 +1,848 @@
+import os
+import sys
+import json
+import random
+import shutil
+import argparse
+import tempfile
+import time
+import tracemalloc
+import asyncio
+import multiprocessing
+import contextlib
+import signal
+import subprocess
+from typing import List, Dict
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+from ShowShotManager import ShowManager, ShotManager, AssetManager, AsyncShotManager, get_show_index, get_search_index, load_show_model
+from ShowShotManager import JsonTreeBackend, SQLiteBackend, BinaryCodec, CODECS, StudioCoordinator, EXPORT_FORMATS, export_show
+from ShowShotClient import ShotManagerClient
+
+# ==================================================================================== BEGIN SYNTHETIC SHOWS ====================================================================================
+
+def generate_show(directory_path: str, show_name: str, shots: int = 1000, categories: int = 3,
+                  assets_per_category: int = 50, references: int = 3, seed: int = 0) -> Dict:
+    """
+    Generate a synthetic show modeled on the Animal_Kingdom/Dogs layout.
+
+    Args:
+        directory_path (str): The directory the show is created in.
+        show_name (str): The name of the show directory.
+        shots (int): The number of shot JSON files.
+        categories (int): The number of asset category folders.
+        assets_per_category (int): The number of asset JSON files per category.
+        references (int): The number of assets each shot lists (and shots each asset lists).
+        seed (int): The random seed, so runs are repeatable.
+
+    Returns:
+        Dict: The number of files created and their total size in bytes.
+    """
+    rng = random.Random(seed)
+    show_path = os.path.join(directory_path, show_name)
+    os.makedirs(show_path, exist_ok=True)
+    category_names = [f"Category{index}" for index in range(categories)]
+    asset_names = [
+        (category, f"asset{index}") for category in category_names for index in range(assets_per_category)
+    ]
+    shot_names = [f"character{index}" for index in range(shots)]
+    files = []
+
+    def write(path, data):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=4)
+        files.append(path)
+
+    write(os.path.join(show_path, "description.json"), {"Description": f"Synthetic show '{show_name}'"})
+    for category in category_names:
+        os.makedirs(os.path.join(show_path, category), exist_ok=True)
+        write(os.path.join(show_path, category, "description.json"), {"description": f"Synthetic {category} assets"})
+    for category, asset in asset_names:
+        write(os.path.join(show_path, category, f"{asset}.json"), {
+            "name": asset,
+            "additional_info": f"Synthetic {category} asset.",
+            "Shots": rng.sample(shot_names, min(references, len(shot_names))),
+        })
+    for shot in shot_names:
+        write(os.path.join(show_path, f"{shot}.json"), {
+            "name": shot,
+            "age": rng.randint(1, 15),
+            "breed": rng.choice(["Golden Retriever", "Beagle", "Poodle", "Husky"]),
+            "assets": [f"{category}_{asset}" for category, asset in rng.sample(asset_names, min(references, len(asset_names)))],
+        })
+
+    return {"files": len(files), "bytes": sum(os.path.getsize(path) for path in files)}
+
+
+def generate_studio(directory_path: str, show_name: str, sequences: int = 2, shots: int = 1000, categories: int = 3,
+                    assets_per_category: int = 50, references: int = 3, seed: int = 0) -> Dict:
+    """
+    Generate a synthetic show with several subdirectories, each laid out like Animal_Kingdom/Dogs.
+
+    Args:
+        directory_path (str): The directory the show is created in.
+        show_name (str): The name of the show directory, opened with ShowManager(directory_path, show_name).
+        sequences (int): The number of subdirectories, named 'Sequence0', 'Sequence1', ...
+        shots (int): The number of shot JSON files per subdirectory.
+        categories (int): The number of asset category folders per subdirectory.
+        assets_per_category (int): The number of asset JSON files per category.
+        references (int): The number of assets each shot lists (and shots each asset lists).
+        seed (int): The random seed, so runs are repeatable.
+
+    Returns:
+        Dict: The number of files created and their total size in bytes.
+    """
+    totals = {"files": 0, "bytes": 0}
+    for index in range(sequences):
+        created = generate_show(os.path.join(directory_path, show_name), f"Sequence{index}", shots, categories,
+                                assets_per_category, references, seed + index)
+        totals["files"] += created["files"]
+        totals["bytes"] += created["bytes"]
+    return totals
+
+# ==================================================================================== END SYNTHETIC SHOWS ====================================================================================
+
+
+# ==================================================================================== BEGIN ARCHIVE BENCHMARK ====================================================================================
+
+def benchmark_archive(directory_path: str, show_name: str, workers: List[int],
+                      compressions: List[str] = ("deflate",)) -> List[Dict]:
+    """
+    Time ShowManager.zip_show for several worker counts and compressions.
+
+    Args:
+        directory_path (str): The directory holding the show.
+        show_name (str): The name of the show directory.
+        workers (List[int]): The worker counts to try.
+        compressions (List[str]): The compressions to try.
+
+    Returns:
+        List[Dict]: One statistics dictionary per run, with the settings that produced it.
+    """
+    show_manager = ShowManager(directory_path, show_name)
+    results = []
+    for compression in compressions:
+        for worker_count in workers:
+            zip_file_name = f"{show_name}_{compression}_{worker_count}.zip"
+            stats = show_manager.zip_show(zip_file_name, compression=compression, workers=worker_count)
+            os.remove(os.path.join(directory_path, zip_file_name))
+            results.append(dict(stats, compression=compression, workers=worker_count))
+    return results
+
+# ==================================================================================== END ARCHIVE BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN CONCURRENCY STRESS ====================================================================================
+
+def _add_shots_worker(directory_path: str, show_name: str, worker: int, updates: int, concurrency: str) -> None:
+    asset_manager = AssetManager(directory_path, concurrency=concurrency, retries=1000)
+    for index in range(updates):
+        asset_manager.add_shots_key_values(os.path.join(show_name, "Category0"), "asset0.json", [f"worker{worker}_shot{index}"])
+
+
+def stress_concurrent_updates(directory_path: str, show_name: str, processes: int = 8, updates: int = 50,
+                              modes: List[str] = (None, "lock", "optimistic")) -> List[Dict]:
+    """
+    Have several processes add shots to the same asset at once and count the lost updates.
+
+    Every process adds its own shot names, so a correct run ends with all of them listed.
+
+    Args:
+        directory_path (str): The directory holding the show.
+        show_name (str): The name of the show directory.
+        processes (int): The number of competing processes.
+        updates (int): The number of shots each process adds.
+        modes (List[str]): The AssetManager concurrency modes to try.
+
+    Returns:
+        List[Dict]: One result per mode with the throughput and the share of lost updates.
+    """
+    asset_manager = AssetManager(directory_path)
+    results = []
+    for mode in modes:
+        asset_manager.update_shots_key(os.path.join(show_name, "Category0"), "asset0.json", [])
+        workers = [
+            multiprocessing.Process(target=_add_shots_worker, args=(directory_path, show_name, worker, updates, mode))
+            for worker in range(processes)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        written = len(asset_manager.get_shots_key_values(os.path.join(show_name, "Category0"), "asset0.json"))
+        expected = processes * updates
+        results.append({
+            "concurrency": mode,
+            "seconds": round(elapsed, 3),
+            "updates_per_second": round(expected / elapsed, 1),
+            "lost_update_rate": round(1 - written / expected, 4),
+        })
+    return results
+
+# ==================================================================================== END CONCURRENCY STRESS ====================================================================================
+
+
+# ==================================================================================== BEGIN ASYNC BENCHMARK ====================================================================================
+
+def benchmark_async_reads(directory_path: str, show_name: str, concurrency: List[int] = (1, 8, 32)) -> List[Dict]:
+    """
+    Time reading every shot of a show with ShotManager and with AsyncShotManager.
+
+    Args:
+        directory_path (str): The directory holding the show.
+        show_name (str): The name of the show directory.
+        concurrency (List[int]): The AsyncShotManager max_concurrency values to try.
+
+    Returns:
+        List[Dict]: One result per run, with the number of shots read and the time taken.
+    """
+    show_path = os.path.join(directory_path, show_name)
+    shot_manager = ShotManager(show_path)
+    file_names = [name for name in sorted(os.listdir(show_path)) if name.endswith(".json") and name != "description.json"]
+
+    start = time.perf_counter()
+    for file_name in file_names:
+        shot_manager.get_json_file_info(file_name)
+    results = [{"manager": "ShotManager", "max_concurrency": None, "shots": len(file_names),
+                "seconds": round(time.perf_counter() - start, 3)}]
+
+    async def read_all(max_concurrency):
+        async with AsyncShotManager(show_path, max_concurrency=max_concurrency) as async_shot_manager:
+            return await async_shot_manager.get_json_files_info(file_names)
+
+    for max_concurrency in concurrency:
+        start = time.perf_counter()
+        shots = asyncio.run(read_all(max_concurrency))
+        results.append({"manager": "AsyncShotManager", "max_concurrency": max_concurrency, "shots": len(shots),
+                        "seconds": round(time.perf_counter() - start, 3)})
+    return results
+
+# ==================================================================================== END ASYNC BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN QUERY BENCHMARK ====================================================================================
+
+def benchmark_query(directory_path: str, show_name: str = "QueryShow", shots: int = 100000, repeats: int = 5) -> Dict:
+    """
+    Compare an indexed ShotManager.query with reading and filtering every shot file by hand.
+
+    Args:
+        directory_path (str): The directory the synthetic show is created in.
+        show_name (str): The name of the show directory.
+        shots (int): The number of shots in the synthetic show.
+        repeats (int): How many times each query is run; the best time is kept.
+
+    Returns:
+        Dict: The index build time, the best time of each approach and the number of matches.
+    """
+    generate_show(directory_path, show_name, shots=shots, assets_per_category=max(50, shots // 100))
+    show_path = os.path.join(directory_path, show_name)
+    shot_manager = ShotManager(show_path)
+    where = {"breed": "Golden Retriever", "age": (">=", 12), "assets": ("glob", "Category0_*")}
+
+    start = time.perf_counter()
+    get_show_index(show_path)
+    build_seconds = time.perf_counter() - start
+
+    def scan():
+        matches = []
+        for file_name in os.listdir(show_path):
+            if not file_name.endswith(".json") or file_name == "description.json":
+                continue
+            data = shot_manager.get_json_file_info(file_name)
+            if (data["breed"] == "Golden Retriever" and data["age"] >= 12
+                    and any(asset.startswith("Category0_") for asset in data["assets"])):
+                matches.append({"name": data["name"], "age": data["age"]})
+        return matches
+
+    def best_time(function):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = function()
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    query_seconds, matches = best_time(lambda: shot_manager.query(where, fields=["name", "age"]))
+    scan_seconds, scanned = best_time(scan)
+    return {
+        "shots": shots,
+        "matches": len(matches),
+        "scan_matches": len(scanned),
+        "index_build_seconds": round(build_seconds, 3),
+        "query_seconds": round(query_seconds, 4),
+        "scan_seconds": round(scan_seconds, 4),
+    }
+
+# ==================================================================================== END QUERY BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN MEMORY BENCHMARK ====================================================================================
+
+def benchmark_memory(directory_path: str, show_name: str = "MemoryShow", shots: int = 100000) -> Dict:
+    """
+    Compare the memory held by a show loaded as json.load dictionaries and as a compact Show.
+
+    Args:
+        directory_path (str): The directory the synthetic show is created in.
+        show_name (str): The name of the show directory.
+        shots (int): The number of shots in the synthetic show.
+
+    Returns:
+        Dict: The bytes held by each representation and their ratio.
+    """
+    generate_show(directory_path, show_name, shots=shots, assets_per_category=max(50, shots // 100), references=5)
+    show_path = os.path.join(directory_path, show_name)
+
+    def load_dicts():
+        documents = {}
+        for root, dirs, files in os.walk(show_path):
+            for file_name in files:
+                if file_name.endswith(".json"):
+                    with open(os.path.join(root, file_name), 'r', encoding='utf-8') as file:
+                        documents[os.path.join(root, file_name)] = json.load(file)
+        return documents
+
+    def held_bytes(load):
+        tracemalloc.start()
+        loaded = load()
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del loaded
+        return held
+
+    dict_bytes = held_bytes(load_dicts)
+    model_bytes = held_bytes(lambda: load_show_model(show_path))
+    return {
+        "shots": shots,
+        "dict_bytes": dict_bytes,
+        "model_bytes": model_bytes,
+        "dict_bytes_per_shot": round(dict_bytes / shots),
+        "model_bytes_per_shot": round(model_bytes / shots),
+        "ratio": round(dict_bytes / model_bytes, 2),
+    }
+
+# ==================================================================================== END MEMORY BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN CODEC BENCHMARK ====================================================================================
+
+def benchmark_codecs(directory_path: str, documents: int = 20000, references: int = 20) -> List[Dict]:
+    """
+    Measure serialization throughput per codec, in memory and through the backends.
+
+    The documents follow the doggo1_info.json and Staff1.json schemas, with longer
+    'assets' and 'Shots' lists.
+
+    Args:
+        directory_path (str): A scratch directory.
+        documents (int): The number of documents of each schema.
+        references (int): The length of each 'assets' / 'Shots' list.
+
+    Returns:
+        List[Dict]: One result per codec and storage, with documents per second for writes and reads.
+    """
+    rng = random.Random(0)
+    shots = [{"name": f"Doggo{index}", "age": rng.randint(1, 15), "breed": "Golden Retriever",
+              "assets": [f"Prop_asset{rng.randint(0, 999)}" for _ in range(references)]} for index in range(documents)]
+    assets = [{"name": f"Custom Asset{index}", "additional_info": "This is a custom asset with user-defined data.",
+               "Shots": [f"character{rng.randint(0, 99999)}" for _ in range(references)]} for index in range(documents)]
+    corpus = shots + assets
+    results = []
+
+    def record(codec, storage, write_seconds, read_seconds, size):
+        results.append({"codec": codec, "storage": storage, "bytes_per_document": round(size / len(corpus)),
+                        "writes_per_second": round(len(corpus) / write_seconds), "reads_per_second": round(len(corpus) / read_seconds)})
+
+    binary = ("binary",) if BinaryCodec.available() else ()  # the binary codec and sidecars need msgpack
+    for name in ("json", "compact", "fast") + binary:
+        codec = CODECS[name]
+        start = time.perf_counter()
+        payloads = [codec.encode(document) for document in corpus]
+        encode_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for payload in payloads:
+            codec.decode(payload)
+        record(name, "memory", encode_seconds, time.perf_counter() - start, sum(map(len, payloads)))
+
+    def run_backend(backend, codec, storage, root):
+        paths = [os.path.join(root, "Show", f"document{index}.json") for index in range(len(corpus))]
+        backend.make_dirs(os.path.join(root, "Show"))
+        start = time.perf_counter()
+        with backend.transaction():
+            for path, document in zip(paths, corpus):
+                backend.write(path, document)
+        write_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for path in paths:
+            backend.read(path)
+        read_seconds = time.perf_counter() - start
+        size = sum(os.path.getsize(path) for path in paths) if storage.startswith("files") else os.path.getsize(backend.catalog_path)
+        record(codec, storage, write_seconds, read_seconds, size)
+
+    for name in ("json", "compact", "fast"):
+        root = tempfile.mkdtemp(dir=directory_path)
+        run_backend(JsonTreeBackend(codec=name), name, "files", root)
+        shutil.rmtree(root)
+    if binary:
+        root = tempfile.mkdtemp(dir=directory_path)
+        run_backend(JsonTreeBackend(sidecar=True), "json", "files+sidecar", root)
+        shutil.rmtree(root)
+    for name in ("compact", "fast") + binary:
+        root = tempfile.mkdtemp(dir=directory_path)
+        backend = SQLiteBackend(os.path.join(root, "catalog.db"), root, codec=name)
+        run_backend(backend, name, "sqlite", root)
+        backend.close()
+        shutil.rmtree(root)
+    return results
+
+# ==================================================================================== END CODEC BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN STUDIO BENCHMARK ====================================================================================
+
+def benchmark_studio(directory_path: str, shows: int = 16, shots: int = 2000, workers: List[int] = None) -> List[Dict]:
+    """
+    Time StudioCoordinator.check_integrity over a synthetic studio for several worker counts.
+
+    Args:
+        directory_path (str): The directory the studio is created in.
+        shows (int): The number of shows, each with one 'Seq' subdirectory.
+        shots (int): The number of shots per show.
+        workers (List[int], optional): The worker counts to try. Defaults to 1, 2, 4, ... up to the number of CPUs.
+
+    Returns:
+        List[Dict]: One result per worker count, with the time taken and the speed-up over one worker.
+    """
+    studio_path = os.path.join(directory_path, "Studio")
+    for index in range(shows):
+        generate_show(os.path.join(studio_path, f"Show{index}"), "Seq", shots=shots, seed=index)
+    if workers is None:
+        workers = [count for count in (1, 2, 4, 8, 16, 32, 64) if count <= (os.cpu_count() or 1)]
+
+    results = []
+    for worker_count in workers:
+        start = time.perf_counter()
+        report = StudioCoordinator(studio_path, worker_count).check_integrity()
+        seconds = time.perf_counter() - start
+        results.append({"workers": worker_count, "shows": len(report["results"]), "errors": len(report["errors"]),
+                        "seconds": round(seconds, 3), "speedup": round(results[0]["seconds"] / seconds, 2) if results else 1.0})
+    return results
+
+# ==================================================================================== END STUDIO BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN EXPORT BENCHMARK ====================================================================================
+
+def benchmark_export(directory_path: str, show_name: str = "ExportShow", shots: int = 50000) -> List[Dict]:
+    """
+    Measure export throughput and peak memory against a plain read of every file.
+
+    Args:
+        directory_path (str): The directory the show is created in.
+        show_name (str): The name of the show directory.
+        shots (int): The number of shots in the synthetic show.
+
+    Returns:
+        List[Dict]: One result per source and format, with records per second, megabytes read
+        per second and the peak memory traced during the export.
+    """
+    generate_show(os.path.join(directory_path, show_name), "Seq", shots=shots, assets_per_category=shots // 100)
+    manager = ShowManager(directory_path, show_name)
+    manager.zip_show(f"{show_name}.zip")
+    source_path = os.path.join(directory_path, show_name)
+    source_bytes = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(source_path) for name in names)
+
+    start = time.perf_counter()
+    for root, _, names in os.walk(source_path):
+        for name in names:
+            with open(os.path.join(root, name), 'rb') as file:
+                file.read()
+    results = [{"source": "directory", "format": "read only", "records_per_second": None,
+                "megabytes_per_second": round(source_bytes / (time.perf_counter() - start) / 1e6, 1), "peak_kilobytes": None}]
+
+    for source, path in (("directory", source_path), ("archive", os.path.join(directory_path, f"{show_name}.zip"))):
+        for export_format in EXPORT_FORMATS:
+            output_path = os.path.join(directory_path, f"export.{export_format}")
+            edges_path = os.path.join(directory_path, f"edges.{export_format}")
+            tracemalloc.start()
+            start = time.perf_counter()
+            counts = export_show(path, output_path, export_format, edges_path)
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append({"source": source, "format": export_format, "records_per_second": round(counts["records"] / seconds),
+                            "megabytes_per_second": round(source_bytes / seconds / 1e6, 1), "peak_kilobytes": round(peak / 1024)})
+    return results
+
+# ==================================================================================== END EXPORT BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN METHOD BENCHMARK ====================================================================================
+
+def _peak_rss_kilobytes() -> int:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def time_calls(function, calls: List[tuple]) -> Dict:
+    """
+    Call a function once per argument tuple, with its printed output discarded, and summarize the latencies.
+
+    Args:
+        function (callable): The function to time, usually a bound manager method.
+        calls (List[tuple]): The positional arguments of each call.
+
+    Returns:
+        Dict: The number of calls, ops_per_second, and the p50_ms, p99_ms and max_ms latencies.
+    """
+    latencies = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for arguments in calls:
+            start = time.perf_counter()
+            function(*arguments)
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    def percentile(fraction):
+        return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000, 3)
+
+    return {"calls": len(latencies), "ops_per_second": round(len(latencies) / sum(latencies), 1),
+            "p50_ms": percentile(0.50), "p99_ms": percentile(0.99), "max_ms": round(latencies[-1] * 1000, 3)}
+
+
+def benchmark_methods(directory_path: str, show_name: str = "MethodShow", sequences: int = 2, shots: int = 1000,
+                      categories: int = 3, assets_per_category: int = 50, references: int = 3, repeats: int = 200,
+                      archive_repeats: int = 5) -> Dict:
+    """
+    Time the public methods of ShowManager, ShotManager and AssetManager on a synthetic show.
+
+    Each method is called 'repeats' times (archive methods 'archive_repeats' times) with
+    different arguments where that makes sense, in the order create, list, read, update,
+    zip, read from zip and delete, so every call finds the files it needs.
+
+    Args:
+        directory_path (str): The directory the show is created in.
+        show_name (str): The name of the show directory.
+        sequences (int): The number of subdirectories in the show.
+        shots (int): The number of shots per subdirectory.
+        categories (int): The number of asset categories per subdirectory.
+        assets_per_category (int): The number of assets per category.
+        references (int): The number of references per shot and asset.
+        repeats (int): The number of calls per method.
+        archive_repeats (int): The number of calls per archive method.
+
+    Returns:
+        Dict: The 'config' used, one result per 'Class.method' in 'methods' (see time_calls),
+        and the 'peak_rss_kilobytes' of the process.
+    """
+    config = {"sequences": sequences, "shots": shots, "categories": categories, "assets_per_category": assets_per_category,
+              "references": references, "repeats": repeats, "archive_repeats": archive_repeats}
+    generate_studio(directory_path, show_name, sequences, shots, categories, assets_per_category, references)
+    show_path = os.path.join(directory_path, show_name)
+    show_manager = ShowManager(directory_path, show_name)
+    shot_manager = ShotManager(os.path.join(show_path, "Sequence0"))
+    asset_manager = AssetManager(show_path)
+
+    def shot(index):
+        return f"character{index % shots}"
+
+    def asset(index):
+        return f"Category{index % categories}", f"asset{index % assets_per_category}.json"
+
+    info = {"age": 5, "breed": "Beagle", "assets": [f"Category0_asset{index}" for index in range(references)]}
+    asset_data = {"name": "Bench Asset", "additional_info": "Created by the benchmark.", "Shots": [shot(index) for index in range(references)]}
+    many = [[(f"many{batch}_{index}", "Many", info) for index in range(100)] for batch in range(archive_repeats)]
+    cases = [
+        # Create
+        (show_manager.create_subdirectories, [([f"Extra{index}"],) for index in range(repeats)]),
+        (show_manager.create_json_file, [(f"Extra{index}", "notes.json", {"notes": index}) for index in range(repeats)]),
+        (shot_manager.create_character_info, [(f"bench{index}", f"Bench{index}", info) for index in range(repeats)]),
+        (shot_manager.create_many, [(records,) for records in many]),
+        (asset_manager.create_folders, [([f"Sequence0/Bench{index}"],) for index in range(repeats)]),
+        (asset_manager.add_description_file, [(f"Sequence0/Bench{index}", {"description": "Benchmark"}) for index in range(repeats)]),
+        (asset_manager.create_json_file, [(f"Sequence0/Bench{index}", asset_data, "asset.json") for index in range(repeats)]),
+        # List
+        (show_manager.get_subdirectories, [()] * repeats),
+        (shot_manager.get_json_files, [()] * repeats),
+        (asset_manager.read_asset_folders, [("Sequence0",)] * repeats),
+        (asset_manager.list_json_files, [(f"Sequence0/{asset(index)[0]}",) for index in range(repeats)]),
+        # Read
+        (show_manager.get_description_file, [(f"Sequence{index % sequences}",) for index in range(repeats)]),
+        (shot_manager.get_json_file_info, [(f"{shot(index)}.json",) for index in range(repeats)]),
+        (shot_manager.print_assets_key_values, [(f"{shot(index)}.json",) for index in range(repeats)]),
+        (shot_manager.find_assets_by_shot, [(shot(index),) for index in range(repeats)]),
+        (shot_manager.find_shots_by_asset, [("_".join(asset(index)).replace(".json", ""),) for index in range(repeats)]),
+        (asset_manager.print_description_file, [(f"Sequence0/{asset(index)[0]}",) for index in range(repeats)]),
+        (asset_manager.get_shots_key_values, [(f"Sequence0/{asset(index)[0]}", asset(index)[1]) for index in range(repeats)]),
+        (asset_manager.find_shots_by_asset, [(f"Sequence0/{asset(index)[0]}", asset(index)[1]) for index in range(repeats)]),
+        (asset_manager.find_assets_by_shot, [("Sequence0", shot(index)) for index in range(repeats)]),
+        (show_manager.query, [({"breed": "Beagle"}, ["name"], "shot", True)] * archive_repeats),
+        (shot_manager.query, [({"age": (">", 10)}, ["name"])] * archive_repeats),
+        (asset_manager.query, [("Sequence0", {"Shots": ("contains", shot(index))}) for index in range(archive_repeats)]),
+        # Update
+        (show_manager.update_description_file, [(f"Sequence{index % sequences}", {"Description": f"Updated {index}"}) for index in range(repeats)]),
+        (shot_manager.edit_json_file, [(f"{shot(index)}.json", {"name": shot(index), "age": index % 15, "breed": "Husky", "assets": info["assets"]}) for index in range(repeats)]),
+        (asset_manager.update_description_file, [(f"Sequence0/{asset(index)[0]}", {"description": f"Updated {index}"}) for index in range(repeats)]),
+        (asset_manager.update_shots_key, [(f"Sequence0/{asset(index)[0]}", asset(index)[1], [shot(index)]) for index in range(repeats)]),
+        (asset_manager.add_shots_key_values, [(f"Sequence0/{asset(index)[0]}", asset(index)[1], [shot(index + 1)]) for index in range(repeats)]),
+        # Zip
+        (show_manager.zip_show, [(f"{show_name}{index}.zip",) for index in range(archive_repeats)]),
+        (asset_manager.zip_asset_folders, [([f"Sequence0/Bench{index}"],) for index in range(archive_repeats)]),
+        # Read from zip
+        (show_manager.read_json_from_zip, [(f"{show_name}0.zip", f"Sequence0/{shot(index)}.json") for index in range(repeats)]),
+        (show_manager.read_data_from_zip, [(f"{show_name}0.zip", f"Sequence0/{asset(index)[0]}/*.json") for index in range(archive_repeats)]),
+        (asset_manager.read_data_from_zip, [(f"Bench{index}.zip", os.path.join(show_path, "Sequence0")) for index in range(archive_repeats)]),
+        # Delete
+        (shot_manager.delete_json_file, [(f"bench{index}.json",) for index in range(repeats)]),
+        (asset_manager.delete_asset_folder, [(f"Sequence0/Bench{index}",) for index in range(archive_repeats, repeats)]),
+        (show_manager.delete_subdirectory, [(f"Extra{index}",) for index in range(repeats)]),
+    ]
+
+    methods = {}
+    for function, calls in cases:
+        if calls:
+            methods[f"{type(function.__self__).__name__}.{function.__name__}"] = time_calls(function, calls)
+    return {"config": config, "methods": methods, "peak_rss_kilobytes": _peak_rss_kilobytes()}
+
+
+def compare_benchmarks(baseline: Dict, current: Dict, tolerance: float = 0.2) -> List[Dict]:
+    """
+    Find the methods that got slower between two benchmark_methods reports.
+
+    Args:
+        baseline (Dict): The report of the reference version.
+        current (Dict): The report of the version being checked.
+        tolerance (float): The fraction of ops/sec a method may lose before it counts as a regression.
+
+    Returns:
+        List[Dict]: One entry per regressed method, with the 'method', both 'ops_per_second' and the 'change'.
+    """
+    regressions = []
+    for method, result in current["methods"].items():
+        previous = baseline["methods"].get(method)
+        if previous is None:
+            continue
+        change = result["ops_per_second"] / previous["ops_per_second"] - 1
+        if change < -tolerance:
+            regressions.append({"method": method, "baseline_ops_per_second": previous["ops_per_second"],
+                                "ops_per_second": result["ops_per_second"], "change": round(change, 3)})
+    return regressions
+
+# ==================================================================================== END METHOD BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN SEARCH BENCHMARK ====================================================================================
+
+SEARCH_QUERIES = ["character4242", "Beagle Category1_asset7", "charac*", "Golden", "Synthetic assets"]
+
+
+def benchmark_search(directory_path: str, show_name: str = "SearchShow", shots: int = 100000, repeats: int = 20) -> Dict:
+    """
+    Measure building, refreshing and querying the full-text index of a synthetic show.
+
+    Args:
+        directory_path (str): The directory the show is created in.
+        show_name (str): The name of the show directory.
+        shots (int): The number of shots in the synthetic show.
+        repeats (int): How many times each query is run.
+
+    Returns:
+        Dict: The build and refresh times, the latency of an edit with the index open, and the
+        median and worst latency and number of results of each query in SEARCH_QUERIES.
+    """
+    generate_show(os.path.join(directory_path, show_name), "Seq", shots=shots, assets_per_category=shots // 100)
+    manager = ShowManager(directory_path, show_name)
+    show_path = os.path.join(directory_path, show_name)
+
+    start = time.perf_counter()
+    index = get_search_index(show_path)
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    index.refresh()
+    refresh_seconds = time.perf_counter() - start
+
+    shot_manager = ShotManager(os.path.join(show_path, "Seq"))
+    get_show_index(shot_manager.directory_path)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        shot_manager.edit_json_file("character0.json", {"name": "character0", "breed": "Dalmatian", "assets": []})
+        edit_seconds = time.perf_counter() - start
+
+    queries = {}
+    for query in SEARCH_QUERIES:
+        latencies = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = manager.search(query)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        queries[query] = {"results": len(results), "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+                          "max_ms": round(latencies[-1] * 1000, 3)}
+    return {
+        "documents": index.refresh()["documents"],
+        "build_seconds": round(build_seconds, 3),
+        "refresh_seconds": round(refresh_seconds, 3),
+        "edit_ms": round(edit_seconds * 1000, 3),
+        "edit_found": [result["path"] for result in manager.search("Dalmatian")],
+        "queries": queries,
+    }
+
+# ==================================================================================== END SEARCH BENCHMARK ====================================================================================
+
+
+# ==================================================================================== BEGIN DAEMON BENCHMARK ====================================================================================
+
+_DAEMON_TASK = """
+import sys
+from {module} import {manager}
+manager = {manager}(sys.argv[1])
+for name in sys.argv[2:]:
+    manager.get_json_file_info(name + ".json")
+    manager.find_assets_by_shot(name)
+"""
+
+
+def benchmark_daemon(directory_path: str, show_name: str = "DaemonShow", shots: int = 2000, repeats: int = 500,
+                     tasks: int = 20, calls_per_task: int = 5) -> Dict:
+    """
+    Compare the managers served by a ShowShotDaemon with direct file access.
+
+    Per call, a warm ShotManager in this process is compared with a ShotManagerClient. Per
+    task, short-lived processes (like farm tasks) each make a few calls, starting cold every time.
+
+    Args:
+        directory_path (str): The studio directory the show is created in.
+        show_name (str): The name of the show directory.
+        shots (int): The number of shots in the synthetic show.
+        repeats (int): Calls per method and mode.
+        tasks (int): Short-lived processes per mode.
+        calls_per_task (int): The shots each task reads and looks up.
+
+    Returns:
+        Dict: 'calls' (the time_calls summary of each method in each mode) and 'tasks'
+        (the mean and worst wall time of a task in each mode, in milliseconds).
+    """
+    generate_studio(directory_path, show_name, sequences=1, shots=shots)
+    sequence_path = os.path.join(directory_path, show_name, "Sequence0")
+    rng = random.Random(0)
+    shot_names = [f"character{rng.randrange(shots)}" for _ in range(repeats)]
+    package_path = os.path.dirname(os.path.abspath(__file__))
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_path, os.environ.get("PYTHONPATH")])))
+
+    daemon = subprocess.Popen([sys.executable, os.path.join(package_path, "ShowShotManager.py"), directory_path],
+                              stdout=subprocess.DEVNULL, env=environment)
+    try:
+        client = ShotManagerClient(sequence_path)
+        deadline = time.monotonic() + 60
+        while not client.daemon_running():
+            if daemon.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("The daemon did not start.")
+            time.sleep(0.05)
+
+        calls = {}
+        for mode, manager in (("direct", ShotManager(sequence_path)), ("daemon", client)):
+            calls[mode] = {
+                "get_json_file_info": time_calls(manager.get_json_file_info, [(f"{name}.json",) for name in shot_names]),
+                "find_assets_by_shot": time_calls(manager.find_assets_by_shot, [(name,) for name in shot_names]),
+                "query": time_calls(manager.query, [({"age": (">", 10), "breed": "Beagle"}, ["name"])] * (repeats // 10 or 1)),
+            }
+        client.close()
+
+        task_times = {}
+        for mode, module, manager in (("direct", "ShowShotManager", "ShotManager"), ("daemon", "ShowShotClient", "ShotManagerClient")):
+            code = _DAEMON_TASK.format(module=module, manager=manager)
+            timings = []
+            for task in range(tasks):
+                names = shot_names[task * calls_per_task % repeats:][:calls_per_task]
+                start = time.perf_counter()
+                subprocess.run([sys.executable, "-c", code, sequence_path] + names, check=True,
+                               stdout=subprocess.DEVNULL, env=environment)
+                timings.append(time.perf_counter() - start)
+            task_times[mode] = {"mean_ms": round(sum(timings) / len(timings) * 1000, 1), "max_ms": round(max(timings) * 1000, 1)}
+    finally:
+        daemon.send_signal(signal.SIGTERM)
+        daemon.wait(30)
+    return {"calls": calls, "tasks": task_times}
+
+# ==================================================================================== END DAEMON BENCHMARK ====================================================================================
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the ShowShotManager library on a synthetic show.")
+    parser.add_argument("--shots", type=int, default=5000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--compression", nargs="+", default=["deflate"])
+    parser.add_argument("--query-shots", type=int, default=0,
+                        help="Also run the query benchmark on a synthetic show with this many shots, e.g. 100000.")
+    parser.add_argument("--memory-shots", type=int, default=0,
+                        help="Also run the memory benchmark on a synthetic show with this many shots, e.g. 100000.")
+    parser.add_argument("--codec-documents", type=int, default=0,
+                        help="Also run the serialization benchmark with this many documents of each schema.")
+    parser.add_argument("--studio-shows", type=int, default=0,
+                        help="Also run the multi-show benchmark on a synthetic studio with this many shows.")
+    parser.add_argument("--export-shots", type=int, default=0,
+                        help="Also run the export benchmark on a synthetic show with this many shots, e.g. 50000.")
+    parser.add_argument("--search-shots", type=int, default=0,
+                        help="Also run the full-text search benchmark on a synthetic show with this many shots, e.g. 100000.")
+    parser.add_argument("--daemon-tasks", type=int, default=0,
+                        help="Also compare the daemon with direct access, running this many short-lived tasks in each mode.")
+    parser.add_argument("--methods", action="store_true",
+                        help="Run only the per-method benchmark and print its JSON report.")
+    parser.add_argument("--sequences", type=int, default=2, help="Subdirectories in the per-method benchmark show.")
+    parser.add_argument("--categories", type=int, default=3, help="Asset categories per subdirectory.")
+    parser.add_argument("--assets", type=int, default=50, help="Assets per category.")
+    parser.add_argument("--references", type=int, default=3, help="References per shot and asset.")
+    parser.add_argument("--repeats", type=int, default=200, help="Calls per method.")
+    parser.add_argument("--output", help="Also write the per-method report to this JSON file.")
+    parser.add_argument("--baseline", help="A per-method report to compare with; exits with status 1 on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="The ops/sec a method may lose before it counts as a regression.")
+    parser.add_argument("--stress-processes", type=int, default=0,
+                        help="Also run the concurrent update stress test with this many processes.")
+    arguments = parser.parse_args()
+
+    directory_path = tempfile.mkdtemp(prefix="showshot_benchmark_")
+    try:
+        if arguments.methods:
+            report = benchmark_methods(directory_path, sequences=arguments.sequences, shots=arguments.shots,
+                                       categories=arguments.categories, assets_per_category=arguments.assets,
+                                       references=arguments.references, repeats=arguments.repeats)
+            print(json.dumps(report, indent=4))
+            if arguments.output:
+                with open(arguments.output, 'w', encoding='utf-8') as file:
+                    json.dump(report, file, indent=4)
+            if arguments.baseline:
+                with open(arguments.baseline, 'r', encoding='utf-8') as file:
+                    regressions = compare_benchmarks(json.load(file), report, arguments.tolerance)
+                print(json.dumps(regressions, indent=4))
+                if regressions:
+                    sys.exit(1)
+            sys.exit(0)
+        print(generate_show(directory_path, "Synthetic", shots=arguments.shots))
+        print(json.dumps(benchmark_archive(directory_path, "Synthetic", arguments.workers, arguments.compression), indent=4))
+        print(json.dumps(benchmark_async_reads(directory_path, "Synthetic"), indent=4))
+        if arguments.query_shots:
+            print(json.dumps(benchmark_query(directory_path, shots=arguments.query_shots), indent=4))
+        if arguments.memory_shots:
+            print(json.dumps(benchmark_memory(directory_path, shots=arguments.memory_shots), indent=4))
+        if arguments.codec_documents:
+            print(json.dumps(benchmark_codecs(directory_path, arguments.codec_documents), indent=4))
+        if arguments.studio_shows:
+            print(json.dumps(benchmark_studio(directory_path, arguments.studio_shows), indent=4))
+        if arguments.export_shots:
+            print(json.dumps(benchmark_export(directory_path, shots=arguments.export_shots), indent=4))
+        if arguments.search_shots:
+            print(json.dumps(benchmark_search(directory_path, shots=arguments.search_shots), indent=4))
+        if arguments.daemon_tasks:
+            print(json.dumps(benchmark_daemon(os.path.join(directory_path, "Studio"), tasks=arguments.daemon_tasks), indent=4))
+        if arguments.stress_processes:
+            print(json.dumps(stress_concurrent_updates(directory_path, "Synthetic", arguments.stress_processes), indent=4))
+    finally:
+        shutil.rmtree(directory_path)
@@ -0,0 +1,396 @@
+import os
+import sys
+import json
+import socket
+import select
+import struct
+import logging
+import builtins
+import threading
+import functools
+import collections
+from typing import Dict
+
+# ==================================================================================== BEGIN PROTOCOL ====================================================================================
+
+DAEMON_SOCKET_NAME = ".showshot.sock"
+DAEMON_SOCKET_VARIABLE = "SHOWSHOT_SOCKET"
+MAX_MESSAGE_SIZE = 256 * 1024 * 1024
+
+# Methods whose results only make sense in the calling process: they always run directly.
+DIRECT_METHODS = ("archive_backend", "scan")
+
+_HEADER = struct.Struct("!I")
+_CREDENTIALS = struct.Struct("3i")  # struct ucred: pid, uid, gid
+_MARKERS = ("__tuple__", "__namedtuple__", "__dict__")
+
+
+def encode_value(value):
+    """
+    Convert a value to plain JSON types, keeping tuples, namedtuples and dictionaries with
+    non-string keys recognizable, so query conditions such as ('>=', 12) and Page results survive.
+
+    Args:
+        value: None, a bool, number or string, or a list, tuple or dictionary of such values.
+
+    Returns:
+        The value made of JSON types only.
+
+    Raises:
+        TypeError: If the value holds anything else.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        if hasattr(value, "_fields"):
+            return {"__namedtuple__": [type(value).__name__, list(value._fields), [encode_value(item) for item in value]]}
+        return {"__tuple__": [encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and key not in _MARKERS for key in value):
+            return {key: encode_value(item) for key, item in value.items()}
+        return {"__dict__": [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    raise TypeError(f"A {type(value).__name__} can't be sent over the daemon socket.")
+
+
+@functools.lru_cache(maxsize=64)
+def _namedtuple_class(name: str, fields: tuple):
+    return collections.namedtuple(name, fields)
+
+
+def decode_value(value):
+    """
+    Rebuild a value converted by encode_value. Namedtuples come back as namedtuples of the same
+    name and fields; no other class is ever created.
+
+    Args:
+        value: A value made of JSON types.
+
+    Returns:
+        The original value.
+
+    Raises:
+        ValueError: If a namedtuple has an invalid name or fields.
+    """
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            (key, item), = value.items()
+            if key == "__tuple__":
+                return tuple(decode_value(element) for element in item)
+            if key == "__namedtuple__":
+                name, fields, items = item
+                return _namedtuple_class(name, tuple(fields))(*[decode_value(element) for element in items])
+            if key == "__dict__":
+                return {_hashable(decode_value(pair[0])): decode_value(pair[1]) for pair in item}
+        return {key: decode_value(item) for key, item in value.items()}
+    return value
+
+
+def _hashable(key):
+    return tuple(key) if isinstance(key, list) else key
+
+
+def send_message(connection: socket.socket, message: Dict) -> None:
+    """
+    Send one message: the length of its JSON encoding, then the JSON encoding.
+
+    Args:
+        connection (socket.socket): A connected Unix domain socket.
+        message (Dict): The message, made of JSON types (see encode_value).
+    """
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    if len(payload) > MAX_MESSAGE_SIZE:
+        raise ValueError(f"The message is larger than {MAX_MESSAGE_SIZE} bytes.")
+    connection.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = connection.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def receive_message(connection: socket.socket) -> Dict:
+    """
+    Receive one message sent by send_message.
+
+    Args:
+        connection (socket.socket): A connected Unix domain socket.
+
+    Returns:
+        Dict: The message, or None if the other side closed the connection.
+
+    Raises:
+        ValueError: If the message is too large or is not a JSON object.
+    """
+    header = _receive_exactly(connection, _HEADER.size)
+    if header is None:
+        return None
+    size = _HEADER.unpack(header)[0]
+    if size > MAX_MESSAGE_SIZE:
+        raise ValueError(f"The message is larger than {MAX_MESSAGE_SIZE} bytes.")
+    payload = _receive_exactly(connection, size)
+    if payload is None:
+        return None
+    message = json.loads(payload)
+    if not isinstance(message, dict):
+        raise ValueError("A daemon message must be a JSON object.")
+    return message
+
+
+def peer_uid(connection: socket.socket) -> int:
+    """
+    Get the user id of the process at the other end of a Unix domain socket.
+
+    Args:
+        connection (socket.socket): A connected Unix domain socket.
+
+    Returns:
+        int: The peer's user id, or None on platforms without SO_PEERCRED.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _CREDENTIALS.size)
+    return _CREDENTIALS.unpack(credentials)[1]
+
+
+def find_daemon_socket(studio_path: str) -> str:
+    """
+    Find the socket of the daemon serving a studio: the SHOWSHOT_SOCKET environment variable,
+    or the '.showshot.sock' file at the root of the studio. Parent directories are never searched.
+
+    Args:
+        studio_path (str): The directory holding the shows.
+
+    Returns:
+        str: The socket path, or None if no daemon socket was found.
+    """
+    if os.environ.get(DAEMON_SOCKET_VARIABLE):
+        return os.environ[DAEMON_SOCKET_VARIABLE]
+    socket_path = os.path.join(os.path.abspath(studio_path), DAEMON_SOCKET_NAME)
+    return socket_path if os.path.exists(socket_path) else None
+
+
+def exception_from_error(error: list) -> Exception:
+    """
+    Rebuild an exception the daemon sent as [type name, message]: built-in exception types
+    are raised as themselves, anything else as a RuntimeError naming the original type.
+
+    Args:
+        error (list): The exception's type name and message.
+
+    Returns:
+        Exception: The exception to raise.
+    """
+    name, message = error
+    exception_class = getattr(builtins, str(name), None)
+    if isinstance(exception_class, type) and issubclass(exception_class, Exception):
+        return exception_class(message)
+    return RuntimeError(f"{name}: {message}")
+
+# ==================================================================================== END PROTOCOL ====================================================================================
+
+
+
+# ==================================================================================== BEGIN CLIENTS ====================================================================================
+
+def _emit(message: str, level: int) -> None:
+    # Show a message the daemon's managers emitted as the library would: through its output settings
+    # when the caller has imported it, printed otherwise (the library's default).
+    library = sys.modules.get("ShowShotManager")
+    if library is not None:
+        library._emit(message, level)
+    else:
+        print(message)
+
+
+class _ManagerClient:
+    _manager = None
+
+    def __init__(self, arguments: tuple, options: Dict, studio_path: str, socket_path: str = None):
+        self._arguments = arguments
+        self._options = options
+        self._studio_path = studio_path
+        self._socket_path = socket_path
+        self._connection = None
+        self._direct_manager = None
+        self._refused = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name.startswith("iter_") or name in DIRECT_METHODS:
+            # Lazy iterators and local objects can't cross the socket.
+            return getattr(self._direct(), name)
+        return functools.partial(self._call, name)
+
+    def daemon_running(self) -> bool:
+        """
+        Check whether calls are served by a daemon.
+
+        Returns:
+            bool: True if a daemon accepted the connection, False if calls fall back to direct file access.
+        """
+        with self._lock:
+            return self._connect() is not None
+
+    def close(self) -> None:
+        """
+        Close the connection to the daemon.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _refuse(self, socket_path: str, reason: str) -> None:
+        # Warns once per socket that is not used, then falls back to direct access.
+        if socket_path not in self._refused:
+            self._refused.add(socket_path)
+            _emit(f"Not using the daemon socket '{socket_path}': {reason}", logging.WARNING)
+
+    def _connect(self) -> socket.socket:
+        # Connects on first use and again after the daemon went away; None when no daemon is running.
+        if self._connection is not None:
+            # A connection the daemon has something to say on between calls was closed by it.
+            if not select.select([self._connection], [], [], 0)[0]:
+                return self._connection
+            self._connection.close()
+            self._connection = None
+        socket_path = self._socket_path or find_daemon_socket(self._studio_path)
+        if socket_path is None or not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+            return None
+        try:
+            owner = os.stat(socket_path).st_uid
+        except OSError:
+            return None
+        if owner != os.getuid():
+            self._refuse(socket_path, f"it belongs to user {owner}.")
+            return None
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(socket_path)
+            uid = peer_uid(connection)
+        except OSError:  # no socket file, or a stale one left by a daemon that was killed
+            connection.close()
+            return None
+        if uid is not None and uid != os.getuid():
+            connection.close()
+            self._refuse(socket_path, f"the process listening on it runs as user {uid}.")
+            return None
+        self._connection = connection
+        return connection
+
+    def _direct(self):
+        if self._direct_manager is None:
+            import ShowShotManager
+            manager_class = {"show": ShowShotManager.ShowManager, "shot": ShowShotManager.ShotManager,
+                             "asset": ShowShotManager.AssetManager}[self._manager]
+            self._direct_manager = manager_class(*self._arguments, **self._options)
+        return self._direct_manager
+
+    def _call(self, method: str, *args, **kwargs):
+        request = {"manager": self._manager, "arguments": list(self._arguments), "options": self._options,
+                   "method": method, "args": encode_value(list(args)), "kwargs": encode_value(kwargs)}
+        with self._lock:
+            for attempt in range(2):
+                connection = self._connect()
+                if connection is None:
+                    break
+                try:
+                    send_message(connection, request)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The daemon restarted since the last call and never saw this request: try a new connection.
+                    self._connection = None
+                    connection.close()
+                    continue
+                try:
+                    response = receive_message(connection)
+                except ValueError:
+                    response = None
+                if response is None:
+                    self._connection = None
+                    connection.close()
+                    raise ConnectionError(f"The daemon closed the connection during '{method}'.")
+                for message, level in response.get("messages", []):
+                    _emit(message, level)
+                if response.get("status") != "ok":
+                    raise exception_from_error(response.get("error") or ["RuntimeError", "The daemon sent no result."])
+                return decode_value(response.get("result"))
+        return getattr(self._direct(), method)(*args, **kwargs)
+
+
+class ShowManagerClient(_ManagerClient):
+    _manager = "show"
+
+    def __init__(self, directory_path: str, directory_name: str, socket_path: str = None):
+        """
+        A ShowManager whose methods are served by a ShowShotDaemon, or run directly when no daemon is running.
+
+        The methods and their arguments are the same as ShowManager's. Paths passed to
+        methods are resolved by the daemon, so give them as absolute paths. A daemon socket
+        is only used if it belongs to the current user and the process behind it runs as
+        that user too.
+
+        Args:
+            directory_path (str): The base directory path, the studio the daemon serves.
+            directory_name (str): The name of the show directory.
+            socket_path (str, optional): The daemon's socket. Defaults to the SHOWSHOT_SOCKET environment
+                variable, or the '.showshot.sock' file in directory_path.
+        """
+        directory_path = os.path.abspath(directory_path)
+        super().__init__((directory_path, directory_name), {}, directory_path, socket_path)
+
+
+class ShotManagerClient(_ManagerClient):
+    _manager = "shot"
+
+    def __init__(self, directory_path: str, socket_path: str = None):
+        """
+        A ShotManager whose methods are served by a ShowShotDaemon, or run directly when no daemon is running.
+
+        Args:
+            directory_path (str): The path of the shot directory, e.g. '<base>/Animal_Kingdom/Dogs'.
+            socket_path (str, optional): The daemon's socket. Defaults to the SHOWSHOT_SOCKET environment
+                variable, or the '.showshot.sock' file in the studio, '<base>'.
+        """
+        directory_path = os.path.abspath(directory_path)
+        super().__init__((directory_path,), {}, os.path.dirname(os.path.dirname(directory_path)), socket_path)
+
+
+class AssetManagerClient(_ManagerClient):
+    _manager = "asset"
+
+    def __init__(self, directory_path: str, socket_path: str = None, concurrency: str = None,
+                 lock_timeout: float = 10.0, retries: int = 10):
+        """
+        An AssetManager whose methods are served by a ShowShotDaemon, or run directly when no daemon is running.
+
+        Args:
+            directory_path (str): The base directory path, e.g. '<base>/Animal_Kingdom'.
+            socket_path (str, optional): The daemon's socket. Defaults to the SHOWSHOT_SOCKET environment
+                variable, or the '.showshot.sock' file in the studio, '<base>'.
+            concurrency (str, optional): How read-modify-write updates are protected, as for AssetManager.
+            lock_timeout (float): Seconds to wait for a lock, as for AssetManager.
+            retries (int): Attempts of an optimistic update, as for AssetManager.
+        """
+        directory_path = os.path.abspath(directory_path)
+        super().__init__((directory_path,), {"concurrency": concurrency, "lock_timeout": lock_timeout, "retries": retries},
+                         os.path.dirname(directory_path), socket_path)
+
+# ==================================================================================== END CLIENTS ====================================================================================
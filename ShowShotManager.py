@@ -1,22 +1,405 @@
 import os
+import sys
 import json
+import logging
+import cProfile
+import pstats
+import tracemalloc
 import shutil
+import stat as stat_module
+import sqlite3
+import threading
 import zipfile
+import contextlib
+import io
+import traceback
+import posixpath
+import time
+import zlib
+import fnmatch
+import re
+import heapq
+import bisect
+import itertools
+import csv
+import random
+import select
+import struct
+import asyncio
+import functools
+import hashlib
+import unicodedata
+import array
+import argparse
+import signal
+import collections
+import concurrent.futures
+import ctypes
+import ctypes.util
+import socket
+import socketserver
 from typing import List, Dict
+from ShowShotClient import DAEMON_SOCKET_NAME, send_message, receive_message, encode_value, decode_value, peer_uid
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# ==================================================================================== BEGIN INSTRUMENTATION ====================================================================================
+
+logger = logging.getLogger("ShowShotManager")
+logger.addHandler(logging.NullHandler())
+
+OUTPUT_MODES = ("print", "log", "both")
+_output_mode = "print"
+_operations = threading.local()
+_captured_messages = threading.local()
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+def _current_operation() -> str:
+    stack = getattr(_operations, "stack", None)
+    return stack[-1] if stack else None
+
+
+def _emit(message: str, level: int = logging.INFO) -> None:
+    # Every manager message goes through here: printed, logged, or both (see configure_output).
+    # A daemon thread serving a client collects the messages to send back instead of printing them.
+    messages = getattr(_captured_messages, "messages", None)
+    if messages is not None:
+        messages.append((message, level))
+    elif _output_mode != "log":
+        print(message)
+    if _output_mode != "print":
+        logger.log(level, message, extra={"operation": _current_operation()})
+
+
+def _with_captured_messages(function):
+    # Wraps a function handed to a worker thread so its messages go where the calling thread's go (see _emit).
+    messages = getattr(_captured_messages, "messages", None)
+    if messages is None:
+        return function
+
+    @functools.wraps(function)
+    def run(*args, **kwargs):
+        previous, _captured_messages.messages = getattr(_captured_messages, "messages", None), messages
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _captured_messages.messages = previous
+    return run
+
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as one JSON object per line, with the manager operation that logged it.
+        """
+        entry = {"time": round(record.created, 6), "level": record.levelname, "logger": record.name,
+                 "message": record.getMessage(), "operation": getattr(record, "operation", None)}
+        if hasattr(record, "seconds"):
+            entry["seconds"] = record.seconds
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def configure_output(mode: str = "print", json_stream=None, level: int = logging.INFO) -> None:
+    """
+    Choose where the managers' messages go.
+
+    Args:
+        mode (str): 'print' to print them (the default), 'log' to send them to the 'ShowShotManager'
+            logger instead, or 'both'.
+        json_stream (optional): Also attach a handler writing JSON lines (see JsonLogFormatter) to this stream,
+            e.g. sys.stderr. At DEBUG level every manager call is logged with its duration.
+        level (int): The level of the logger, when json_stream is given.
+    """
+    global _output_mode
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode '{mode}'. Use one of {OUTPUT_MODES}.")
+    _output_mode = mode
+    if json_stream is not None:
+        handler = logging.StreamHandler(json_stream)
+        handler.setFormatter(JsonLogFormatter())
+        logger.addHandler(handler)
+        logger.setLevel(level)
+
+
+class Metrics:
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        """
+        Collect latency histograms of the manager operations and I/O counters, safely across threads.
+
+        Args:
+            buckets (tuple): The upper bounds of the histogram buckets, in seconds, ending with infinity.
+        """
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.counters = collections.Counter()
+        self.histograms = {}  # operation -> [count per bucket..., total seconds, errors]
+
+    def count(self, **values) -> None:
+        """
+        Add to counters, e.g. count(files_opened=1, bytes_read=512).
+        """
+        with self.lock:
+            self.counters.update(values)
+
+    def observe(self, operation: str, seconds: float, failed: bool = False) -> None:
+        """
+        Record the duration of one call of an operation.
+
+        Args:
+            operation (str): The operation name, e.g. 'ShotManager.edit_json_file'.
+            seconds (float): How long the call took.
+            failed (bool): Whether the call raised an exception.
+        """
+        with self.lock:
+            histogram = self.histograms.get(operation)
+            if histogram is None:
+                histogram = self.histograms[operation] = [0] * (len(self.buckets) + 2)
+            histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+            histogram[-2] += seconds
+            histogram[-1] += failed
+
+    def reset(self) -> None:
+        """
+        Clear every counter and histogram.
+        """
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Get the metrics as a dictionary, ready for json.dumps.
+
+        Returns:
+            Dict: 'counters', and for each operation in 'operations' its 'count', 'errors', 'seconds'
+            (total), and 'p50' / 'p99' (the upper bound of the bucket holding that percentile).
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {operation: list(histogram) for operation, histogram in self.histograms.items()}
+        operations = {}
+        for operation, histogram in sorted(histograms.items()):
+            counts = histogram[:len(self.buckets)]
+            total = sum(counts)
+            operations[operation] = {
+                "count": total, "errors": histogram[-1], "seconds": round(histogram[-2], 6),
+                "p50": self._percentile(counts, total, 0.50), "p99": self._percentile(counts, total, 0.99),
+            }
+        return {"counters": counters, "operations": operations}
+
+    def _percentile(self, counts: list, total: int, fraction: float) -> float:
+        seen = 0
+        for bound, count in zip(self.buckets, counts):
+            seen += count
+            if seen >= fraction * total:
+                return bound if bound != float("inf") else None
+        return None
+
+    def to_prometheus(self, prefix: str = "showshot") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix of every metric name.
+
+        Returns:
+            str: Counters as '<prefix>_<name>_total' and the latencies as the '<prefix>_operation_seconds' histogram.
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {operation: list(histogram) for operation, histogram in self.histograms.items()}
+        lines = []
+        for name, value in sorted(counters.items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        lines.append(f"# HELP {prefix}_operation_seconds Time spent in manager operations.")
+        lines.append(f"# TYPE {prefix}_operation_seconds histogram")
+        for operation, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_operation_seconds_bucket{{operation="{operation}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_operation_seconds_sum{{operation="{operation}"}} {histogram[-2]}')
+            lines.append(f'{prefix}_operation_seconds_count{{operation="{operation}"}} {cumulative}')
+        lines.append(f"# TYPE {prefix}_operation_errors_total counter")
+        for operation, histogram in sorted(histograms.items()):
+            lines.append(f'{prefix}_operation_errors_total{{operation="{operation}"}} {histogram[-1]}')
+        return "\n".join(lines) + "\n"
+
+
+# The metrics every manager, backend and codec in this module reports to.
+METRICS = Metrics()
+
+
+_instrumented = {}  # (class, attribute name) -> the original function, while metrics are enabled
+_instrumented_lock = threading.Lock()
+
+
+def _timed_method(method, operation: str):
+    # Time each call into METRICS, and log it at DEBUG level.
+    @functools.wraps(method)
+    def instrumented(*args, **kwargs):
+        stack = _operations.__dict__.setdefault("stack", [])
+        stack.append(operation)
+        failed = True
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            METRICS.observe(operation, seconds, failed)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{operation} {'failed' if failed else 'finished'}",
+                             extra={"operation": operation, "seconds": round(seconds, 6)})
+    return instrumented
+
+
+def _timed_codec_method(method, documents_counter: str, seconds_counter: str):
+    # Count the documents a codec parses (or serializes), and the time it takes.
+    @functools.wraps(method)
+    def instrumented(self, value):
+        start = time.perf_counter()
+        result = method(self, value)
+        METRICS.count(**{documents_counter: 1, seconds_counter: time.perf_counter() - start})
+        return result
+    return instrumented
+
+
+def _public_methods(manager_class) -> List[str]:
+    # Generators are left out: timing them would only measure their creation.
+    return [name for name, value in vars(manager_class).items()
+            if callable(value) and not name.startswith("_") and not name.startswith("iter_")]
+
+
+def enable_metrics() -> None:
+    """
+    Time every call of the managers' public methods into METRICS, and time the codecs.
+
+    Each call is recorded in the latency histogram of its operation (e.g. 'ShotManager.edit_json_file'),
+    tags the messages it logs with that operation, and is logged at DEBUG level with its duration.
+    The codecs count the documents they parse and serialize. The backends' I/O counters are
+    always kept. Calling it again does nothing; disable_metrics removes the instrumentation.
+    """
+    with _instrumented_lock:
+        if _instrumented:
+            return
+        for manager_class in (ShowManager, ShotManager, AssetManager):
+            for method_name in _public_methods(manager_class):
+                method = vars(manager_class)[method_name]
+                _instrumented[(manager_class, method_name)] = method
+                setattr(manager_class, method_name, _timed_method(method, f"{manager_class.__name__}.{method_name}"))
+        for codec_class in (JsonCodec, FastJsonCodec, BinaryCodec):
+            for method_name, counters in (("encode", ("documents_serialized", "serialize_seconds")),
+                                          ("decode", ("documents_parsed", "parse_seconds"))):
+                method = vars(codec_class)[method_name]
+                _instrumented[(codec_class, method_name)] = method
+                setattr(codec_class, method_name, _timed_codec_method(method, *counters))
+
+
+def disable_metrics() -> None:
+    """
+    Remove the instrumentation added by enable_metrics. The metrics collected so far are kept.
+    """
+    with _instrumented_lock:
+        for (owner, method_name), method in _instrumented.items():
+            setattr(owner, method_name, method)
+        _instrumented.clear()
+
+
+CAPTURE_MODES = ("cprofile", "tracemalloc")
+_capture = None
+
+
+def start_capture(mode: str = "cprofile") -> None:
+    """
+    Start profiling, until stop_capture is called.
+
+    Args:
+        mode (str): 'cprofile' to profile the calling thread's function calls, or 'tracemalloc'
+            to trace memory allocations in every thread.
+    """
+    global _capture
+    if mode not in CAPTURE_MODES:
+        raise ValueError(f"Unknown capture mode '{mode}'. Use one of {CAPTURE_MODES}.")
+    if _capture is not None:
+        raise RuntimeError(f"A '{_capture[0]}' capture is already running.")
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        _capture = (mode, profiler)
+    else:
+        tracemalloc.start()
+        _capture = (mode, None)
+
+
+def stop_capture(limit: int = 25) -> str:
+    """
+    Stop the running capture and get its report.
+
+    Args:
+        limit (int): The number of functions (or allocation sites) in the report.
+
+    Returns:
+        str: The functions taking the most cumulative time, or the lines holding the most memory.
+    """
+    global _capture
+    if _capture is None:
+        raise RuntimeError("No capture is running.")
+    mode, profiler = _capture
+    _capture = None
+    if mode == "cprofile":
+        profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+        return output.getvalue()
+    snapshot = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    lines = [f"Peak traced memory: {peak / 1024:.1f} KiB"]
+    lines.extend(str(statistic) for statistic in snapshot.statistics("lineno")[:limit])
+    return "\n".join(lines)
+
+# ==================================================================================== END INSTRUMENTATION ====================================================================================
+
 
 # ==================================================================================== BEGIN SHOWS ====================================================================================
 
 class ShowManager:
-    def __init__(self, directory_path: str, directory_name: str):
+    def __init__(self, directory_path: str, directory_name: str, backend=None):
         """
         Initialize the ShowManager with the directory path and name.
 
         Args:
             directory_path (str): The base directory path.
             directory_name (str): The name of the show directory.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored. Defaults to the JSON directory tree.
         """
         self.directory_path = directory_path
         self.directory_name = directory_name
+        self.backend = backend if backend is not None else JsonTreeBackend()
 
     def create_directory(self, directory_path: str, directory_name: str) -> None:
         """
@@ -27,11 +410,11 @@ class ShowManager:
             directory_name (str): The name of the new directory.
         """
         directory = os.path.join(directory_path, directory_name)
-        if os.path.exists(directory):
-            print(f"Directory '{directory}' already exists.")
+        if self.backend.exists(directory):
+            _emit(f"Directory '{directory}' already exists.", logging.WARNING)
         else:
-            os.makedirs(directory)
-            print(f"Directory '{directory}' created successfully!")
+            self.backend.make_dirs(directory)
+            _emit(f"Directory '{directory}' created successfully!")
 
     def create_subdirectories(self, subdirectories: List[str]) -> None:
         """
@@ -54,11 +437,36 @@ class ShowManager:
         Returns:
             List[str]: A list of subdirectory names.
         """
-        subdirectories = []
-        for entry in os.scandir(os.path.join(self.directory_path, self.directory_name)):
-            if entry.is_dir():
-                subdirectories.append(entry.name)
-        return subdirectories
+        return self.backend.list_dirs(os.path.join(self.directory_path, self.directory_name))
+
+    def iter_subdirectories(self, pattern: str = None):
+        """
+        Yield the subdirectory names of the main show directory one at a time, as they are listed.
+
+        Args:
+            pattern (str, optional): Only yield names matching this glob pattern, e.g. 'Dog*'.
+
+        Yields:
+            str: The subdirectory names.
+        """
+        return iter_entries(self.backend, os.path.join(self.directory_path, self.directory_name), True, pattern)
+
+    def page_subdirectories(self, limit: int = 100, cursor: str = None, pattern: str = None,
+                            descending: bool = False) -> "Page":
+        """
+        Get one page of the subdirectory names of the main show directory, in name order.
+
+        Args:
+            limit (int): The maximum number of names in the page.
+            cursor (str, optional): The cursor of the previous page. Defaults to the first page.
+            pattern (str, optional): Only list names matching this glob pattern.
+            descending (bool): List the names in reverse order.
+
+        Returns:
+            Page: The names and the cursor of the next page (None on the last page).
+        """
+        return page_entries(self.backend, os.path.join(self.directory_path, self.directory_name), True,
+                            limit, cursor, pattern, descending)
 
     def create_json_file(self, subdir_name: str, filename: str, data: Dict) -> None:
         """
@@ -71,9 +479,9 @@ class ShowManager:
         """
         subdir_path = os.path.join(self.directory_path, self.directory_name, subdir_name)
         file_path = os.path.join(subdir_path, filename)
-        with open(file_path, 'w', encoding='utf-8') as file:  # Specify 'utf-8' encoding
-            json.dump(data, file, indent=4)
-        print(f"JSON file '{filename}' created successfully!")
+        self.backend.write(file_path, data)
+        _search_documents_changed({file_path: data})
+        _emit(f"JSON file '{filename}' created successfully!")
 
     def get_description_file(self, subdir_name: str) -> Dict:
         """
@@ -88,12 +496,10 @@ class ShowManager:
         subdir_path = os.path.join(self.directory_path, self.directory_name, subdir_name)
         description_file = os.path.join(subdir_path, "description.json")
 
-        if os.path.exists(description_file):
-            with open(description_file, 'r') as file:
-                description = json.load(file)
-            return description
+        if self.backend.is_file(description_file):
+            return self.backend.read(description_file)
         else:
-            print(f"Description file does not exist in '{subdir_name}' subdirectory.")
+            _emit(f"Description file does not exist in '{subdir_name}' subdirectory.", logging.WARNING)
             return None
 
     def update_description_file(self, subdir_name: str, description: Dict) -> None:
@@ -107,12 +513,12 @@ class ShowManager:
         subdir_path = os.path.join(self.directory_path, self.directory_name, subdir_name)
         description_file = os.path.join(subdir_path, "description.json")
 
-        if os.path.exists(description_file):
-            with open(description_file, 'w') as file:
-                json.dump(description, file, indent=4)
-            print(f"Description file in '{subdir_name}' subdirectory updated successfully!")
+        if self.backend.is_file(description_file):
+            self.backend.write(description_file, description)
+            _search_documents_changed({description_file: description})
+            _emit(f"Description file in '{subdir_name}' subdirectory updated successfully!")
         else:
-            print(f"Description file does not exist in '{subdir_name}' subdirectory.")
+            _emit(f"Description file does not exist in '{subdir_name}' subdirectory.", logging.WARNING)
 
     def delete_subdirectory(self, subdirectory_name: str) -> None:
         """
@@ -123,54 +529,365 @@ class ShowManager:
         """
         subdirectory_path = os.path.join(self.directory_path, self.directory_name, subdirectory_name)
 
-        if os.path.exists(subdirectory_path):
-            shutil.rmtree(subdirectory_path)
-            print(f"Subdirectory '{subdirectory_name}' and its contents have been deleted successfully!")
+        if self.backend.exists(subdirectory_path):
+            close_show_index(subdirectory_path, self.backend)
+            self.backend.remove_tree(subdirectory_path)
+            _search_path_removed(subdirectory_path)
+            _emit(f"Subdirectory '{subdirectory_name}' and its contents have been deleted successfully!")
         else:
-            print(f"Subdirectory '{subdirectory_name}' does not exist.")
+            _emit(f"Subdirectory '{subdirectory_name}' does not exist.", logging.WARNING)
 
-    def zip_show(self, zip_file_name: str) -> None:
+    def zip_show(self, zip_file_name: str, compression: str = "deflate", level: int = None,
+                 workers: int = None, progress=None, dedupe_links: bool = False) -> Dict:
         """
-        Zip the entire show directory.
+        Zip the entire show directory, compressing files in parallel.
 
         Args:
             zip_file_name (str): The name of the zip file to be created.
+            compression (str): 'stored', 'deflate', 'bzip2' or 'lzma'. Already-compressed media is always stored.
+            level (int, optional): The compression level.
+            workers (int, optional): The number of compression threads. Defaults to the number of CPUs.
+            progress (callable, optional): Called as progress(files_done, files_total, bytes_done, bytes_total).
+            dedupe_links (bool): Store hard-linked files (see deduplicate) once, as ArchiveWriter does with
+                dedupe_links. Such archives must be read with this library (read_json_from_zip, archive_backend,
+                ArchiveReader); other ZIP tools leave the linked copies out.
+
+        Returns:
+            Dict: Statistics of the run (see ArchiveWriter.write).
         """
         main_directory_path = os.path.join(self.directory_path, self.directory_name)
         zip_file_path = os.path.join(self.directory_path, zip_file_name)
 
-        with zipfile.ZipFile(zip_file_path, 'w') as zip_file:
-            for root, _, files in os.walk(main_directory_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, main_directory_path)
-                    zip_file.write(file_path, arcname)
+        members = collect_archive_members(self.backend, main_directory_path)
+        writer = ArchiveWriter(compression, level, workers, progress, dedupe_links=dedupe_links)
+        stats = writer.write(zip_file_path, members)
+
+        _emit(f"Show '{self.directory_name}' has been zipped to '{zip_file_name}'.")
+        return stats
+
+    def zip_show_incremental(self, zip_file_name: str = None, compression: str = "deflate", level: int = None,
+                             workers: int = None, progress=None) -> Dict:
+        """
+        Archive only what changed in the show since its last incremental archive.
+
+        The first run writes a full archive. Later runs write a delta archive holding the
+        added and changed files, plus a manifest (path, size, mtime and hash of every file,
+        and the deleted paths) that points at the previous archive. The archives made so
+        far are listed in '<show>.archives.json' next to the show directory.
+
+        Args:
+            zip_file_name (str, optional): The name of the archive to create. Defaults to '<show>_<timestamp>.zip'.
+            compression (str): 'stored', 'deflate', 'bzip2' or 'lzma'.
+            level (int, optional): The compression level.
+            workers (int, optional): The number of compression threads.
+            progress (callable, optional): Called as progress(files_done, files_total, bytes_done, bytes_total).
+
+        Returns:
+            Dict: Statistics of the run, with the archive name and the number of changed, deleted and unchanged files.
+        """
+        main_directory_path = os.path.join(self.directory_path, self.directory_name)
+        chain_file_path = os.path.join(self.directory_path, f"{self.directory_name}.archives.json")
+        chain = []
+        if os.path.exists(chain_file_path):
+            with open(chain_file_path, 'r', encoding='utf-8') as file:
+                chain = json.load(file)
+
+        previous_files = {}
+        parent = None
+        if chain:
+            parent = chain[-1]["archive"]
+            previous_files = read_archive_manifest(os.path.join(self.directory_path, parent))["files"]
+
+        if zip_file_name is None:
+            zip_file_name = f"{self.directory_name}_{time.strftime('%Y%m%d_%H%M%S')}.zip"
+            suffix = 1
+            while os.path.exists(os.path.join(self.directory_path, zip_file_name)):
+                zip_file_name = f"{self.directory_name}_{time.strftime('%Y%m%d_%H%M%S')}_{suffix}.zip"
+                suffix += 1
+
+        members = collect_archive_members(self.backend, main_directory_path)
+        files, changed = build_archive_manifest(members, previous_files)
+        deleted = sorted(set(previous_files) - set(files))
+        manifest = {
+            "parent": parent,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": files,
+            "changed": [arcname for arcname, _ in changed],
+            "deleted": deleted,
+        }
+        changed.append((ARCHIVE_MANIFEST_NAME, json.dumps(manifest, indent=4).encode('utf-8')))
+
+        writer = ArchiveWriter(compression, level, workers, progress)
+        stats = writer.write(os.path.join(self.directory_path, zip_file_name), changed)
+
+        chain.append({"archive": zip_file_name, "parent": parent, "created": manifest["created"]})
+        atomic_write(chain_file_path, json.dumps(chain, indent=4).encode('utf-8'), fsync=True)
+
+        kind = "Delta" if parent else "Full"
+        _emit(f"{kind} archive of show '{self.directory_name}' written to '{zip_file_name}' "
+              f"({len(manifest['changed'])} changed, {len(deleted)} deleted).")
+        stats.update(archive=zip_file_name, changed=len(manifest["changed"]), deleted=len(deleted),
+                     unchanged=len(files) - len(manifest["changed"]))
+        return stats
+
+    def restore_show(self, destination_path: str, zip_file_name: str = None) -> bool:
+        """
+        Rebuild the show as it was when an incremental archive was made.
 
-        print(f"Show '{self.directory_name}' has been zipped to '{zip_file_name}'.")
+        Every file of the snapshot is extracted from the most recent archive in the chain
+        (base archive plus deltas) that holds it, so each file is extracted only once.
 
-    def read_data_from_zip(self, zip_file_name: str) -> None:
+        Args:
+            destination_path (str): An empty or missing directory to restore the show into.
+            zip_file_name (str, optional): The archive marking the point in time. Defaults to the latest one.
+
+        Returns:
+            bool: True if the show was restored, False otherwise.
+        """
+        chain_file_path = os.path.join(self.directory_path, f"{self.directory_name}.archives.json")
+        if not os.path.exists(chain_file_path):
+            _emit(f"No incremental archives found for show '{self.directory_name}'.", logging.WARNING)
+            return False
+        if os.path.exists(destination_path) and os.listdir(destination_path):
+            _emit(f"Directory '{destination_path}' is not empty.", logging.WARNING)
+            return False
+
+        with open(chain_file_path, 'r', encoding='utf-8') as file:
+            chain = {entry["archive"]: entry for entry in json.load(file)}
+        if not chain:
+            _emit(f"No incremental archives found for show '{self.directory_name}'.", logging.WARNING)
+            return False
+        if zip_file_name is None:
+            zip_file_name = list(chain)[-1]
+        if zip_file_name not in chain:
+            _emit(f"Archive '{zip_file_name}' is not part of the show's archive chain.", logging.WARNING)
+            return False
+
+        readers = []
+        archive_name = zip_file_name
+        while archive_name is not None:
+            readers.append(open_archive(os.path.join(self.directory_path, archive_name)))
+            archive_name = chain[archive_name]["parent"]
+
+        files = readers[0].read_json(ARCHIVE_MANIFEST_NAME)["files"]
+        for arcname in files:
+            reader = next(reader for reader in readers if arcname in reader.members)
+            file_path = os.path.join(destination_path, *arcname.split("/"))
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with reader.open_member(arcname) as source, open(file_path, 'wb') as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+
+        _emit(f"Show '{self.directory_name}' restored from '{zip_file_name}' to '{destination_path}' ({len(files)} files).")
+        return True
+
+    def read_data_from_zip(self, zip_file_name: str, pattern: str = None) -> None:
         """
         Read and display the contents of a ZIP file.
 
         Args:
             zip_file_name (str): The name of the ZIP file to be read.
+            pattern (str, optional): A glob pattern selecting the members to display, e.g. 'Prop/*.json'. Defaults to all of them.
         """
         zip_file_path = os.path.join(self.directory_path, zip_file_name)
 
         if not os.path.exists(zip_file_path):
-            print(f"ZIP file '{zip_file_name}' does not exist in the specified directory.")
+            _emit(f"ZIP file '{zip_file_name}' does not exist in the specified directory.", logging.WARNING)
             return
 
-        with zipfile.ZipFile(zip_file_path, 'r') as zip_file:
-            print(f"Contents of ZIP file '{zip_file_name}':")
+        print_archive_members(zip_file_path, zip_file_name, pattern)
 
-            for file_name in zip_file.namelist():
-                with zip_file.open(file_name) as file:
-                    try:
-                        data = file.read().decode('utf-8', errors='replace')
-                        print(f"\nFile: {file_name}\nData:\n{data}")
-                    except UnicodeDecodeError:
-                        print(f"\nFile: {file_name}\nData: Unable to decode data (binary file).")
+    def read_json_from_zip(self, zip_file_name: str, member_name: str) -> Dict:
+        """
+        Read one JSON file from a ZIP file without reading the rest of the archive.
+
+        Args:
+            zip_file_name (str): The name of the ZIP file.
+            member_name (str): The path of the JSON file inside the archive, e.g. 'doggo1_info.json'.
+
+        Returns:
+            Dict: The contents of the JSON file, or None if the archive or the file does not exist.
+        """
+        zip_file_path = os.path.join(self.directory_path, zip_file_name)
+
+        if not os.path.exists(zip_file_path):
+            _emit(f"ZIP file '{zip_file_name}' does not exist in the specified directory.", logging.WARNING)
+            return None
+
+        reader = open_archive(zip_file_path)
+        if member_name not in reader.members:
+            _emit(f"JSON file '{member_name}' does not exist in ZIP file '{zip_file_name}'.", logging.WARNING)
+            return None
+        return _copy_document(reader.read_json(member_name))
+
+    def archive_backend(self, zip_file_name: str) -> "ArchiveBackend":
+        """
+        Get a read-only backend serving an archive made by zip_show, for querying it without extracting.
+
+        Example:
+            backend = ShowManager(base, "Dogs").archive_backend("Dogs.zip")
+            ShotManager(os.path.join(base, "Dogs"), backend=backend).get_json_file_info("doggo1_info.json")
+
+        Args:
+            zip_file_name (str): The name of the ZIP file, next to the show directory.
+
+        Returns:
+            ArchiveBackend: A backend standing in for the show directory.
+        """
+        zip_file_path = os.path.join(self.directory_path, zip_file_name)
+        return ArchiveBackend(zip_file_path, os.path.join(self.directory_path, self.directory_name))
+
+    def query(self, where: Dict = None, fields: List[str] = None, kind: str = "shot", all_shows: bool = False) -> List[Dict]:
+        """
+        Find the shot (or asset) files of every subdirectory matching some conditions, using the show indexes.
+
+        Example:
+            show_manager.query({"breed": "Golden Retriever", "assets": ("glob", "Prop_*")}, fields=["name", "age"])
+
+        Args:
+            where (Dict, optional): The conditions by field name: a value to equal, a list of values the field
+                must contain, or an (operator, operand) tuple with one of QUERY_OPERATORS.
+            fields (List[str], optional): The fields to return. Defaults to the whole document.
+            kind (str, optional): 'shot', 'asset', or None for both.
+            all_shows (bool): Query every directory under directory_path, not only this one.
+
+        Returns:
+            List[Dict]: One result per matching file, with 'show', 'file', 'kind' and 'data' keys.
+        """
+        show_names = self.backend.list_dirs(self.directory_path) if all_shows else [self.directory_name]
+        show_paths = [
+            os.path.join(self.directory_path, show_name, subdirectory)
+            for show_name in show_names
+            for subdirectory in self.backend.list_dirs(os.path.join(self.directory_path, show_name))
+        ]
+        return query_shows(show_paths, where, fields, kind, self.backend)
+
+    def search(self, query: str, kind: str = None, limit: int = 20, prefix: bool = False) -> List[Dict]:
+        """
+        Find the description, shot and asset files of the show containing some words, best matches first.
+
+        Example:
+            show_manager.search("golden retr*"), show_manager.search("staff", kind="asset")
+
+        Args:
+            query (str): Words to look for. A word ending with '*' matches every word starting with it.
+            kind (str, optional): Only return 'description', 'shot' or 'asset' files.
+            limit (int): The maximum number of results.
+            prefix (bool): Treat every word as a prefix.
+
+        Returns:
+            List[Dict]: One result per matching file, with 'path' (e.g. 'Dogs/Prop/Staff1.json'),
+            'kind', 'name', 'score' and 'snippet' keys, see SearchIndex.search.
+        """
+        index = get_search_index(os.path.join(self.directory_path, self.directory_name), self.backend)
+        return index.search(query, kind, limit, prefix)
+
+    def check_integrity(self, subdir_names: List[str] = None, repair: bool = False) -> Dict[str, Dict]:
+        """
+        Check that the shot and asset files of each subdirectory reference each other consistently, and optionally repair them.
+
+        Args:
+            subdir_names (List[str], optional): The subdirectories to check. Defaults to all of them.
+            repair (bool): Remove dangling references and add the missing side of one-sided ones.
+
+        Returns:
+            Dict[str, Dict]: The report of check_show_integrity for each subdirectory.
+        """
+        reports = {}
+        for subdir_name in (subdir_names if subdir_names is not None else self.get_subdirectories()):
+            subdir_path = os.path.join(self.directory_path, self.directory_name, subdir_name)
+            report = check_show_integrity(subdir_path, self.backend, repair)
+            reports[subdir_name] = report
+            _emit(f"'{subdir_name}': {report['shots']} shots, {report['assets']} assets, "
+                  f"{len(report['dangling'])} dangling and {len(report['one_sided'])} one-sided references"
+                  + (f", {report['repaired']} files repaired." if repair else "."))
+        return reports
+
+    def deduplicate(self, link: str = "hardlink", min_size: int = 1, workers: int = None) -> Dict:
+        """
+        Store the show's files once in the studio's blob store, replacing identical copies with links.
+
+        The blob store is shared by every show of the studio (the directory holding the show),
+        so copies across shows are stored once too.
+
+        Args:
+            link (str): 'hardlink' or 'reflink', see BlobStore.
+            min_size (int): Files smaller than this many bytes are left alone.
+            workers (int, optional): The number of hashing threads. Defaults to the number of CPUs.
+
+        Returns:
+            Dict: The report of BlobStore.deduplicate.
+        """
+        report = BlobStore(self.directory_path, link).deduplicate(
+            [os.path.join(self.directory_path, self.directory_name)], min_size, workers
+        )
+        _emit(f"Show '{self.directory_name}': {report['linked']} files linked to existing blobs, {report['stored']} blobs stored, "
+              f"{report['bytes_reclaimed']} bytes reclaimed.")
+        return report
+
+    def export(self, output_path: str, export_format: str = "jsonl", edges_path: str = None,
+               zip_file_name: str = None) -> Dict:
+        """
+        Export every shot and asset record of the show to a JSON Lines or CSV file, streaming one file at a time.
+
+        Args:
+            output_path (str): The file to write the records to.
+            export_format (str): 'jsonl' or 'csv'.
+            edges_path (str, optional): Also write one row per shot-asset reference to this file.
+            zip_file_name (str, optional): Export from this archive made by zip_show instead of the show directory.
+
+        Returns:
+            Dict: The number of 'records' and 'edges' written.
+        """
+        if zip_file_name is not None:
+            source_path = os.path.join(self.directory_path, zip_file_name)
+        else:
+            source_path = os.path.join(self.directory_path, self.directory_name)
+        counts = export_show(source_path, output_path, export_format, edges_path,
+                             self.backend if zip_file_name is None else None)
+        _emit(f"Exported {counts['records']} records and {counts['edges']} references of show '{self.directory_name}' to '{output_path}'.")
+        return counts
+
+    def import_records(self, source_path: str, import_format: str = None, checkpoint_path: str = None,
+                       workers: int = None) -> Dict:
+        """
+        Create the shots and assets listed in a JSON Lines or CSV breakdown, such as one written by export.
+
+        Args:
+            source_path (str): The breakdown file.
+            import_format (str, optional): 'jsonl' or 'csv'. Defaults to the file's extension.
+            checkpoint_path (str, optional): A checkpoint file, so an interrupted import resumes where it stopped.
+            workers (int, optional): The number of writer threads. Defaults to the number of CPUs.
+
+        Returns:
+            Dict: The import report, see import_show.
+        """
+        report = import_show(source_path, os.path.join(self.directory_path, self.directory_name), import_format,
+                             self.backend, workers, checkpoint_path)
+        _emit(f"Imported {report['created']} files into show '{self.directory_name}' "
+              f"({report['exists']} already existed, {report['invalid']} invalid and {report['failed']} failed rows).")
+        return report
+
+    def scan(self, snapshot_path: str = None, workers: int = None) -> "ShowSnapshot":
+        """
+        Take a snapshot of the show directory (its subdirectories, asset folders, shot, asset and description files) in one parallel walk.
+
+        Example:
+            snapshot = show_manager.scan("Animal_Kingdom.snapshot.json")
+            snapshot.shot_files("Dogs"), snapshot.asset_files("Dogs", "Prop")
+
+        Args:
+            snapshot_path (str, optional): A file holding the previous snapshot. Directories that
+                haven't changed since are not listed again, and the new snapshot is written back.
+            workers (int, optional): The number of threads listing directories.
+
+        Returns:
+            ShowSnapshot: The snapshot of the show directory.
+        """
+        previous = ShowSnapshot.load(snapshot_path) if snapshot_path else None
+        snapshot = scan_shows(os.path.join(self.directory_path, self.directory_name), previous, workers)
+        if snapshot_path:
+            snapshot.save(snapshot_path)
+        return snapshot
 
 # ==================================================================================== END SHOWS ====================================================================================
 
@@ -178,14 +895,16 @@ class ShowManager:
 # ==================================================================================== BEGIN SHOTS ====================================================================================
 
 class ShotManager:
-    def __init__(self, directory_path: str):
+    def __init__(self, directory_path: str, backend=None):
         """
         Initialize the ShotManager with the directory path.
 
         Args:
             directory_path (str): The base directory path.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored. Defaults to the JSON directory tree.
         """
         self.directory_path = directory_path
+        self.backend = backend if backend is not None else JsonTreeBackend()
 
     def create_character_info(self, file_name: str, character_name: str, info: Dict) -> None:
         """
@@ -196,11 +915,11 @@ class ShotManager:
             character_name (str): The name of the character.
             info (Dict): A dictionary containing character information.
         """
-        os.makedirs(self.directory_path, exist_ok=True)
+        self.backend.make_dirs(self.directory_path)
         character_file = os.path.join(self.directory_path, f"{file_name}.json")
 
-        if os.path.exists(character_file):
-            print(f"Character file '{character_file}' already exists.")
+        if self.backend.exists(character_file):
+            _emit(f"Character file '{character_file}' already exists.", logging.WARNING)
         else:
             character_info = {
                 "name": character_name,
@@ -209,10 +928,71 @@ class ShotManager:
                 "assets": info.get("assets", []),
             }
 
-            with open(character_file, 'w') as file:
-                json.dump(character_info, file, indent=4)
+            with self.backend.transaction():
+                self.backend.write(character_file, character_info)
+                get_show_index(self.directory_path, self.backend).set_shot_document(f"{file_name}.json", character_info)
+            _search_documents_changed({character_file: character_info})
+
+            _emit(f"Character file '{character_file}' created successfully!")
+
+    def create_many(self, records: list, workers: int = None) -> List[Dict]:
+        """
+        Create many character info JSON files in one call.
+
+        Every record is validated before anything is written, the shot directory is created
+        once, files are written by a thread pool, and the show index is updated in a single
+        transaction. Nothing is printed; the outcome of each record is returned instead.
+
+        Args:
+            records (list): Dictionaries with 'file_name', 'character_name' and 'info' keys,
+                or (file_name, character_name, info) tuples, as for create_character_info.
+            workers (int, optional): The number of writer threads. Defaults to the number of CPUs.
+
+        Returns:
+            List[Dict]: One result per record, in order, with 'index', 'file_name', 'status'
+            ('created', 'exists', 'invalid' or 'failed') and 'message' keys.
+        """
+        self.backend.make_dirs(self.directory_path)
+        existing = set(self.backend.list_files(self.directory_path))
+        results = []
+        documents = {}
+        for index, record in enumerate(records):
+            if isinstance(record, dict):
+                file_name, character_name, info = record.get("file_name"), record.get("character_name"), record.get("info", {})
+            else:
+                file_name, character_name, info = (tuple(record) + (None, None, None))[:3]
+            result = {"index": index, "file_name": file_name, "status": "created", "message": ""}
+            results.append(result)
+
+            problem = _validate_file_name(file_name) or _validate_document(info, "assets")
+            if problem:
+                result.update(status="invalid", message=problem)
+            elif f"{file_name}.json" in existing or f"{file_name}.json" in documents:
+                result.update(status="exists", message=f"Character file '{file_name}.json' already exists.")
+            else:
+                documents[f"{file_name}.json"] = (result, {
+                    "name": character_name,
+                    "age": info.get("age", ""),
+                    "breed": info.get("breed", ""),
+                    "assets": info.get("assets", []),
+                })
 
-            print(f"Character file '{character_file}' created successfully!")
+        errors = _write_documents(
+            self.backend, {os.path.join(self.directory_path, name): data for name, (_, data) in documents.items()}, workers
+        )
+        index = get_show_index(self.directory_path, self.backend)
+        with index.transaction():
+            for name, (result, data) in documents.items():
+                error = errors.get(os.path.join(self.directory_path, name))
+                if error is not None:
+                    result.update(status="failed", message=str(error))
+                else:
+                    index.set_shot_document(name, data)
+        _search_documents_changed({
+            os.path.join(self.directory_path, name): data
+            for name, (result, data) in documents.items() if result["status"] == "created"
+        })
+        return results
 
     def get_json_files(self) -> None:
         """
@@ -222,17 +1002,44 @@ class ShotManager:
             None
         """
         json_files = []
-        for file_name in os.listdir(self.directory_path):
-            file_path = os.path.join(self.directory_path, file_name)
+        for file_name in self.backend.list_files(self.directory_path):
             if file_name.endswith(".json") and file_name != "description.json":
                 json_files.append(file_name)
 
         if len(json_files) > 0:
-            print("The Shots in this subdirectory are:")
+            _emit("The Shots in this subdirectory are:")
             for file_name in json_files:
-                print(file_name)
+                _emit(file_name)
         else:
-            print("No Shots found in this subdirectory.")
+            _emit("No Shots found in this subdirectory.")
+
+    def iter_shots(self, pattern: str = None):
+        """
+        Yield the shot JSON file names in the directory one at a time, as they are listed.
+
+        Args:
+            pattern (str, optional): Only yield names matching this glob pattern. Defaults to '*.json'.
+
+        Yields:
+            str: The shot file names.
+        """
+        return iter_entries(self.backend, self.directory_path, False, pattern or "*.json", ("description.json",))
+
+    def page_shots(self, limit: int = 100, cursor: str = None, pattern: str = None, descending: bool = False) -> "Page":
+        """
+        Get one page of the shot JSON file names in the directory, in name order.
+
+        Args:
+            limit (int): The maximum number of names in the page.
+            cursor (str, optional): The cursor of the previous page. Defaults to the first page.
+            pattern (str, optional): Only list names matching this glob pattern. Defaults to '*.json'.
+            descending (bool): List the names in reverse order.
+
+        Returns:
+            Page: The names and the cursor of the next page (None on the last page).
+        """
+        return page_entries(self.backend, self.directory_path, False, limit, cursor, pattern or "*.json",
+                            descending, ("description.json",))
 
     def get_json_file_info(self, file_name: str) -> Dict:
         """
@@ -246,12 +1053,10 @@ class ShotManager:
         """
         file_path = os.path.join(self.directory_path, file_name)
 
-        if os.path.exists(file_path) and file_name.endswith(".json"):
-            with open(file_path, 'r') as file:
-                json_data = json.load(file)
-            return json_data
+        if self.backend.is_file(file_path) and file_name.endswith(".json"):
+            return self.backend.read(file_path)
         else:
-            print(f"JSON file '{file_name}' does not exist in the specified directory.")
+            _emit(f"JSON file '{file_name}' does not exist in the specified directory.", logging.WARNING)
             return None
 
     def edit_json_file(self, file_name: str, new_data: Dict) -> None:
@@ -264,12 +1069,14 @@ class ShotManager:
         """
         file_path = os.path.join(self.directory_path, file_name)
 
-        if os.path.exists(file_path) and file_name.endswith(".json"):
-            with open(file_path, 'w') as file:
-                json.dump(new_data, file, indent=4)
-            print(f"JSON file '{file_name}' has been successfully updated!")
+        if self.backend.is_file(file_path) and file_name.endswith(".json"):
+            with self.backend.transaction():
+                self.backend.write(file_path, new_data)
+                get_show_index(self.directory_path, self.backend).set_shot_document(file_name, new_data)
+            _search_documents_changed({file_path: new_data})
+            _emit(f"JSON file '{file_name}' has been successfully updated!")
         else:
-            print(f"JSON file '{file_name}' does not exist in the specified directory.")
+            _emit(f"JSON file '{file_name}' does not exist in the specified directory.", logging.WARNING)
 
     def delete_json_file(self, file_name: str) -> None:
         """
@@ -280,11 +1087,14 @@ class ShotManager:
         """
         file_path = os.path.join(self.directory_path, file_name)
 
-        if os.path.exists(file_path) and file_name.endswith(".json"):
-            os.remove(file_path)
-            print(f"JSON file '{file_name}' has been successfully deleted!")
+        if self.backend.is_file(file_path) and file_name.endswith(".json"):
+            with self.backend.transaction():
+                self.backend.delete(file_path)
+                get_show_index(self.directory_path, self.backend).remove_document(file_name)
+            _search_path_removed(file_path)
+            _emit(f"JSON file '{file_name}' has been successfully deleted!")
         else:
-            print(f"JSON file '{file_name}' does not exist in the specified directory.")
+            _emit(f"JSON file '{file_name}' does not exist in the specified directory.", logging.WARNING)
 
     def print_assets_key_values(self, file_name: str) -> None:
         """
@@ -298,20 +1108,59 @@ class ShotManager:
         """
         file_path = os.path.join(self.directory_path, file_name)
 
-        if os.path.exists(file_path) and file_name.endswith(".json"):
-            with open(file_path, 'r') as file:
-                json_data = json.load(file)
+        if self.backend.is_file(file_path) and file_name.endswith(".json"):
+            json_data = self.backend.read(file_path)
 
             assets_values = json_data.get("assets", [])
 
             if assets_values:
-                print(f"Assets key values in '{file_name}':")
+                _emit(f"Assets key values in '{file_name}':")
                 for asset in assets_values:
-                    print(asset)
+                    _emit(asset)
             else:
-                print(f"No assets key values found in '{file_name}'.")
+                _emit(f"No assets key values found in '{file_name}'.")
         else:
-            print(f"JSON file '{file_name}' does not exist in the specified directory.")
+            _emit(f"JSON file '{file_name}' does not exist in the specified directory.", logging.WARNING)
+
+    def find_assets_by_shot(self, file_name: str) -> List[str]:
+        """
+        Get every asset linked to a shot, using the show index instead of scanning files.
+
+        Args:
+            file_name (str): The name of the shot JSON file, with or without the '.json' extension.
+
+        Returns:
+            List[str]: A list of asset references, e.g. ['Prop_collar'].
+        """
+        return get_show_index(self.directory_path, self.backend).get_assets_for_shot(file_name)
+
+    def find_shots_by_asset(self, asset_name: str) -> List[str]:
+        """
+        Get every shot linked to an asset, using the show index instead of scanning files.
+
+        Args:
+            asset_name (str): The asset reference, e.g. 'Prop_collar'.
+
+        Returns:
+            List[str]: A list of shot references, e.g. ['doggo1_info'].
+        """
+        return get_show_index(self.directory_path, self.backend).get_shots_for_asset(asset_name)
+
+    def query(self, where: Dict = None, fields: List[str] = None) -> List[Dict]:
+        """
+        Find the shot files in the directory matching some conditions, using the show index.
+
+        Example:
+            shot_manager.query({"age": (">=", 3), "assets": "Prop_collar"}, fields=["name"])
+
+        Args:
+            where (Dict, optional): The conditions by field name, as for ShowManager.query.
+            fields (List[str], optional): The fields to return. Defaults to the whole document.
+
+        Returns:
+            List[Dict]: One result per matching file, with 'show', 'file', 'kind' and 'data' keys.
+        """
+        return query_shows([self.directory_path], where, fields, "shot", self.backend)
 
 # ==================================================================================== END SHOTS ====================================================================================
 
@@ -319,14 +1168,25 @@ class ShotManager:
 # ==================================================================================== BEGIN ASSETS ====================================================================================
 
 class AssetManager:
-    def __init__(self, directory_path: str):
+    def __init__(self, directory_path: str, backend=None, concurrency: str = None,
+                 lock_timeout: float = 10.0, retries: int = 10):
         """
         Initialize the AssetManager with the directory path.
 
         Args:
             directory_path (str): The base directory path.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored. Defaults to the JSON directory tree.
+            concurrency (str, optional): How read-modify-write updates are protected when several processes
+                update the same asset files: None (unprotected), 'lock' (advisory per-document lock) or
+                'optimistic' (compare the document's etag before writing, re-applying the change on conflict).
+            lock_timeout (float): Seconds to wait for a document lock before raising LockTimeout.
+            retries (int): How many times an optimistic update is re-applied before raising ConflictError. 0 fails fast.
         """
         self.directory_path = directory_path
+        self.backend = backend if backend is not None else JsonTreeBackend()
+        self.concurrency = concurrency
+        self.lock_timeout = lock_timeout
+        self.retries = retries
 
     def create_folders(self, folder_names: list) -> None:
         """
@@ -340,11 +1200,11 @@ class AssetManager:
         """
         for folder_name in folder_names:
             folder_path = os.path.join(self.directory_path, folder_name)
-            if os.path.exists(folder_path):
-                print(f"Folder '{folder_name}' already exists.")
+            if self.backend.exists(folder_path):
+                _emit(f"Folder '{folder_name}' already exists.", logging.WARNING)
             else:
-                os.makedirs(folder_path)
-                print(f"Folder '{folder_name}' created successfully!")
+                self.backend.make_dirs(folder_path)
+                _emit(f"Folder '{folder_name}' created successfully!")
 
     def add_description_file(self, folder_name: str, description_data: dict) -> None:
         """
@@ -358,16 +1218,16 @@ class AssetManager:
             None
         """
         folder_path = os.path.join(self.directory_path, folder_name)
-        if os.path.exists(folder_path):
+        if self.backend.exists(folder_path):
             description_path = os.path.join(folder_path, 'description.json')
-            if os.path.exists(description_path):
-                print(f"Description file already exists in folder '{folder_name}'.")
+            if self.backend.exists(description_path):
+                _emit(f"Description file already exists in folder '{folder_name}'.", logging.WARNING)
             else:
-                with open(description_path, 'w') as file:
-                    json.dump(description_data, file, indent=4)
-                print(f"Description file added successfully to folder '{folder_name}'.")
+                self.backend.write(description_path, description_data)
+                _search_documents_changed({description_path: description_data})
+                _emit(f"Description file added successfully to folder '{folder_name}'.")
         else:
-            print(f"Folder '{folder_name}' does not exist.")
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
 
     def read_asset_folders(self, folder_name: str) -> list:
         """
@@ -380,18 +1240,14 @@ class AssetManager:
             list: A list of asset folder names.
         """
         folder_path = os.path.join(self.directory_path, folder_name)
-        if os.path.exists(folder_path):
-            asset_folders = []
-            for entry in os.listdir(folder_path):
-                entry_path = os.path.join(folder_path, entry)
-                if os.path.isdir(entry_path):
-                    asset_folders.append(entry)
+        if self.backend.exists(folder_path):
+            asset_folders = self.backend.list_dirs(folder_path)
 
             if len(asset_folders) == 0:
-                print(f"No asset folders found in folder '{folder_name}'.")
+                _emit(f"No asset folders found in folder '{folder_name}'.")
             return asset_folders
         else:
-            print(f"Folder '{folder_name}' does not exist.")
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
             return []
         
     def print_description_file(self, folder_name: str) -> None:
@@ -406,13 +1262,12 @@ class AssetManager:
         """
         folder_path = os.path.join(self.directory_path, folder_name)
         description_path = os.path.join(folder_path, 'description.json')
-        if os.path.exists(description_path):
-            with open(description_path, 'r') as file:
-                description_data = json.load(file)
-                print("Description File Contents:")
-                print(json.dumps(description_data, indent=4))
+        if self.backend.is_file(description_path):
+            description_data = self.backend.read(description_path)
+            _emit("Description File Contents:")
+            _emit(json.dumps(description_data, indent=4))
         else:
-            print(f"Description file not found in folder '{folder_name}'.")
+            _emit(f"Description file not found in folder '{folder_name}'.", logging.WARNING)
 
     def update_description_file(self, folder_name: str, updated_data: dict) -> None:
         """
@@ -427,16 +1282,14 @@ class AssetManager:
         """
         folder_path = os.path.join(self.directory_path, folder_name)
         description_path = os.path.join(folder_path, 'description.json')
-        if os.path.exists(description_path):
-            with open(description_path, 'r+') as file:
-                existing_data = json.load(file)
-                existing_data.update(updated_data)
-                file.seek(0)
-                json.dump(existing_data, file, indent=4)
-                file.truncate()
-                print(f"Description file in folder '{folder_name}' updated successfully.")
+        if self.backend.is_file(description_path):
+            description_data = update_document(self.backend, description_path,
+                                               lambda existing_data: existing_data.update(updated_data),
+                                               self.concurrency, self.lock_timeout, self.retries)
+            _search_documents_changed({description_path: description_data})
+            _emit(f"Description file in folder '{folder_name}' updated successfully.")
         else:
-            print(f"Description file not found in folder '{folder_name}'.")
+            _emit(f"Description file not found in folder '{folder_name}'.", logging.WARNING)
 
     def delete_asset_folder(self, folder_name: str) -> None:
         """
@@ -449,11 +1302,17 @@ class AssetManager:
             None
         """
         folder_path = os.path.join(self.directory_path, folder_name)
-        if os.path.exists(folder_path):
-            shutil.rmtree(folder_path)
-            print(f"Asset folder '{folder_name}' deleted successfully.")
+        if self.backend.exists(folder_path):
+            show_path, category = find_asset_folder_show(self.directory_path, folder_name, self.backend)
+            close_show_indexes(folder_path, self.backend)
+            with self.backend.transaction():
+                self.backend.remove_tree(folder_path)
+                if show_path is not None:
+                    get_show_index(show_path, self.backend).remove_folder(category)
+            _search_path_removed(folder_path)
+            _emit(f"Asset folder '{folder_name}' deleted successfully.")
         else:
-            print(f"Folder '{folder_name}' does not exist.")
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
 
     def create_json_file(self, folder_name: str, description_data: dict, file_name: str) -> None:
         """
@@ -468,49 +1327,150 @@ class AssetManager:
             None
         """
         folder_path = os.path.join(self.directory_path, folder_name)
-        if os.path.exists(folder_path):
+        if self.backend.exists(folder_path):
             file_path = os.path.join(folder_path, file_name)
 
-            if os.path.exists(file_path):
-                print(f"JSON file '{file_name}' already exists in folder '{folder_name}'.")
+            if self.backend.exists(file_path):
+                _emit(f"JSON file '{file_name}' already exists in folder '{folder_name}'.", logging.WARNING)
             else:
-                with open(file_path, 'w') as file:
-                    json.dump(description_data, file, indent=4)
+                show_path, category = split_asset_folder(self.directory_path, folder_name)
+                with self.backend.transaction():
+                    self.backend.write(file_path, description_data)
+                    get_show_index(show_path, self.backend).set_asset_document(category, file_name, description_data)
+                _search_documents_changed({file_path: description_data})
 
-                print(f"JSON file '{file_name}' created successfully in folder '{folder_name}'.")
+                _emit(f"JSON file '{file_name}' created successfully in folder '{folder_name}'.")
         else:
-            print(f"Folder '{folder_name}' does not exist.")
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
 
-    def update_shots_key(self, folder_name: str, file_name: str, shots_data: List[str]) -> None:
+    def create_many(self, records: list, workers: int = None) -> List[Dict]:
         """
-        Update the 'Shots' key values in a JSON file.
+        Create many asset JSON files in one call.
+
+        Every record is validated before anything is written, each asset folder is created
+        (if needed) and listed once, files are written by a thread pool, and each show
+        index is updated in a single transaction. Nothing is printed; the outcome of each
+        record is returned instead.
 
         Args:
-            folder_name (str): The name of the asset folder.
-            file_name (str): The name of the JSON file.
-            shots_data (List[str]): A list of shot data to be written to the 'Shots' key.
+            records (list): Dictionaries with 'folder_name', 'file_name' and 'data' keys,
+                or (folder_name, description_data, file_name) tuples, as for create_json_file.
+            workers (int, optional): The number of writer threads. Defaults to the number of CPUs.
 
         Returns:
-            None
+            List[Dict]: One result per record, in order, with 'index', 'folder_name', 'file_name',
+            'status' ('created', 'exists', 'invalid' or 'failed') and 'message' keys.
         """
-        folder_path = os.path.join(self.directory_path, folder_name)
-        if os.path.exists(folder_path):
-            file_path = os.path.join(folder_path, file_name)
+        results = []
+        documents = {}
+        existing = {}
+        for index, record in enumerate(records):
+            if isinstance(record, dict):
+                folder_name, file_name, data = record.get("folder_name"), record.get("file_name"), record.get("data", {})
+            else:
+                folder_name, data, file_name = (tuple(record) + (None, None, None))[:3]
+            result = {"index": index, "folder_name": folder_name, "file_name": file_name, "status": "created", "message": ""}
+            results.append(result)
 
-            if os.path.exists(file_path) and file_name.endswith(".json"):
-                with open(file_path, 'r') as file:
-                    json_data = json.load(file)
+            problem = (
+                (None if isinstance(folder_name, str) and folder_name.strip("/\\") else "A folder name is required.")
+                or _validate_file_name(file_name, ".json")
+                or _validate_document(data, "Shots")
+            )
+            if problem:
+                result.update(status="invalid", message=problem)
+                continue
 
-                json_data["Shots"] = shots_data
+            folder_path = os.path.join(self.directory_path, folder_name)
+            if folder_path not in existing:
+                self.backend.make_dirs(folder_path)
+                existing[folder_path] = set(self.backend.list_files(folder_path))
+            file_path = os.path.join(folder_path, file_name)
+            if file_name in existing[folder_path] or file_path in documents:
+                result.update(status="exists", message=f"JSON file '{file_name}' already exists in folder '{folder_name}'.")
+            else:
+                documents[file_path] = (result, data)
+
+        errors = _write_documents(self.backend, {path: data for path, (_, data) in documents.items()}, workers)
+        by_show = collections.defaultdict(list)
+        for file_path, (result, data) in documents.items():
+            if errors.get(file_path) is not None:
+                result.update(status="failed", message=str(errors[file_path]))
+            else:
+                show_path, category = split_asset_folder(self.directory_path, result["folder_name"])
+                by_show[show_path].append((category, result["file_name"], data))
+
+        for show_path, assets in by_show.items():
+            index = get_show_index(show_path, self.backend)
+            with index.transaction():
+                for category, file_name, data in assets:
+                    index.set_asset_document(category, file_name, data)
+        _search_documents_changed({
+            path: data for path, (result, data) in documents.items() if result["status"] == "created"
+        })
+        return results
+
+    def update_shots_key(self, folder_name: str, file_name: str, shots_data: List[str]) -> None:
+        """
+        Update the 'Shots' key values in a JSON file.
+
+        Args:
+            folder_name (str): The name of the asset folder.
+            file_name (str): The name of the JSON file.
+            shots_data (List[str]): A list of shot data to be written to the 'Shots' key.
+
+        Returns:
+            None
+        """
+        folder_path = os.path.join(self.directory_path, folder_name)
+        if self.backend.exists(folder_path):
+            file_path = os.path.join(folder_path, file_name)
 
-                with open(file_path, 'w') as file:
-                    json.dump(json_data, file, indent=4)
+            if self.backend.is_file(file_path) and file_name.endswith(".json"):
+                show_path, category = split_asset_folder(self.directory_path, folder_name)
+                with self.backend.transaction():
+                    json_data = update_document(self.backend, file_path,
+                                                lambda json_data: json_data.__setitem__("Shots", shots_data),
+                                                self.concurrency, self.lock_timeout, self.retries)
+                    get_show_index(show_path, self.backend).set_asset_document(category, file_name, json_data)
+                _search_documents_changed({file_path: json_data})
 
-                print(f"JSON file '{file_name}' in folder '{folder_name}' has been updated with new Shots data.")
+                _emit(f"JSON file '{file_name}' in folder '{folder_name}' has been updated with new Shots data.")
             else:
-                print(f"JSON file '{file_name}' does not exist in folder '{folder_name}'.")
+                _emit(f"JSON file '{file_name}' does not exist in folder '{folder_name}'.", logging.WARNING)
         else:
-            print(f"Folder '{folder_name}' does not exist.")
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
+
+    def add_shots_key_values(self, folder_name: str, file_name: str, shots_data: List[str]) -> List[str]:
+        """
+        Add shots to the 'Shots' key of a JSON file, keeping the shots already listed.
+
+        Unlike update_shots_key this merges with the current list, so processes adding
+        different shots to the same asset don't overwrite each other when 'concurrency' is set.
+
+        Args:
+            folder_name (str): The name of the asset folder.
+            file_name (str): The name of the JSON file.
+            shots_data (List[str]): The shots to add.
+
+        Returns:
+            List[str]: The 'Shots' key values after the update, or an empty list if the file does not exist.
+        """
+        file_path = os.path.join(self.directory_path, folder_name, file_name)
+        if not self.backend.is_file(file_path) or not file_name.endswith(".json"):
+            _emit(f"JSON file '{file_name}' does not exist in folder '{folder_name}'.", logging.WARNING)
+            return []
+
+        def add_shots(json_data):
+            shots = json_data.get("Shots", [])
+            json_data["Shots"] = shots + [shot for shot in shots_data if shot not in shots]
+
+        show_path, category = split_asset_folder(self.directory_path, folder_name)
+        with self.backend.transaction():
+            json_data = update_document(self.backend, file_path, add_shots, self.concurrency, self.lock_timeout, self.retries)
+            get_show_index(show_path, self.backend).set_asset_document(category, file_name, json_data)
+        _search_documents_changed({file_path: json_data})
+        return json_data["Shots"]
 
     def get_shots_key_values(self, folder_name: str, file_name: str) -> List[str]:
         """
@@ -526,20 +1486,155 @@ class AssetManager:
         folder_path = os.path.join(self.directory_path, folder_name)
         file_path = os.path.join(folder_path, file_name)
 
-        if not os.path.exists(folder_path):
-            print(f"Folder '{folder_name}' does not exist.")
+        if not self.backend.exists(folder_path):
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
             return []
 
-        if not os.path.exists(file_path) or not file_name.endswith('.json') or file_name == 'description.json':
-            print(f"JSON file '{file_name}' does not exist in folder '{folder_name}'.")
+        if not self.backend.is_file(file_path) or not file_name.endswith('.json') or file_name == 'description.json':
+            _emit(f"JSON file '{file_name}' does not exist in folder '{folder_name}'.", logging.WARNING)
             return []
 
-        with open(file_path, 'r') as file:
-            json_data = json.load(file)
-            shots_data = json_data.get('Shots', [])
+        json_data = self.backend.read(file_path)
+        shots_data = json_data.get('Shots', [])
 
         return shots_data
+
+    def find_shots_by_asset(self, folder_name: str, file_name: str) -> List[str]:
+        """
+        Get every shot linked to an asset file, using the show index instead of scanning files.
+
+        Args:
+            folder_name (str): The name of the asset folder, e.g. 'Dogs/Prop'.
+            file_name (str): The name of the asset JSON file.
+
+        Returns:
+            List[str]: A list of shot references.
+        """
+        show_path, category = split_asset_folder(self.directory_path, folder_name)
+        return get_show_index(show_path, self.backend).get_shots_for_asset(asset_reference(category, file_name))
+
+    def find_assets_by_shot(self, show_name: str, shot_name: str) -> List[str]:
+        """
+        Get every asset linked to a shot of a show, using the show index instead of scanning files.
+
+        Args:
+            show_name (str): The name of the show folder, e.g. 'Dogs'.
+            shot_name (str): The shot reference or file name, e.g. 'character3'.
+
+        Returns:
+            List[str]: A list of asset references.
+        """
+        show_path = os.path.join(self.directory_path, show_name)
+        return get_show_index(show_path, self.backend).get_assets_for_shot(shot_name)
+
+    def query(self, show_name: str, where: Dict = None, fields: List[str] = None) -> List[Dict]:
+        """
+        Find the asset files of a show matching some conditions, using the show index.
+
+        Example:
+            assets_manager.query("Dogs", {"Shots": "doggo1_info"}, fields=["name"])
+
+        Args:
+            show_name (str): The name of the show folder, e.g. 'Dogs'.
+            where (Dict, optional): The conditions by field name, as for ShowManager.query.
+            fields (List[str], optional): The fields to return. Defaults to the whole document.
+
+        Returns:
+            List[Dict]: One result per matching file, with 'show', 'file' (e.g. 'Prop/Staff1.json'), 'kind' and 'data' keys.
+        """
+        return query_shows([os.path.join(self.directory_path, show_name)], where, fields, "asset", self.backend)
     
+    def deduplicate(self, folder_names: list, link: str = "hardlink", min_size: int = 1, workers: int = None) -> Dict:
+        """
+        Store the files of asset folders once in the studio's blob store, replacing identical copies with links.
+
+        The studio is the directory holding the show this manager was opened on.
+
+        Args:
+            folder_names (list): The asset folders to deduplicate, e.g. ['Dogs/Prop'].
+            link (str): 'hardlink' or 'reflink', see BlobStore.
+            min_size (int): Files smaller than this many bytes are left alone.
+            workers (int, optional): The number of hashing threads. Defaults to the number of CPUs.
+
+        Returns:
+            Dict: The report of BlobStore.deduplicate.
+        """
+        studio_path = os.path.dirname(os.path.abspath(self.directory_path))
+        folder_paths = []
+        for folder_name in folder_names:
+            folder_path = os.path.join(self.directory_path, folder_name)
+            if os.path.isdir(folder_path):
+                folder_paths.append(folder_path)
+            else:
+                _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
+        report = BlobStore(studio_path, link).deduplicate(folder_paths, min_size, workers)
+        _emit(f"{report['linked']} asset files linked to existing blobs, {report['stored']} blobs stored, "
+              f"{report['bytes_reclaimed']} bytes reclaimed.")
+        return report
+
+    def iter_categories(self, folder_name: str, pattern: str = None):
+        """
+        Yield the asset folder names within a folder one at a time, as they are listed.
+
+        Args:
+            folder_name (str): The name of the folder, e.g. 'Dogs'.
+            pattern (str, optional): Only yield names matching this glob pattern.
+
+        Yields:
+            str: The asset folder names.
+        """
+        return iter_entries(self.backend, os.path.join(self.directory_path, folder_name), True, pattern)
+
+    def page_categories(self, folder_name: str, limit: int = 100, cursor: str = None, pattern: str = None,
+                        descending: bool = False) -> "Page":
+        """
+        Get one page of the asset folder names within a folder, in name order.
+
+        Args:
+            folder_name (str): The name of the folder, e.g. 'Dogs'.
+            limit (int): The maximum number of names in the page.
+            cursor (str, optional): The cursor of the previous page. Defaults to the first page.
+            pattern (str, optional): Only list names matching this glob pattern.
+            descending (bool): List the names in reverse order.
+
+        Returns:
+            Page: The names and the cursor of the next page (None on the last page).
+        """
+        return page_entries(self.backend, os.path.join(self.directory_path, folder_name), True,
+                            limit, cursor, pattern, descending)
+
+    def iter_assets(self, folder_name: str, pattern: str = None):
+        """
+        Yield the asset JSON file names in a folder one at a time, as they are listed.
+
+        Args:
+            folder_name (str): The name of the asset folder, e.g. 'Dogs/Prop'.
+            pattern (str, optional): Only yield names matching this glob pattern. Defaults to '*.json'.
+
+        Yields:
+            str: The asset file names.
+        """
+        return iter_entries(self.backend, os.path.join(self.directory_path, folder_name), False,
+                            pattern or "*.json", ("description.json",))
+
+    def page_assets(self, folder_name: str, limit: int = 100, cursor: str = None, pattern: str = None,
+                    descending: bool = False) -> "Page":
+        """
+        Get one page of the asset JSON file names in a folder, in name order.
+
+        Args:
+            folder_name (str): The name of the asset folder, e.g. 'Dogs/Prop'.
+            limit (int): The maximum number of names in the page.
+            cursor (str, optional): The cursor of the previous page. Defaults to the first page.
+            pattern (str, optional): Only list names matching this glob pattern. Defaults to '*.json'.
+            descending (bool): List the names in reverse order.
+
+        Returns:
+            Page: The names and the cursor of the next page (None on the last page).
+        """
+        return page_entries(self.backend, os.path.join(self.directory_path, folder_name), False, limit, cursor,
+                            pattern or "*.json", descending, ("description.json",))
+
     def list_json_files(self, folder_name: str) -> list:
         """
         List JSON files in a folder.
@@ -551,55 +1646,65 @@ class AssetManager:
             list: A list of JSON file names.
         """
         folder_path = os.path.join(self.directory_path, folder_name)
-        if os.path.exists(folder_path):
+        if self.backend.exists(folder_path):
             json_files = []
-            for entry in os.listdir(folder_path):
-                entry_path = os.path.join(folder_path, entry)
-                if os.path.isfile(entry_path) and entry.endswith('.json') and entry != 'description.json':
+            for entry in self.backend.list_files(folder_path):
+                if entry.endswith('.json') and entry != 'description.json':
                     json_files.append(entry)
             return json_files
         else:
-            print(f"Folder '{folder_name}' does not exist.")
+            _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
             return []
         
-    def zip_asset_folders(self, folder_names: list) -> None:
+    def zip_asset_folders(self, folder_names: list, compression: str = "deflate", level: int = None,
+                          workers: int = None, progress=None, dedupe_links: bool = False) -> None:
         """
-        Zip multiple asset folders.
+        Zip multiple asset folders, compressing files in parallel, and delete them once zipped.
 
         Args:
             folder_names (list): A list of folder names to be zipped.
+            compression (str): 'stored', 'deflate', 'bzip2' or 'lzma'. Already-compressed media is always stored.
+            level (int, optional): The compression level.
+            workers (int, optional): The number of compression threads. Defaults to the number of CPUs.
+            progress (callable, optional): Called as progress(files_done, files_total, bytes_done, bytes_total) for each folder.
+            dedupe_links (bool): Store hard-linked files (see deduplicate) once, as ArchiveWriter does with
+                dedupe_links. Since the folders are deleted, their files can then only be extracted with
+                this library (ArchiveReader); other ZIP tools leave the linked copies out.
 
         Returns:
             None
         """
+        writer = ArchiveWriter(compression, level, workers, progress, dedupe_links=dedupe_links)
         for folder_name in folder_names:
             folder_path = os.path.join(self.directory_path, folder_name)
-            if os.path.exists(folder_path):
+            if self.backend.exists(folder_path):
                 zip_file_name = f"{folder_name}.zip"
                 zip_file_path = os.path.join(self.directory_path, zip_file_name)
 
-                with zipfile.ZipFile(zip_file_path, 'w') as zip_file:
-                    for root, _, files in os.walk(folder_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, folder_path)
-                            zip_file.write(file_path, arcname)
+                writer.write(zip_file_path, collect_archive_members(self.backend, folder_path))
 
-                print(f"Asset folder '{folder_name}' zipped successfully to '{zip_file_name}'.")
+                _emit(f"Asset folder '{folder_name}' zipped successfully to '{zip_file_name}'.")
 
                 # Delete the original folder after zipping
-                shutil.rmtree(folder_path)
-                print(f"Asset folder '{folder_name}' deleted after zipping.")
+                show_path, category = find_asset_folder_show(self.directory_path, folder_name, self.backend)
+                close_show_indexes(folder_path, self.backend)
+                with self.backend.transaction():
+                    self.backend.remove_tree(folder_path)
+                    if show_path is not None:
+                        get_show_index(show_path, self.backend).remove_folder(category)
+                _search_path_removed(folder_path)
+                _emit(f"Asset folder '{folder_name}' deleted after zipping.")
             else:
-                print(f"Folder '{folder_name}' does not exist.")
+                _emit(f"Folder '{folder_name}' does not exist.", logging.WARNING)
 
-    def read_data_from_zip(self, zip_file_name: str, zip_file_directory: str) -> None:
+    def read_data_from_zip(self, zip_file_name: str, zip_file_directory: str, pattern: str = None) -> None:
         """
         Read and display the contents of a ZIP file.
 
         Args:
             zip_file_name (str): The name of the ZIP file to be read.
             zip_file_directory (str): The directory where the ZIP file is located.
+            pattern (str, optional): A glob pattern selecting the members to display, e.g. '*.json'. Defaults to all of them.
 
         Returns:
             None
@@ -607,16 +1712,5144 @@ class AssetManager:
         zip_file_path = os.path.join(zip_file_directory, zip_file_name)
 
         if not os.path.exists(zip_file_path):
-            print(f"ZIP file '{zip_file_name}' does not exist in the specified directory.")
+            _emit(f"ZIP file '{zip_file_name}' does not exist in the specified directory.", logging.WARNING)
             return
 
-        with zipfile.ZipFile(zip_file_path, 'r') as zip_file:
-            print(f"Contents of ZIP file '{zip_file_name}':")
+        print_archive_members(zip_file_path, zip_file_name, pattern)
 
-            for file_name in zip_file.namelist():
-                with zip_file.open(file_name) as file:
-                    try:
-                        data = file.read().decode('utf-8', errors='replace')
-                        print(f"\nFile: {file_name}\nData:\n{data}")
-                    except UnicodeDecodeError:
-                        print(f"\nFile: {file_name}\nData: Unable to decode data (binary file).")
\ No newline at end of file
+# ==================================================================================== END ASSETS ====================================================================================
+
+
+# ==================================================================================== BEGIN INDEX ====================================================================================
+
+INDEX_FILE_NAME = ".show_index.db"
+INDEX_VERSION = 3
+QUERY_OPERATORS = ("==", "!=", "<", "<=", ">", ">=", "in", "glob", "contains")
+
+_open_indexes = {}
+_open_indexes_lock = threading.Lock()
+
+
+def shot_reference(file_name: str) -> str:
+    """
+    Get the name other documents use to refer to a shot file.
+
+    Args:
+        file_name (str): The name of the shot JSON file, e.g. 'character3.json'.
+
+    Returns:
+        str: The shot reference, e.g. 'character3'.
+    """
+    return os.path.splitext(os.path.basename(file_name))[0]
+
+
+def asset_reference(category: str, file_name: str) -> str:
+    """
+    Get the name shot files use to refer to an asset file.
+
+    Args:
+        category (str): The asset category path inside the show, e.g. 'Prop'.
+        file_name (str): The name of the asset JSON file, e.g. 'collar.json'.
+
+    Returns:
+        str: The asset reference, e.g. 'Prop_collar'.
+    """
+    category = category.replace("\\", "/").strip("/").replace("/", "_")
+    return f"{category}_{shot_reference(file_name)}" if category else shot_reference(file_name)
+
+
+def split_asset_folder(directory_path: str, folder_name: str) -> tuple:
+    """
+    Split an asset folder name into the show directory it belongs to and its category.
+
+    Args:
+        directory_path (str): The base directory path of the AssetManager.
+        folder_name (str): The asset folder name, e.g. 'Dogs/Prop'.
+
+    Returns:
+        tuple: The show directory path and the category path, e.g. ('<base>/Dogs', 'Prop').
+    """
+    parts = [part for part in folder_name.replace("\\", "/").split("/") if part]
+    if len(parts) > 1:
+        return os.path.join(directory_path, parts[0]), "/".join(parts[1:])
+    return directory_path, "/".join(parts)
+
+
+class ShowIndex:
+    def __init__(self, show_path: str, backend=None):
+        """
+        Open (and build on first use) the asset/shot index of a show.
+
+        The index holds one row per reference. Rows are written by the document that
+        declares them: shot files declare their 'assets', asset files declare their 'Shots'.
+        Lookups go through indexed columns, so they cost the same no matter how many shots
+        the show has. The backend decides where the rows live: a '.show_index.db' file next
+        to the show for the JSON tree, or the catalog itself for the SQLite backend.
+
+        A second table holds the top-level values of every shot and asset file (one row per
+        scalar, and one per element of a list of scalars), which query() filters on.
+
+        Args:
+            show_path (str): The path of the show directory.
+            backend (JsonTreeBackend | SQLiteBackend, optional): The backend holding the show's documents.
+        """
+        self.show_path = show_path
+        self.backend = backend if backend is not None else JsonTreeBackend()
+        self.catalog, self.show_key = self.backend.open_index(show_path)
+
+        with self.catalog.transaction():
+            if self.catalog.query("PRAGMA user_version")[0][0] != INDEX_VERSION:
+                self.catalog.execute("DROP TABLE IF EXISTS refs")
+                self.catalog.execute("DROP TABLE IF EXISTS indexed_shows")
+                self.catalog.execute("DROP TABLE IF EXISTS fields")
+                self.catalog.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            self.catalog.execute(
+                "CREATE TABLE IF NOT EXISTS refs ("
+                "show TEXT NOT NULL, document TEXT NOT NULL, kind TEXT NOT NULL, shot TEXT NOT NULL, asset TEXT NOT NULL)"
+            )
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS refs_document ON refs (show, document)")
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS refs_shot ON refs (show, shot)")
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS refs_asset ON refs (show, asset)")
+            # 'value' has no declared type, so numbers and text keep their own type and ordering.
+            self.catalog.execute(
+                "CREATE TABLE IF NOT EXISTS fields ("
+                "show TEXT NOT NULL, document TEXT NOT NULL, kind TEXT NOT NULL, field TEXT NOT NULL, value)"
+            )
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS fields_document ON fields (show, document)")
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS fields_value ON fields (show, field, value)")
+            self.catalog.execute("CREATE TABLE IF NOT EXISTS indexed_shows (show TEXT PRIMARY KEY)")
+            if not self.catalog.query("SELECT 1 FROM indexed_shows WHERE show = ?", (self.show_key,)):
+                self.rebuild()
+
+    def close(self) -> None:
+        """
+        Release the index connection.
+        """
+        self.backend.close_index(self.catalog)
+
+    def transaction(self):
+        """
+        Group many index updates into one transaction.
+        """
+        return self.catalog.transaction()
+
+    def set_shot_assets(self, file_name: str, assets: List[str]) -> None:
+        """
+        Replace the assets declared by a shot file.
+
+        Args:
+            file_name (str): The name of the shot JSON file.
+            assets (List[str]): The asset references listed in the shot's 'assets' key.
+        """
+        shot = shot_reference(file_name)
+        rows = [(self.show_key, file_name, "shot", shot, asset) for asset in _as_name_list(assets)]
+        self._replace_document(file_name, rows)
+
+    def set_asset_shots(self, category: str, file_name: str, shots: List[str]) -> None:
+        """
+        Replace the shots declared by an asset file.
+
+        Args:
+            category (str): The asset category path inside the show, e.g. 'Prop'.
+            file_name (str): The name of the asset JSON file.
+            shots (List[str]): The shot references listed in the asset's 'Shots' key.
+        """
+        document = f"{category}/{file_name}" if category else file_name
+        asset = asset_reference(category, file_name)
+        rows = [(self.show_key, document, "asset", shot, asset) for shot in _as_name_list(shots)]
+        self._replace_document(document, rows)
+
+    def set_shot_document(self, file_name: str, data: Dict) -> None:
+        """
+        Index a shot file: the assets it declares and its field values.
+
+        Args:
+            file_name (str): The name of the shot JSON file.
+            data (Dict): The contents of the shot file.
+        """
+        with self.catalog.transaction():
+            self.set_shot_assets(file_name, data.get("assets"))
+            self._replace_fields(file_name, "shot", data)
+
+    def set_asset_document(self, category: str, file_name: str, data: Dict) -> None:
+        """
+        Index an asset file: the shots it declares and its field values.
+
+        Args:
+            category (str): The asset category path inside the show, e.g. 'Prop'.
+            file_name (str): The name of the asset JSON file.
+            data (Dict): The contents of the asset file.
+        """
+        with self.catalog.transaction():
+            self.set_asset_shots(category, file_name, data.get("Shots"))
+            self._replace_fields(f"{category}/{file_name}" if category else file_name, "asset", data)
+
+    def remove_document(self, document: str) -> None:
+        """
+        Remove every reference and field value declared by a shot or asset file.
+
+        Args:
+            document (str): The file path relative to the show, e.g. 'doggo1_info.json' or 'Prop/Staff1.json'.
+        """
+        with self.catalog.transaction():
+            self._replace_document(document, [])
+            self._replace_fields(document, None, {})
+
+    def remove_folder(self, category: str) -> None:
+        """
+        Remove every reference declared by asset files inside a category folder.
+
+        Args:
+            category (str): The asset category path inside the show, e.g. 'Prop'.
+        """
+        prefix = category.replace("\\", "/").strip("/") + "/"
+        with self.catalog.transaction():
+            for table in ("refs", "fields"):
+                self.catalog.execute(
+                    f"DELETE FROM {table} WHERE show = ? AND substr(document, 1, ?) = ?",
+                    (self.show_key, len(prefix), prefix),
+                )
+
+    def get_assets_for_shot(self, shot: str) -> List[str]:
+        """
+        Get every asset linked to a shot, from either side of the reference.
+
+        Args:
+            shot (str): The shot reference or file name, e.g. 'character3' or 'character3.json'.
+
+        Returns:
+            List[str]: A sorted list of asset references.
+        """
+        rows = self.catalog.query(
+            "SELECT DISTINCT asset FROM refs WHERE show = ? AND shot = ? ORDER BY asset",
+            (self.show_key, shot_reference(shot)),
+        )
+        return [row[0] for row in rows]
+
+    def get_shots_for_asset(self, asset: str) -> List[str]:
+        """
+        Get every shot linked to an asset, from either side of the reference.
+
+        Args:
+            asset (str): The asset reference, e.g. 'Prop_collar'.
+
+        Returns:
+            List[str]: A sorted list of shot references.
+        """
+        rows = self.catalog.query(
+            "SELECT DISTINCT shot FROM refs WHERE show = ? AND asset = ? ORDER BY shot",
+            (self.show_key, asset),
+        )
+        return [row[0] for row in rows]
+
+    def query(self, where: Dict = None, kind: str = None) -> List[tuple]:
+        """
+        Find the shot and asset files whose field values match every condition.
+
+        Args:
+            where (Dict, optional): The conditions, by field name. A plain value must equal the field, a list
+                of values must all be in the field, and an (operator, operand) tuple applies one of
+                QUERY_OPERATORS. A condition on a list field holds if any element matches, except '!='
+                which holds if no element is equal. Defaults to every file.
+            kind (str, optional): 'shot' or 'asset'. Defaults to both.
+
+        Returns:
+            List[tuple]: The matching (document, kind) pairs, sorted by document.
+        """
+        # One indexed lookup per condition, combined with INTERSECT/EXCEPT. The rows with an empty
+        # field name stand for "every document" when there is nothing to intersect with.
+        selects, excepts, parameters, except_parameters = [], [], [], []
+        kind_test = "" if kind is None else " AND kind = ?"
+        kind_parameters = [] if kind is None else [kind]
+        for field, (operator, operand) in _query_conditions(where):
+            if operator == "in":
+                operands = [_index_value(value) for value in operand]
+                test = f"value IN ({', '.join('?' * len(operands))})"
+            else:
+                operands = [_index_value(operand)]
+                test = {"glob": "value GLOB ?", "contains": "value = ?", "!=": "value = ?"}.get(operator, f"value {operator} ?")
+            select = f"SELECT document, kind FROM fields WHERE show = ? AND field = ? AND {test}{kind_test}"
+            if operator == "!=":
+                excepts.append(select)
+                except_parameters.extend([self.show_key, field] + operands + kind_parameters)
+            else:
+                selects.append(select)
+                parameters.extend([self.show_key, field] + operands + kind_parameters)
+        if not selects:
+            selects.append(f"SELECT document, kind FROM fields WHERE show = ? AND field = ''{kind_test}")
+            parameters.extend([self.show_key] + kind_parameters)
+
+        # Sorted here: an ORDER BY makes SQLite merge the lookups along the document index instead.
+        sql = " INTERSECT ".join(selects) + "".join(f" EXCEPT {select}" for select in excepts)
+        return sorted(tuple(row) for row in self.catalog.query(sql, tuple(parameters + except_parameters)))
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the whole index by scanning the show's shot and asset files once.
+        """
+        rows = []
+        field_rows = []
+        for root, dirs, files in self.backend.walk(self.show_path):
+            category = os.path.relpath(root, self.show_path).replace("\\", "/")
+            category = "" if category == "." else category
+            for file_name in files:
+                if not file_name.endswith(".json") or file_name == "description.json":
+                    continue
+                try:
+                    json_data = self.backend.read(os.path.join(root, file_name))
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(json_data, dict):
+                    continue
+                if category:
+                    document = f"{category}/{file_name}"
+                    asset = asset_reference(category, file_name)
+                    rows.extend((self.show_key, document, "asset", shot, asset) for shot in _as_name_list(json_data.get("Shots")))
+                    field_rows.extend(self._field_rows(document, "asset", json_data))
+                else:
+                    shot = shot_reference(file_name)
+                    rows.extend((self.show_key, file_name, "shot", shot, asset) for asset in _as_name_list(json_data.get("assets")))
+                    field_rows.extend(self._field_rows(file_name, "shot", json_data))
+
+        with self.catalog.transaction():
+            self.catalog.execute("DELETE FROM refs WHERE show = ?", (self.show_key,))
+            self.catalog.execute("DELETE FROM fields WHERE show = ?", (self.show_key,))
+            self.catalog.executemany("INSERT INTO refs VALUES (?, ?, ?, ?, ?)", rows)
+            self.catalog.executemany("INSERT INTO fields VALUES (?, ?, ?, ?, ?)", field_rows)
+            self.catalog.execute("INSERT OR IGNORE INTO indexed_shows VALUES (?)", (self.show_key,))
+
+    def _replace_document(self, document: str, rows: list) -> None:
+        with self.catalog.transaction():
+            self.catalog.execute("DELETE FROM refs WHERE show = ? AND document = ?", (self.show_key, document))
+            self.catalog.executemany("INSERT INTO refs VALUES (?, ?, ?, ?, ?)", rows)
+
+    def _replace_fields(self, document: str, kind: str, data: Dict) -> None:
+        with self.catalog.transaction():
+            self.catalog.execute("DELETE FROM fields WHERE show = ? AND document = ?", (self.show_key, document))
+            self.catalog.executemany("INSERT INTO fields VALUES (?, ?, ?, ?, ?)", self._field_rows(document, kind, data))
+
+    def _field_rows(self, document: str, kind: str, data: Dict) -> list:
+        # A document with no indexable value still gets a row, so queries without conditions find it.
+        rows = [(self.show_key, document, kind, "", None)] if kind else []
+        for field, value in data.items():
+            for element in (value if isinstance(value, list) else [value]):
+                if isinstance(element, (str, int, float)):
+                    rows.append((self.show_key, document, kind, field, _index_value(element)))
+        return rows
+
+
+def _index_value(value):
+    # JSON true/false compare like 1/0 in the index.
+    return int(value) if isinstance(value, bool) else value
+
+
+def _query_conditions(where: Dict) -> List[tuple]:
+    conditions = []
+    for field, condition in (where or {}).items():
+        if isinstance(condition, tuple):
+            if len(condition) != 2 or condition[0] not in QUERY_OPERATORS:
+                raise ValueError(f"Invalid condition on '{field}': {condition!r}. Use (operator, operand) with one of {QUERY_OPERATORS}.")
+            conditions.append((field, condition))
+        elif isinstance(condition, list):
+            conditions.extend((field, ("contains", value)) for value in condition)
+        else:
+            conditions.append((field, ("==", condition)))
+    return conditions
+
+
+def _matches(data: Dict, conditions: List[tuple]) -> bool:
+    # Check the conditions against the parsed document, in case the file changed since it was indexed.
+    for field, (operator, operand) in conditions:
+        value = data.get(field)
+        values = [_index_value(element) for element in (value if isinstance(value, list) else [value])]
+        if operator == "!=":
+            if _index_value(operand) in values:
+                return False
+            continue
+        try:
+            if operator == "in":
+                matched = any(element in [_index_value(item) for item in operand] for element in values)
+            elif operator == "glob":
+                matched = any(isinstance(element, str) and fnmatch.fnmatchcase(element, operand) for element in values)
+            elif operator in ("==", "contains"):
+                matched = _index_value(operand) in values
+            else:
+                compare = {"<": lambda a, b: a < b, "<=": lambda a, b: a <= b,
+                           ">": lambda a, b: a > b, ">=": lambda a, b: a >= b}[operator]
+                matched = any(element is not None and compare(element, operand) for element in values)
+        except TypeError:
+            matched = False
+        if not matched:
+            return False
+    return True
+
+
+def query_shows(show_paths: List[str], where: Dict = None, fields: List[str] = None, kind: str = None,
+                backend=None) -> List[Dict]:
+    """
+    Query the shot and asset files of several shows through their indexes.
+
+    Only the files the index selects are read, to check the conditions again and to
+    pick the requested fields.
+
+    Args:
+        show_paths (List[str]): The paths of the show directories.
+        where (Dict, optional): The conditions, as for ShowIndex.query. Defaults to every file.
+        fields (List[str], optional): The fields to return. Defaults to the whole document.
+        kind (str, optional): 'shot' or 'asset'. Defaults to both.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the shows.
+
+    Returns:
+        List[Dict]: One result per matching file, with 'show', 'file' (relative to the show),
+        'kind' and 'data' keys.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    conditions = _query_conditions(where)
+    results = []
+    for show_path in show_paths:
+        for document, document_kind in get_show_index(show_path, backend).query(where, kind):
+            try:
+                data = backend.read(os.path.join(show_path, document))
+            except (OSError, ValueError):
+                continue
+            if not isinstance(data, dict) or not _matches(data, conditions):
+                continue
+            if fields is not None:
+                data = {field: data[field] for field in fields if field in data}
+            results.append({"show": os.path.basename(os.path.normpath(show_path)), "file": document,
+                            "kind": document_kind, "data": data})
+    return results
+
+
+def _as_name_list(values) -> List[str]:
+    if not isinstance(values, list):
+        return []
+    return list(dict.fromkeys(value for value in values if isinstance(value, str)))
+
+
+def get_show_index(show_path: str, backend=None) -> ShowIndex:
+    """
+    Get the shared index for a show, opening it on first use.
+
+    Args:
+        show_path (str): The path of the show directory.
+        backend (JsonTreeBackend | SQLiteBackend, optional): The backend holding the show's documents.
+
+    Returns:
+        ShowIndex: The index of the show.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    key = backend.index_key(show_path)
+    with _open_indexes_lock:
+        index = _open_indexes.get(key)
+        if index is None:
+            index = ShowIndex(show_path, backend)
+            _open_indexes[key] = index
+        return index
+
+
+def close_show_index(show_path: str, backend=None) -> None:
+    """
+    Close the shared index for a show, e.g. before the show directory is deleted.
+
+    Args:
+        show_path (str): The path of the show directory.
+        backend (JsonTreeBackend | SQLiteBackend, optional): The backend holding the show's documents.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    with _open_indexes_lock:
+        index = _open_indexes.pop(backend.index_key(show_path), None)
+    if index is not None:
+        index.close()
+
+
+def close_show_indexes(directory_path: str, backend=None) -> None:
+    """
+    Close the shared indexes of every show at or below a directory, e.g. before the directory is deleted.
+
+    Args:
+        directory_path (str): The directory being removed.
+        backend (JsonTreeBackend | SQLiteBackend, optional): The backend holding the shows' documents.
+    """
+    prefix = os.path.join(os.path.abspath(directory_path), "")
+    with _open_indexes_lock:
+        show_paths = {index.show_path for index in _open_indexes.values()
+                      if os.path.join(os.path.abspath(index.show_path), "").startswith(prefix)}
+    for show_path in show_paths:
+        close_show_index(show_path, backend)
+
+
+def find_asset_folder_show(directory_path: str, folder_name: str, backend=None) -> tuple:
+    """
+    Find the show whose index lists the assets of a folder that is about to change wholesale.
+
+    That is the nearest directory above the folder, up to 'directory_path', with an open or
+    stored show index. Shows without an index are skipped, since their index is built from
+    the files when first used.
+
+    Args:
+        directory_path (str): The base directory path of the AssetManager.
+        folder_name (str): The asset folder name, e.g. 'Dogs/Prop'.
+        backend (JsonTreeBackend | SQLiteBackend, optional): The backend holding the show's documents.
+
+    Returns:
+        tuple: The show directory path and the category path, e.g. ('<base>/Dogs', 'Prop'), or (None, None).
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    parts = [part for part in folder_name.replace("\\", "/").split("/") if part]
+    for depth in range(len(parts) - 1, -1, -1):
+        show_path = os.path.join(directory_path, *parts[:depth])
+        with _open_indexes_lock:
+            is_open = backend.index_key(show_path) in _open_indexes
+        if is_open or backend.has_index(show_path):
+            return show_path, "/".join(parts[depth:])
+    return None, None
+
+# ==================================================================================== END INDEX ====================================================================================
+
+
+# ==================================================================================== BEGIN CODECS ====================================================================================
+
+BINARY_MAGIC = b"\x00SSB"  # can't start a JSON document
+SIDECAR_SUFFIX = ".showshot-bin"
+_SIDECAR_HEADER = struct.Struct("<qq")  # the mtime_ns and size of the JSON file the sidecar was made from
+
+
+class JsonCodec:
+    binary = False
+
+    def __init__(self, indent: int = 4):
+        """
+        Serialize documents as JSON with the standard library.
+
+        Args:
+            indent (int, optional): The indentation of the pretty-printed output, or None for compact output.
+        """
+        self.indent = indent
+        self.separators = None if indent is not None else (",", ":")
+
+    def encode(self, data: Dict) -> bytes:
+        return json.dumps(data, indent=self.indent, separators=self.separators).encode('utf-8')
+
+    def decode(self, payload: bytes) -> Dict:
+        return json.loads(payload)
+
+
+class FastJsonCodec:
+    binary = False
+
+    def encode(self, data: Dict) -> bytes:
+        """
+        Serialize documents as compact JSON, with orjson when it is installed.
+        """
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(",", ":")).encode('utf-8')
+
+    def decode(self, payload: bytes) -> Dict:
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+class BinaryCodec:
+    binary = True
+
+    @staticmethod
+    def available() -> bool:
+        return msgpack is not None
+
+    def encode(self, data: Dict) -> bytes:
+        """
+        Serialize documents with msgpack for machine-only storage. The payload starts with
+        BINARY_MAGIC and the format used. Needs msgpack to be installed.
+        """
+        if msgpack is None:
+            raise ValueError("Binary documents need msgpack (pip install msgpack).")
+        return BINARY_MAGIC + b"m" + msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> Dict:
+        # Binary documents can come from other machines through the shared tree, so anything
+        # malformed must end in ValueError: msgpack checks its input, unlike marshal or pickle.
+        if not payload.startswith(BINARY_MAGIC) or len(payload) <= len(BINARY_MAGIC):
+            raise ValueError("Not a binary document.")
+        if payload[len(BINARY_MAGIC):len(BINARY_MAGIC) + 1] != b"m":
+            raise ValueError("The binary document was written in a format this library doesn't read.")
+        if msgpack is None:
+            raise ValueError("Binary documents need msgpack (pip install msgpack).")
+        try:
+            return msgpack.unpackb(payload[len(BINARY_MAGIC) + 1:], raw=False)
+        except (ValueError, TypeError) as error:
+            raise ValueError(f"Corrupt binary document: {error}") from None
+
+
+CODECS = {
+    "json": JsonCodec(indent=4),
+    "compact": JsonCodec(indent=None),
+    "fast": FastJsonCodec(),
+    "binary": BinaryCodec(),
+}
+
+
+def get_codec(codec):
+    """
+    Get a codec by name.
+
+    Args:
+        codec (str | JsonCodec | FastJsonCodec | BinaryCodec): 'json' (pretty-printed, the default for files),
+            'compact', 'fast' (orjson when installed) or 'binary' (needs msgpack), or a codec object.
+
+    Returns:
+        JsonCodec | FastJsonCodec | BinaryCodec: The codec.
+    """
+    if not isinstance(codec, str):
+        return codec
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec '{codec}'. Use one of {sorted(CODECS)}.")
+    if CODECS[codec].binary and not BinaryCodec.available():
+        raise ValueError(f"The '{codec}' codec needs msgpack (pip install msgpack).")
+    return CODECS[codec]
+
+
+def decode_document(payload: bytes, codec=None) -> Dict:
+    """
+    Parse a stored document, whichever codec wrote it.
+
+    Args:
+        payload (bytes): The stored document.
+        codec (optional): The codec to parse JSON with. Defaults to the standard library.
+
+    Returns:
+        Dict: The document.
+    """
+    if payload[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        return CODECS["binary"].decode(payload)
+    return (codec or CODECS["json"]).decode(payload)
+
+
+def sidecar_path(path: str) -> str:
+    """
+    Get the path of the hidden binary sidecar of a JSON file.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        str: The sidecar path, e.g. '<dir>/.doggo1_info.json.showshot-bin'.
+    """
+    directory, file_name = os.path.split(path)
+    return os.path.join(directory, f".{file_name}{SIDECAR_SUFFIX}")
+
+# ==================================================================================== END CODECS ====================================================================================
+
+
+# ==================================================================================== BEGIN STORAGE ====================================================================================
+
+# The number of names a catalog listing fetches per query.
+LISTING_BATCH_SIZE = 1000
+
+
+def _listed(name: str, pattern: str, after: str, descending: bool) -> bool:
+    if after is not None and (name >= after if descending else name <= after):
+        return False
+    return not pattern or fnmatch.fnmatchcase(name, pattern)
+
+
+class CatalogConnection:
+    def __init__(self, database_path: str):
+        """
+        Open a SQLite database shared by several threads, with nestable transactions.
+
+        Args:
+            database_path (str): The path of the SQLite database file.
+        """
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.lock = threading.RLock()
+        self.depth = 0
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Group every statement run inside the block into one transaction.
+
+        Nested blocks join the outermost transaction, which commits when it exits
+        and rolls back if an exception escapes it.
+        """
+        with self.lock:
+            if self.depth == 0:
+                self.connection.execute("BEGIN IMMEDIATE")
+            self.depth += 1
+            try:
+                yield self
+            except BaseException:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.connection.execute("ROLLBACK")
+                raise
+            self.depth -= 1
+            if self.depth == 0:
+                self.connection.execute("COMMIT")
+
+    def execute(self, sql: str, parameters: tuple = ()) -> None:
+        """
+        Run a single statement.
+
+        Args:
+            sql (str): The SQL statement.
+            parameters (tuple): The statement parameters.
+        """
+        with self.lock:
+            self.connection.execute(sql, parameters)
+
+    def executemany(self, sql: str, rows: list) -> None:
+        """
+        Run a statement once per row.
+
+        Args:
+            sql (str): The SQL statement.
+            rows (list): A list of parameter tuples.
+        """
+        with self.lock:
+            self.connection.executemany(sql, rows)
+
+    def query(self, sql: str, parameters: tuple = ()) -> list:
+        """
+        Run a query and fetch every row.
+
+        Args:
+            sql (str): The SQL query.
+            parameters (tuple): The query parameters.
+
+        Returns:
+            list: A list of row tuples.
+        """
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self.lock:
+            self.connection.close()
+
+
+class JsonTreeBackend:
+    # Each document is its own file, so batches can be written by several threads at once
+    # (they join the caller's transaction through share_transaction).
+    parallel_writes = True
+
+    def __init__(self, durability: str = "atomic", codec: str = "json", sidecar: bool = False):
+        """
+        Store every document as a pretty-printed JSON file in the directory tree.
+
+        This is the default backend and the layout the rest of the pipeline reads directly.
+        Files are never rewritten in place: each write goes to a temporary file that replaces
+        the old one in a single rename, so readers and crashes never see a partial document.
+
+        Args:
+            durability (str): 'atomic' to rename without fsync (the default), 'fsync' to fsync
+                every write, or 'group' to stage the writes a thread makes inside transaction()
+                and fsync them together when it ends (writes outside a transaction are fsynced
+                one by one).
+            codec (str): How files are written: 'json' (indented, the default), 'compact' or 'fast'.
+                Files stay JSON, so every codec reads every file.
+            sidecar (bool): Also keep a hidden binary copy of each file, used by reads for as long
+                as the JSON file's mtime and size match the ones it was made from. Needs msgpack.
+        """
+        if durability not in ("atomic", "fsync", "group"):
+            raise ValueError(f"Unknown durability '{durability}'. Use 'atomic', 'fsync' or 'group'.")
+        self.codec = get_codec(codec)
+        if self.codec.binary:
+            raise ValueError("The directory tree holds JSON files; use sidecar=True for binary copies.")
+        if sidecar and not BinaryCodec.available():
+            raise ValueError("Binary sidecars need msgpack (pip install msgpack).")
+        self.sidecar = sidecar
+        self.durability = durability
+        self.lock = threading.Lock()
+        # Each thread's open transactions, outermost first, as {path: temporary file waiting for the group commit}.
+        self.transactions = threading.local()
+        self.locked_paths = set()  # documents under a DocumentLock are never staged
+
+    def _open_transactions(self) -> list:
+        stack = getattr(self.transactions, "stack", None)
+        if stack is None:
+            stack = self.transactions.stack = []
+        return stack
+
+    def _staged_path(self, path: str) -> str:
+        # The calling thread sees the writes its own open transactions staged, the innermost first.
+        for staged in reversed(getattr(self.transactions, "stack", None) or ()):
+            temp_path = staged.get(path)
+            if temp_path is not None:
+                return temp_path
+        return None
+
+    def _staged_names(self, path: str) -> List[str]:
+        with self.lock:
+            return list({os.path.basename(file_path) for staged in getattr(self.transactions, "stack", None) or ()
+                         for file_path in staged if os.path.dirname(file_path) == path})
+
+    def exists(self, path: str) -> bool:
+        return self._staged_path(path) is not None or os.path.exists(path)
+
+    def is_file(self, path: str) -> bool:
+        return self._staged_path(path) is not None or os.path.isfile(path)
+
+    def is_dir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def make_dirs(self, path: str) -> None:
+        os.makedirs(path, exist_ok=True)
+
+    def list_dirs(self, path: str) -> List[str]:
+        return [entry.name for entry in os.scandir(path) if entry.is_dir()]
+
+    def list_files(self, path: str) -> List[str]:
+        files = [entry.name for entry in os.scandir(path) if entry.is_file() and _is_tree_file(entry.name)]
+        files.extend(name for name in self._staged_names(path) if name not in files)
+        return files
+
+    def iter_names(self, path: str, directories: bool = False, pattern: str = None, after: str = None,
+                   descending: bool = False):
+        """
+        Yield the names of the files (or directories) in a directory as os.scandir finds them, in no particular order.
+
+        The entry types come from the directory listing itself, so no file is stat'ed.
+
+        Args:
+            path (str): The directory to list.
+            directories (bool): Yield directory names instead of file names.
+            pattern (str, optional): Only yield names matching this glob pattern, e.g. '*.json'.
+            after (str, optional): Only yield names after this one (before it when descending).
+            descending (bool): Whether 'after' counts from the end of the alphabet.
+        """
+        try:
+            entries = os.scandir(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        match = re.compile(fnmatch.translate(pattern)).match if pattern else None
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if after is not None and (name >= after if descending else name <= after):
+                    continue
+                if (match is None or match(name)) and (entry.is_dir() if directories else entry.is_file() and _is_tree_file(name)):
+                    yield name
+        if not directories:
+            for name in self._staged_names(path):
+                if not os.path.exists(os.path.join(path, name)) and _listed(name, pattern, after, descending):
+                    yield name
+
+    def read(self, path: str) -> Dict:
+        path = self._staged_path(path) or path
+        if self.sidecar:
+            return self._read_with_sidecar(path)
+        with open(path, 'rb') as file:
+            payload = file.read()
+        METRICS.count(files_opened=1, bytes_read=len(payload))
+        return self.codec.decode(payload)
+
+    def write(self, path: str, data: Dict) -> None:
+        payload = self.codec.encode(data)
+        stack = getattr(self.transactions, "stack", None)
+        if self.durability == "group" and stack and path not in self.locked_paths:
+            temp_path = _write_temp_file(path, payload)
+            with self.lock:
+                previous = stack[-1].pop(path, None)
+                stack[-1][path] = temp_path
+            if previous is not None:
+                os.remove(previous)
+            return
+        atomic_write(path, payload, fsync=self.durability != "atomic")
+        if self.sidecar:
+            self._write_sidecar(path, data)
+
+    def delete(self, path: str) -> None:
+        with self.lock:
+            temp_paths = [staged.pop(path) for staged in getattr(self.transactions, "stack", None) or () if path in staged]
+        for temp_path in temp_paths[:-1]:
+            os.remove(temp_path)
+        temp_path = temp_paths[-1] if temp_paths else None
+        if self.sidecar:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(sidecar_path(path))
+        if temp_path is not None:
+            os.remove(temp_path)
+            if not os.path.exists(path):
+                return
+        os.remove(path)
+
+    def _read_with_sidecar(self, path: str) -> Dict:
+        stat = os.stat(path)
+        try:
+            with open(sidecar_path(path), 'rb') as file:
+                payload = file.read()
+            METRICS.count(files_opened=1, bytes_read=len(payload))
+            if _SIDECAR_HEADER.unpack_from(payload) == (stat.st_mtime_ns, stat.st_size):
+                return CODECS["binary"].decode(payload[_SIDECAR_HEADER.size:])
+        except (OSError, ValueError, struct.error):
+            pass
+        with open(path, 'rb') as file:
+            payload = file.read()
+        METRICS.count(files_opened=1, bytes_read=len(payload))
+        data = self.codec.decode(payload)
+        self._write_sidecar(path, data, stat)
+        return data
+
+    def _write_sidecar(self, path: str, data: Dict, stat: os.stat_result = None) -> None:
+        # Best effort: a missing or stale sidecar only means the JSON file is parsed instead.
+        try:
+            stat = stat or os.stat(path)
+            header = _SIDECAR_HEADER.pack(stat.st_mtime_ns, stat.st_size)
+            atomic_write(sidecar_path(path), header + CODECS["binary"].encode(data))
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def signature(self, path: str) -> tuple:
+        stat = os.stat(self._staged_path(path) or path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @contextlib.contextmanager
+    def lock_document(self, path: str, timeout: float = 10.0):
+        """
+        Hold an advisory lock on a document, shared with every process using this library.
+        """
+        with DocumentLock(path, timeout):
+            with self.lock:
+                self.locked_paths.add(path)
+            try:
+                yield
+            finally:
+                with self.lock:
+                    self.locked_paths.discard(path)
+
+    def read_versioned(self, path: str) -> tuple:
+        with open(self._staged_path(path) or path, 'rb') as file:
+            payload = file.read()
+        return self.codec.decode(payload), _etag(payload)
+
+    def remove_tree(self, path: str) -> None:
+        shutil.rmtree(path)
+
+    def walk(self, path: str):
+        """
+        Walk a directory like os.walk, hiding the backend's own index files.
+        """
+        for root, dirs, files in os.walk(path):
+            yield root, dirs, [file for file in files if _is_tree_file(file)]
+
+    def archive_source(self, path: str) -> str:
+        # ArchiveWriter reads (or streams) the file itself.
+        return path
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Group the writes the calling thread makes inside the block.
+
+        With 'group' durability the writes are staged and committed together when the
+        thread's outermost block ends: every staged file is fsynced (in parallel), renamed
+        into place, and each directory touched is fsynced once. If an exception escapes a
+        block, the writes staged inside it are discarded; a nested block that succeeds hands
+        its writes to the block around it. Writes from other threads are not part of the
+        transaction unless they run under share_transaction. With the other modes every
+        write commits on its own.
+        """
+        stack = self._open_transactions()
+        staged = {}
+        stack.append(staged)
+        failed = False
+        try:
+            yield self
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            stack.pop()
+            with self.lock:
+                superseded = []
+                if not failed and stack:
+                    superseded = [stack[-1][path] for path in staged if path in stack[-1]]
+                    stack[-1].update(staged)
+            for temp_path in superseded:
+                os.remove(temp_path)
+            if failed:
+                for temp_path in staged.values():
+                    os.remove(temp_path)
+            elif staged and not stack:
+                _commit_staged_files(staged)
+
+    def share_transaction(self):
+        """
+        Let other threads write into the calling thread's innermost transaction.
+
+        Example:
+            with backend.transaction():
+                join = backend.share_transaction()
+
+                def write(path):
+                    with join():
+                        backend.write(path, documents[path])
+
+                list(executor.map(write, documents))
+
+        Returns:
+            callable: Returns a context manager; the writes a thread makes inside it are staged
+            in the shared transaction. It must be used before that transaction ends.
+        """
+        stack = getattr(self.transactions, "stack", None)
+        shared = stack[-1] if stack else None
+
+        @contextlib.contextmanager
+        def join():
+            if shared is None:
+                yield
+                return
+            stack = self._open_transactions()
+            stack.append(shared)
+            try:
+                yield
+            finally:
+                stack.pop()
+
+        return join
+
+    def open_index(self, show_path: str) -> tuple:
+        os.makedirs(show_path, exist_ok=True)
+        return CatalogConnection(os.path.join(show_path, INDEX_FILE_NAME)), ""
+
+    def close_index(self, catalog: CatalogConnection) -> None:
+        catalog.close()
+
+    def index_key(self, show_path: str) -> tuple:
+        return (os.path.realpath(os.path.join(show_path, INDEX_FILE_NAME)), "")
+
+    def has_index(self, show_path: str) -> bool:
+        return os.path.exists(os.path.join(show_path, INDEX_FILE_NAME))
+
+
+class SQLiteBackend:
+    # iter_names yields names in order, so a page only needs its first rows.
+    sorted_listing = True
+
+    def __init__(self, catalog_path: str, root_path: str, codec: str = "compact"):
+        """
+        Store every document in an embedded SQLite catalog instead of the directory tree.
+
+        Paths given to the backend keep their usual form (e.g. '<root>/Dogs/doggo1_info.json')
+        and are stored relative to the root path, so the managers work unchanged. Listings
+        go through indexed 'parent' columns, and writes grouped with 'transaction()' commit
+        together or not at all.
+
+        Args:
+            catalog_path (str): The path of the SQLite catalog file.
+            root_path (str): The directory the catalog stands in for, e.g. '<base>/Animal_Kingdom'.
+            codec (str): How documents are stored: 'compact' JSON (the default), 'fast' or 'binary' (needs msgpack).
+                Documents written with any codec can be read back whatever the setting.
+        """
+        self.codec = get_codec(codec)
+        self.catalog_path = catalog_path
+        self.root_path = os.path.abspath(root_path)
+        self.catalog = CatalogConnection(catalog_path)
+        with self.catalog.transaction():
+            self.catalog.execute("CREATE TABLE IF NOT EXISTS directories (path TEXT PRIMARY KEY, parent TEXT NOT NULL)")
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS directories_parent ON directories (parent)")
+            self.catalog.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "path TEXT PRIMARY KEY, parent TEXT NOT NULL, name TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS documents_parent ON documents (parent)")
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS documents_parent_name ON documents (parent, name)")
+            self.catalog.execute("CREATE INDEX IF NOT EXISTS directories_parent_path ON directories (parent, path)")
+
+    def close(self) -> None:
+        """
+        Close the catalog.
+        """
+        self.catalog.close()
+
+    def exists(self, path: str) -> bool:
+        return self.is_dir(path) or self.is_file(path)
+
+    def is_file(self, path: str) -> bool:
+        return bool(self.catalog.query("SELECT 1 FROM documents WHERE path = ?", (self._key(path),)))
+
+    def is_dir(self, path: str) -> bool:
+        key = self._key(path)
+        return key == "" or bool(self.catalog.query("SELECT 1 FROM directories WHERE path = ?", (key,)))
+
+    def make_dirs(self, path: str) -> None:
+        key = self._key(path)
+        rows = []
+        while key:
+            rows.append((key, posixpath.dirname(key)))
+            key = posixpath.dirname(key)
+        with self.catalog.transaction():
+            self.catalog.executemany("INSERT OR IGNORE INTO directories VALUES (?, ?)", rows)
+
+    def list_dirs(self, path: str) -> List[str]:
+        rows = self.catalog.query("SELECT path FROM directories WHERE parent = ? ORDER BY path", (self._key(path),))
+        return [posixpath.basename(row[0]) for row in rows]
+
+    def list_files(self, path: str) -> List[str]:
+        rows = self.catalog.query("SELECT name FROM documents WHERE parent = ? ORDER BY name", (self._key(path),))
+        return [row[0] for row in rows]
+
+    def iter_names(self, path: str, directories: bool = False, pattern: str = None, after: str = None,
+                   descending: bool = False):
+        """
+        Yield the names of the documents (or directories) in a directory, in name order.
+
+        Names are fetched LISTING_BATCH_SIZE at a time, each batch starting after the last name
+        of the previous one, so the first names arrive without reading the whole directory.
+        The pattern is matched by SQLite for documents.
+
+        Args:
+            path (str): The directory to list.
+            directories (bool): Yield directory names instead of document names.
+            pattern (str, optional): Only yield names matching this glob pattern, e.g. '*.json'.
+            after (str, optional): Only yield names after this one (before it when descending).
+            descending (bool): Yield the names in reverse order.
+        """
+        parent = self._key(path)
+        prefix = f"{parent}/" if parent else ""
+        order, comparison = ("DESC", "<") if descending else ("ASC", ">")
+        while True:
+            if directories:
+                sql = "SELECT path FROM directories WHERE parent = ?"
+                parameters = [parent]
+                if after is not None:
+                    sql += f" AND path {comparison} ?"
+                    parameters.append(prefix + after)
+                sql += f" ORDER BY path {order} LIMIT {LISTING_BATCH_SIZE}"
+            else:
+                sql = "SELECT name FROM documents WHERE parent = ?"
+                parameters = [parent]
+                if after is not None:
+                    sql += f" AND name {comparison} ?"
+                    parameters.append(after)
+                if pattern:
+                    sql += " AND name GLOB ?"
+                    parameters.append(pattern)
+                sql += f" ORDER BY name {order} LIMIT {LISTING_BATCH_SIZE}"
+            names = [posixpath.basename(row[0]) for row in self.catalog.query(sql, tuple(parameters))]
+            for name in names:
+                if not directories or not pattern or fnmatch.fnmatchcase(name, pattern):
+                    yield name
+            if len(names) < LISTING_BATCH_SIZE:
+                return
+            after = names[-1]
+
+    def read(self, path: str) -> Dict:
+        rows = self.catalog.query("SELECT data FROM documents WHERE path = ?", (self._key(path),))
+        if not rows:
+            raise FileNotFoundError(f"No such document: '{path}'")
+        METRICS.count(bytes_read=len(rows[0][0]))
+        return self._decode(rows[0][0])
+
+    def write(self, path: str, data: Dict) -> None:
+        key = self._key(path)
+        parent = posixpath.dirname(key)
+        payload = self._encode(data)
+        METRICS.count(bytes_written=len(payload))
+        with self.catalog.transaction():
+            if parent:
+                self.make_dirs(self._path(parent))
+            self.catalog.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                (key, parent, posixpath.basename(key), payload),
+            )
+
+    def delete(self, path: str) -> None:
+        with self.catalog.transaction():
+            self.catalog.execute("DELETE FROM documents WHERE path = ?", (self._key(path),))
+
+    def signature(self, path: str) -> tuple:
+        # Documents only change through this catalog, so there is nothing to compare.
+        return None
+
+    def lock_document(self, path: str, timeout: float = 10.0):
+        # An immediate transaction already keeps every other writer out of the catalog.
+        return self.catalog.transaction()
+
+    def read_versioned(self, path: str) -> tuple:
+        rows = self.catalog.query("SELECT data FROM documents WHERE path = ?", (self._key(path),))
+        if not rows:
+            raise FileNotFoundError(f"No such document: '{path}'")
+        payload = rows[0][0] if isinstance(rows[0][0], bytes) else rows[0][0].encode('utf-8')
+        return self._decode(rows[0][0]), _etag(payload)
+
+    def remove_tree(self, path: str) -> None:
+        key = self._key(path)
+        prefix = f"{key}/" if key else ""
+        with self.catalog.transaction():
+            for table in ("documents", "directories"):
+                self.catalog.execute(
+                    f"DELETE FROM {table} WHERE path = ? OR substr(path, 1, ?) = ?", (key, len(prefix), prefix)
+                )
+            # Shows stored under the removed folder take their index rows with them.
+            if self.catalog.query("SELECT 1 FROM sqlite_master WHERE name = 'refs'"):
+                for table in ("refs", "fields", "indexed_shows"):
+                    self.catalog.execute(
+                        f"DELETE FROM {table} WHERE show = ? OR substr(show, 1, ?) = ?", (key, len(prefix), prefix)
+                    )
+
+    def walk(self, path: str):
+        """
+        Walk a catalog directory like os.walk (top-down, honouring in-place edits of 'dirs').
+        """
+        if not self.is_dir(path):
+            return
+        pending = [self._key(path)]
+        while pending:
+            key = pending.pop()
+            dirs = self.list_dirs(self._path(key))
+            yield self._path(key), dirs, self.list_files(self._path(key))
+            pending.extend(posixpath.join(key, name) if key else name for name in reversed(dirs))
+
+    def archive_source(self, path: str) -> bytes:
+        return json.dumps(self.read(path), indent=4).encode('utf-8')
+
+    def transaction(self):
+        """
+        Group several writes into one catalog transaction.
+        """
+        return self.catalog.transaction()
+
+    def open_index(self, show_path: str) -> tuple:
+        return self.catalog, self._key(show_path)
+
+    def close_index(self, catalog: CatalogConnection) -> None:
+        # The index lives in the catalog, which stays open.
+        pass
+
+    def index_key(self, show_path: str) -> tuple:
+        return (os.path.realpath(self.catalog_path), self._key(show_path))
+
+    def has_index(self, show_path: str) -> bool:
+        try:
+            key = self._key(show_path)
+        except ValueError:
+            return False
+        return (bool(self.catalog.query("SELECT 1 FROM sqlite_master WHERE name = 'indexed_shows'"))
+                and bool(self.catalog.query("SELECT 1 FROM indexed_shows WHERE show = ?", (key,))))
+
+    def import_tree(self, source_path: str = None) -> int:
+        """
+        Load an existing directory-of-JSON layout into the catalog, replacing its contents.
+
+        Args:
+            source_path (str, optional): The directory to import. Defaults to the catalog root path.
+
+        Returns:
+            int: The number of JSON documents imported.
+        """
+        source_path = os.path.abspath(source_path or self.root_path)
+        directories = []
+        documents = []
+        for root, dirs, files in os.walk(source_path):
+            key = os.path.relpath(root, source_path).replace("\\", "/")
+            key = "" if key == "." else key
+            if key:
+                directories.append((key, posixpath.dirname(key)))
+            for file_name in files:
+                if not file_name.endswith(".json"):
+                    continue
+                with open(os.path.join(root, file_name), 'rb') as file:
+                    data = CODECS["fast"].decode(file.read())
+                document_key = posixpath.join(key, file_name) if key else file_name
+                documents.append((document_key, key, file_name, self._encode(data)))
+
+        with self.catalog.transaction():
+            self.remove_tree(self.root_path)
+            self.catalog.executemany("INSERT INTO directories VALUES (?, ?)", directories)
+            self.catalog.executemany("INSERT INTO documents VALUES (?, ?, ?, ?)", documents)
+            # The shared indexes of the catalog's shows lost their rows; they are rebuilt when next opened.
+            catalog_path = os.path.realpath(self.catalog_path)
+            with _open_indexes_lock:
+                show_keys = [key[1] for key in _open_indexes if key[0] == catalog_path]
+            for show_key in show_keys:
+                close_show_index(self._path(show_key), self)
+        return len(documents)
+
+    def export_tree(self, destination_path: str = None) -> int:
+        """
+        Write the catalog out as the usual directory-of-JSON layout.
+
+        Args:
+            destination_path (str, optional): The directory to write to. Defaults to the catalog root path.
+
+        Returns:
+            int: The number of JSON documents exported.
+        """
+        destination_path = destination_path or self.root_path
+        os.makedirs(destination_path, exist_ok=True)
+        for (key,) in self.catalog.query("SELECT path FROM directories ORDER BY path"):
+            os.makedirs(os.path.join(destination_path, *key.split("/")), exist_ok=True)
+
+        count = 0
+        for key, data in self.catalog.query("SELECT path, data FROM documents ORDER BY path"):
+            atomic_write(os.path.join(destination_path, *key.split("/")), CODECS["json"].encode(self._decode(data)))
+            count += 1
+        return count
+
+    def _encode(self, data: Dict):
+        # JSON is stored as text, so the catalog stays readable with the sqlite3 shell; binary as a blob.
+        payload = self.codec.encode(data)
+        return payload if self.codec.binary else payload.decode('utf-8')
+
+    def _decode(self, stored) -> Dict:
+        if isinstance(stored, bytes):
+            return decode_document(stored, CODECS["fast"])
+        return CODECS["fast"].decode(stored)
+
+    def _key(self, path: str) -> str:
+        relative_path = os.path.relpath(os.path.abspath(path), self.root_path).replace("\\", "/")
+        if relative_path == ".":
+            return ""
+        if relative_path == ".." or relative_path.startswith("../"):
+            raise ValueError(f"Path '{path}' is outside the catalog root '{self.root_path}'.")
+        return relative_path
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root_path, *key.split("/")) if key else self.root_path
+
+
+class ArchiveBackend:
+    sorted_listing = True
+
+    def __init__(self, zip_file_path: str, root_path: str):
+        """
+        Serve a zipped show (or asset folder) to the managers without extracting it.
+
+        The archive stands in for the directory it was made from, so a ShotManager or
+        AssetManager pointed at that directory reads straight from the archive. The
+        archive is read-only, and its show index is built in memory on first lookup.
+
+        Args:
+            zip_file_path (str): The path of the ZIP archive, e.g. made by ShowManager.zip_show.
+            root_path (str): The directory the archive was made from, e.g. '<base>/Animal_Kingdom/Dogs'.
+        """
+        self.zip_file_path = zip_file_path
+        self.root_path = os.path.abspath(root_path)
+        self.reader = open_archive(zip_file_path)
+        self.catalog = None
+        self.directories = {"": set()}
+        self.files = {"": []}
+        for member_name in self.reader.members:
+            if member_name == ARCHIVE_MANIFEST_NAME:
+                continue
+            parent = posixpath.dirname(member_name)
+            self.files.setdefault(parent, []).append(posixpath.basename(member_name))
+            while parent:
+                self.files.setdefault(parent, [])
+                self.directories.setdefault(parent, set())
+                self.directories[posixpath.dirname(parent)].add(posixpath.basename(parent))
+                parent = posixpath.dirname(parent)
+
+    def exists(self, path: str) -> bool:
+        return self.is_dir(path) or self.is_file(path)
+
+    def is_file(self, path: str) -> bool:
+        key = self._key(path)
+        return key is not None and key in self.reader.members
+
+    def is_dir(self, path: str) -> bool:
+        return self._key(path) in self.directories
+
+    def make_dirs(self, path: str) -> None:
+        if not self.is_dir(path):
+            self._read_only(path)
+
+    def list_dirs(self, path: str) -> List[str]:
+        return sorted(self.directories.get(self._key(path), ()))
+
+    def list_files(self, path: str) -> List[str]:
+        return sorted(self.files.get(self._key(path), ()))
+
+    def iter_names(self, path: str, directories: bool = False, pattern: str = None, after: str = None,
+                   descending: bool = False):
+        """
+        Yield the names of the files (or directories) in an archive directory, in name order.
+        """
+        names = self.list_dirs(path) if directories else self.list_files(path)
+        for name in (reversed(names) if descending else names):
+            if _listed(name, pattern, after, descending):
+                yield name
+
+    def read(self, path: str) -> Dict:
+        key = self._key(path)
+        if key not in self.reader.members:
+            raise FileNotFoundError(f"No such member in '{self.zip_file_path}': '{path}'")
+        return _copy_document(self.reader.read_json(key))
+
+    def write(self, path: str, data: Dict) -> None:
+        self._read_only(path)
+
+    def delete(self, path: str) -> None:
+        self._read_only(path)
+
+    def signature(self, path: str) -> tuple:
+        return self.reader.signature
+
+    def remove_tree(self, path: str) -> None:
+        self._read_only(path)
+
+    def walk(self, path: str):
+        """
+        Walk an archive directory like os.walk.
+        """
+        if not self.is_dir(path):
+            return
+        pending = [self._key(path)]
+        while pending:
+            key = pending.pop()
+            dirs = sorted(self.directories[key])
+            yield self._path(key), dirs, sorted(self.files[key])
+            pending.extend(posixpath.join(key, name) if key else name for name in reversed(dirs))
+
+    def archive_source(self, path: str) -> bytes:
+        return self.reader.read_bytes(self._key(path))
+
+    @contextlib.contextmanager
+    def transaction(self):
+        yield self
+
+    def open_index(self, show_path: str) -> tuple:
+        if self.catalog is None:
+            self.catalog = CatalogConnection(":memory:")
+        return self.catalog, self._key(show_path) or ""
+
+    def close_index(self, catalog: CatalogConnection) -> None:
+        pass
+
+    def index_key(self, show_path: str) -> tuple:
+        return (os.path.realpath(self.zip_file_path), id(self), self._key(show_path))
+
+    def has_index(self, show_path: str) -> bool:
+        # Archive indexes only live in memory, while they are open.
+        return False
+
+    def _read_only(self, path: str) -> None:
+        raise PermissionError(f"Archive '{self.zip_file_path}' is read-only, cannot modify '{path}'.")
+
+    def _key(self, path: str) -> str:
+        relative_path = os.path.relpath(os.path.abspath(path), self.root_path).replace("\\", "/")
+        if relative_path == ".":
+            return ""
+        if relative_path == ".." or relative_path.startswith("../"):
+            return None
+        return relative_path
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root_path, *key.split("/")) if key else self.root_path
+
+class CachedBackend:
+    def __init__(self, backend=None, max_entries: int = 10000, max_dirty: int = 1000, flush_interval: float = 5.0):
+        """
+        Keep parsed documents in memory and batch their writes, in front of another backend.
+
+        Share one CachedBackend between a ShowManager, ShotManager and AssetManager so they
+        see the same documents. Reads are served from a bounded LRU and checked against the
+        file's mtime and size, so edits made on disk are picked up. Writes only mark the
+        document dirty. Dirty documents are written out by flush(), by close() or when the
+        block of a 'with' statement ends, and once 'max_dirty' documents have built up.
+        A background thread, started by the first write and stopped by close(), writes out
+        documents left dirty for 'flush_interval' seconds.
+
+        Args:
+            backend (JsonTreeBackend | SQLiteBackend, optional): The backend being cached. Defaults to the JSON directory tree.
+            max_entries (int): The maximum number of documents held in memory.
+            max_dirty (int): Flush once this many documents are waiting to be written.
+            flush_interval (float): Flush once the oldest unwritten document is this many seconds old.
+                None leaves dirty documents until the next flush() or close().
+        """
+        self.backend = backend if backend is not None else JsonTreeBackend()
+        self.max_entries = max_entries
+        self.max_dirty = max_dirty
+        self.flush_interval = flush_interval
+        self.entries = collections.OrderedDict()  # path -> [document, signature]
+        self.dirty = collections.OrderedDict()  # path -> time first marked dirty
+        self.lock = threading.RLock()
+        self.flusher = None
+        self.flusher_wakeup = threading.Condition(self.lock)
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "flushes": 0, "documents_flushed": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the background flusher and write out every dirty document.
+
+        The cache stays usable; the next write starts the flusher again.
+        """
+        with self.lock:
+            flusher, self.flusher = self.flusher, None
+            self.flusher_wakeup.notify_all()
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+
+    def stats(self) -> Dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dict: The hits, misses, evictions, flushes and documents_flushed counters,
+            plus the current number of cached and dirty documents.
+        """
+        with self.lock:
+            return dict(self.counters, entries=len(self.entries), dirty=len(self.dirty))
+
+    def flush(self) -> int:
+        """
+        Write every dirty document to the underlying backend.
+
+        Returns:
+            int: The number of documents written.
+        """
+        with self.lock:
+            if not self.dirty:
+                return 0
+            with self.backend.transaction():
+                for path in self.dirty:
+                    entry = self.entries[path]
+                    self.backend.write(path, entry[0])
+                    entry[1] = self.backend.signature(path)
+            count = len(self.dirty)
+            self.dirty.clear()
+            self.counters["flushes"] += 1
+            self.counters["documents_flushed"] += count
+            return count
+
+    def read(self, path: str) -> Dict:
+        key = os.path.abspath(path)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and (key in self.dirty or entry[1] == self._signature(key)):
+                self.entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return _copy_document(entry[0])
+
+            self.counters["misses"] += 1
+            signature = self._signature(key)
+            document = self.backend.read(key)
+            self._store(key, document, signature)
+            return _copy_document(document)
+
+    def write(self, path: str, data: Dict) -> None:
+        key = os.path.abspath(path)
+        with self.lock:
+            self._store(key, _copy_document(data), None)
+            self.dirty.setdefault(key, time.monotonic())
+            if len(self.dirty) >= self.max_dirty:
+                self.flush()
+            elif self.flush_interval is not None:
+                if self.flusher is None:
+                    self.flusher = threading.Thread(target=self._flush_periodically, name="CachedBackend flusher", daemon=True)
+                    self.flusher.start()
+                self.flusher_wakeup.notify()
+
+    def exists(self, path: str) -> bool:
+        with self.lock:
+            return os.path.abspath(path) in self.dirty or self.backend.exists(path)
+
+    def is_file(self, path: str) -> bool:
+        with self.lock:
+            return os.path.abspath(path) in self.dirty or self.backend.is_file(path)
+
+    def is_dir(self, path: str) -> bool:
+        return self.backend.is_dir(path)
+
+    def make_dirs(self, path: str) -> None:
+        self.backend.make_dirs(path)
+
+    def list_dirs(self, path: str) -> List[str]:
+        return self.backend.list_dirs(path)
+
+    def list_files(self, path: str) -> List[str]:
+        self.flush()
+        return self.backend.list_files(path)
+
+    @property
+    def sorted_listing(self) -> bool:
+        return getattr(self.backend, "sorted_listing", False)
+
+    def iter_names(self, path: str, directories: bool = False, pattern: str = None, after: str = None,
+                   descending: bool = False):
+        if not directories:
+            self.flush()
+        return self.backend.iter_names(path, directories, pattern, after, descending)
+
+    def delete(self, path: str) -> None:
+        key = os.path.abspath(path)
+        with self.lock:
+            self.flush()
+            self.entries.pop(key, None)
+            self.backend.delete(path)
+
+    def signature(self, path: str) -> tuple:
+        self.flush()
+        return self.backend.signature(path)
+
+    def invalidate(self, path: str, tree: bool = False) -> None:
+        """
+        Drop a document from the cache, writing it out first if it is dirty.
+
+        Args:
+            path (str): The path of the document.
+            tree (bool): Drop every document below the directory 'path' instead.
+        """
+        key = os.path.abspath(path)
+        with self.lock:
+            if not tree:
+                if key in self.dirty:
+                    self.flush()
+                self.entries.pop(key, None)
+                return
+            prefix = os.path.join(key, "")
+            if any(dirty_path.startswith(prefix) for dirty_path in self.dirty):
+                self.flush()
+            for cached_path in [cached_path for cached_path in self.entries if cached_path.startswith(prefix)]:
+                del self.entries[cached_path]
+
+    def remove_tree(self, path: str) -> None:
+        prefix = os.path.join(os.path.abspath(path), "")
+        with self.lock:
+            self.flush()
+            for key in [key for key in self.entries if key.startswith(prefix)]:
+                del self.entries[key]
+            self.backend.remove_tree(path)
+
+    def walk(self, path: str):
+        self.flush()
+        return self.backend.walk(path)
+
+    def archive_source(self, path: str):
+        self.flush()
+        return self.backend.archive_source(path)
+
+    def transaction(self):
+        return self.backend.transaction()
+
+    def open_index(self, show_path: str) -> tuple:
+        return self.backend.open_index(show_path)
+
+    def close_index(self, catalog: CatalogConnection) -> None:
+        self.backend.close_index(catalog)
+
+    def index_key(self, show_path: str) -> tuple:
+        return self.backend.index_key(show_path)
+
+    def has_index(self, show_path: str) -> bool:
+        return self.backend.has_index(show_path)
+
+    def _flush_periodically(self) -> None:
+        # Runs until close(), waking when documents become dirty and when the oldest one is due.
+        with self.lock:
+            while self.flusher is threading.current_thread():
+                if not self.dirty:
+                    self.flusher_wakeup.wait()
+                    continue
+                wait = self.flush_interval - (time.monotonic() - next(iter(self.dirty.values())))
+                if wait > 0:
+                    self.flusher_wakeup.wait(wait)
+                    continue
+                try:
+                    self.flush()
+                except Exception as error:
+                    _emit(f"Flushing {len(self.dirty)} cached documents failed: {error}", logging.ERROR)
+                    self.flusher_wakeup.wait(self.flush_interval)
+
+    def _signature(self, key: str) -> tuple:
+        try:
+            return self.backend.signature(key)
+        except OSError:
+            return ()
+
+    def _store(self, key: str, document: Dict, signature: tuple) -> None:
+        self.entries[key] = [document, signature]
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            oldest = next(iter(self.entries))
+            if oldest in self.dirty:
+                self.flush()
+            del self.entries[oldest]
+            self.counters["evictions"] += 1
+
+
+def _copy_document(value):
+    # JSON documents only hold dicts, lists and scalars, which makes this much cheaper than copy.deepcopy.
+    if isinstance(value, dict):
+        return {key: _copy_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_document(item) for item in value]
+    return value
+
+def _validate_file_name(file_name, extension: str = "") -> str:
+    if not isinstance(file_name, str) or not file_name:
+        return "A file name is required."
+    if "/" in file_name or "\\" in file_name or file_name in (".", ".."):
+        return f"File name '{file_name}' must not contain a path."
+    if extension and not file_name.endswith(extension):
+        return f"File name '{file_name}' must end with '{extension}'."
+    if file_name in ("description", "description.json"):
+        return "'description.json' is reserved for folder descriptions."
+    return None
+
+
+def _validate_document(data, list_key: str) -> str:
+    if not isinstance(data, dict):
+        return "The data must be a dictionary."
+    if not isinstance(data.get(list_key, []), list):
+        return f"The '{list_key}' key must be a list."
+    return None
+
+
+def _write_documents(backend, documents: Dict, workers: int = None) -> Dict:
+    """
+    Write many documents, in parallel when the backend allows it.
+
+    Args:
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend): The backend to write to.
+        documents (Dict): The data to write, keyed by path.
+        workers (int, optional): The number of writer threads. Defaults to the number of CPUs.
+
+    Returns:
+        Dict: The exception raised for each path that could not be written.
+    """
+    errors = {}
+
+    def write(path):
+        try:
+            backend.write(path, documents[path])
+        except Exception as error:
+            errors[path] = error
+
+    with backend.transaction():
+        if getattr(backend, "parallel_writes", False) and len(documents) > 1:
+            # The writer threads stage their writes in this thread's transaction.
+            join = backend.share_transaction()
+
+            @_with_captured_messages
+            def write_joined(path):
+                with join():
+                    write(path)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+                list(executor.map(write_joined, documents))
+        else:
+            for path in documents:
+                write(path)
+    return errors
+
+
+ATOMIC_TEMP_SUFFIX = ".showshot-tmp"
+
+
+def _open_temp_file(path: str) -> tuple:
+    # Create a new file next to 'path' with the permissions open() would give it (mkstemp makes it private),
+    # or those of 'path' when it exists, since the temporary file is renamed over it.
+    directory, name = os.path.split(os.path.abspath(path))
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}{ATOMIC_TEMP_SUFFIX}")
+        try:
+            file_descriptor = os.open(temp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        os.chmod(temp_path, stat_module.S_IMODE(os.stat(path).st_mode))
+    except FileNotFoundError:
+        pass
+    except BaseException:
+        os.close(file_descriptor)
+        os.remove(temp_path)
+        raise
+    return file_descriptor, temp_path
+
+
+def atomic_write(path: str, payload: bytes, fsync: bool = False) -> None:
+    """
+    Replace a file's contents in one step, so nobody ever sees it half written.
+
+    The data goes to a temporary file in the same directory, which is then renamed over
+    the target. With fsync the data and the directory entry are flushed to disk too.
+
+    Args:
+        path (str): The path of the file to write.
+        payload (bytes): The new contents of the file.
+        fsync (bool): Whether to wait until the write is durable.
+    """
+    temp_path = _write_temp_file(path, payload, fsync)
+    try:
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    if fsync:
+        _fsync_directory(os.path.dirname(os.path.abspath(path)))
+
+
+def _write_temp_file(path: str, payload: bytes, fsync: bool = False) -> str:
+    file_descriptor, temp_path = _open_temp_file(path)
+    METRICS.count(files_opened=1, bytes_written=len(payload))
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(payload)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path
+
+
+def _commit_staged_files(staged: Dict) -> None:
+    def fsync_file(temp_path):
+        with open(temp_path, 'rb') as file:
+            os.fsync(file.fileno())
+
+    # fsync blocks without holding the GIL, so a group of them finishes in about the time of one.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(staged))) as executor:
+        list(executor.map(fsync_file, staged.values()))
+    for path, temp_path in staged.items():
+        os.replace(temp_path, path)
+    for directory in {os.path.dirname(os.path.abspath(path)) for path in staged}:
+        _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    if os.name != "posix":
+        return  # Windows cannot open directories; the rename is as durable as it gets there.
+    file_descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(file_descriptor)
+    finally:
+        os.close(file_descriptor)
+
+
+def _is_tree_file(file_name: str) -> bool:
+    # Hide the backend's own bookkeeping: the show index (and its journal), unfinished atomic writes, locks and sidecars.
+    return (not file_name.startswith(INDEX_FILE_NAME) and not file_name.endswith(ATOMIC_TEMP_SUFFIX)
+            and not file_name.endswith(LOCK_FILE_SUFFIX) and not file_name.endswith(SIDECAR_SUFFIX))
+
+
+LOCK_FILE_SUFFIX = ".showshot-lock"
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a document lock could not be acquired in time."""
+
+
+class ConflictError(RuntimeError):
+    """Raised when a document changed between an optimistic read and its write."""
+
+
+class DocumentLock:
+    def __init__(self, path: str, timeout: float = 10.0, poll_interval: float = 0.002):
+        """
+        An advisory, cross-process lock on one document.
+
+        The lock is taken on a hidden '.<name>.showshot-lock' file next to the document,
+        because atomic writes replace the document's file on every write.
+
+        Args:
+            path (str): The path of the document to lock.
+            timeout (float): Seconds to wait for the lock before raising LockTimeout.
+            poll_interval (float): The initial wait between attempts; it doubles up to 50 ms.
+        """
+        directory, file_name = os.path.split(os.path.abspath(path))
+        self.lock_path = os.path.join(directory, f".{file_name}{LOCK_FILE_SUFFIX}")
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.lock_path, 'a+b')
+        deadline = time.monotonic() + self.timeout
+        delay = self.poll_interval
+        while not _try_lock_file(self.file):
+            if time.monotonic() >= deadline:
+                self.file.close()
+                raise LockTimeout(f"Timed out after {self.timeout}s waiting for lock '{self.lock_path}'.")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _unlock_file(self.file)
+        self.file.close()
+
+
+def _try_lock_file(file) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock_file(file) -> None:
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _etag(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+def update_document(backend, path: str, mutate, concurrency: str = None,
+                    timeout: float = 10.0, retries: int = 10) -> Dict:
+    """
+    Read, modify and write one document, protected against concurrent writers.
+
+    Args:
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend): The backend holding the document.
+        path (str): The path of the document.
+        mutate (callable): Changes the document in place; called with the parsed document.
+        concurrency (str, optional): None (unprotected), 'lock' (hold the document lock for the whole
+            update) or 'optimistic' (write only if the document's etag is unchanged, otherwise re-read
+            and re-apply 'mutate').
+        timeout (float): Seconds to wait for the document lock.
+        retries (int): How many times an optimistic update is re-applied before raising ConflictError.
+
+    Returns:
+        Dict: The document as written.
+    """
+    if concurrency not in (None, "lock", "optimistic"):
+        raise ValueError(f"Unknown concurrency '{concurrency}'. Use None, 'lock' or 'optimistic'.")
+
+    cache = None
+    if isinstance(backend, CachedBackend) and concurrency is not None:
+        # Protected updates go straight to the underlying backend, the cached copy is dropped.
+        cache, backend = backend, backend.backend
+        cache.invalidate(path)
+
+    try:
+        if concurrency is None:
+            data = backend.read(path)
+            mutate(data)
+            backend.write(path, data)
+            return data
+
+        if concurrency == "lock":
+            with backend.lock_document(path, timeout):
+                data = backend.read(path)
+                mutate(data)
+                backend.write(path, data)
+            return data
+
+        for attempt in range(retries + 1):
+            data, etag = backend.read_versioned(path)
+            mutate(data)
+            with backend.lock_document(path, timeout):
+                # The lock is only held for the compare-and-swap, not while 'mutate' runs.
+                if backend.read_versioned(path)[1] == etag:
+                    backend.write(path, data)
+                    return data
+            time.sleep(random.uniform(0, 0.001 * (2 ** min(attempt, 6))))
+        raise ConflictError(f"Document '{path}' kept changing; gave up after {retries + 1} attempts.")
+    finally:
+        if cache is not None:
+            cache.invalidate(path)
+
+# ==================================================================================== END STORAGE ====================================================================================
+
+
+# ==================================================================================== BEGIN ARCHIVES ====================================================================================
+
+ARCHIVE_LINKS_NAME = ".links.json"
+
+ARCHIVE_COMPRESSION_TYPES = {
+    "stored": zipfile.ZIP_STORED,
+    "deflate": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+# Media and archive formats that are already compressed; deflating them again only costs time.
+ARCHIVE_STORED_EXTENSIONS = {
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".zst", ".rar",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic",
+    ".mp4", ".mov", ".m4v", ".mkv", ".webm",
+    ".mp3", ".aac", ".m4a", ".ogg", ".flac",
+}
+
+
+class ArchiveWriter:
+    def __init__(self, compression: str = "deflate", level: int = None, workers: int = None,
+                 progress=None, compression_by_extension: Dict = None,
+                 max_member_size: int = 64 * 1024 * 1024, max_buffered_bytes: int = 256 * 1024 * 1024,
+                 dedupe_links: bool = False):
+        """
+        Write ZIP archives with a pool of threads compressing members in parallel.
+
+        Workers read and compress whole members (zlib, bz2 and lzma release the GIL while
+        they work), and the calling thread writes the compressed members into the archive
+        in their original order. Already-compressed media is stored as-is, and members larger
+        than 'max_member_size' are streamed by the calling thread instead of being buffered.
+
+        With 'dedupe_links', files hard-linked to each other (see BlobStore) are written once
+        per archive and their other names are recorded in a '.links.json' member. Such archives
+        need ArchiveReader or ShowManager.restore_show to be extracted in full: other ZIP tools
+        only extract the first name. By default every file is written under every name.
+
+        Args:
+            compression (str): The compression used for ordinary files: 'stored', 'deflate', 'bzip2' or 'lzma'.
+            level (int, optional): The compression level, e.g. 1 (fastest) to 9 (smallest) for 'deflate'.
+            workers (int, optional): The number of compression threads. Defaults to the number of CPUs.
+            progress (callable, optional): Called as progress(files_done, files_total, bytes_done, bytes_total) after each member.
+            compression_by_extension (Dict, optional): Per file type overrides, e.g. {'.json': ('lzma', None)}.
+            max_member_size (int): Members larger than this many bytes are streamed instead of compressed by a worker.
+            max_buffered_bytes (int): The maximum number of source bytes held in memory by in-flight workers.
+            dedupe_links (bool): Write hard-linked files once, with their other names in '.links.json'.
+        """
+        if compression not in ARCHIVE_COMPRESSION_TYPES:
+            raise ValueError(f"Unknown compression '{compression}'. Use one of {sorted(ARCHIVE_COMPRESSION_TYPES)}.")
+        self.compression = compression
+        self.level = level
+        self.workers = workers or os.cpu_count() or 1
+        self.progress = progress
+        self.compression_by_extension = compression_by_extension or {}
+        self.max_member_size = max_member_size
+        self.max_buffered_bytes = max_buffered_bytes
+        self.dedupe_links = dedupe_links
+
+    def choose_compression(self, file_name: str) -> tuple:
+        """
+        Choose how a member is compressed from its file type.
+
+        Args:
+            file_name (str): The member name.
+
+        Returns:
+            tuple: The zipfile compression constant and level.
+        """
+        extension = os.path.splitext(file_name)[1].lower()
+        if extension in self.compression_by_extension:
+            compression, level = self.compression_by_extension[extension]
+            return ARCHIVE_COMPRESSION_TYPES[compression], level
+        if extension in ARCHIVE_STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED, None
+        return ARCHIVE_COMPRESSION_TYPES[self.compression], self.level
+
+    def write(self, zip_file_path: str, members: list, mode: str = 'w') -> Dict:
+        """
+        Write members to a ZIP archive.
+
+        Args:
+            zip_file_path (str): The path of the archive to write.
+            members (list): A list of (arcname, source) pairs, where source is a file path or the member's bytes.
+            mode (str): 'w' to create the archive, 'a' to append to it.
+
+        Returns:
+            Dict: Statistics of the run: files, bytes_in, bytes_out, seconds, mb_per_second, and the files
+            'deduplicated' into links with their 'bytes_deduplicated'.
+        """
+        started = time.perf_counter()
+        sizes = []
+        identities = []  # (device, inode) of files with several links, so deduplicated copies are archived once
+        for _, source in members:
+            if isinstance(source, bytes):
+                sizes.append(len(source))
+                identities.append(None)
+            else:
+                stat = os.stat(source)
+                sizes.append(stat.st_size)
+                identities.append((stat.st_dev, stat.st_ino) if self.dedupe_links and stat.st_nlink > 1 else None)
+
+        # A new archive is built under a temporary name and renamed when complete,
+        # so an interrupted run never leaves a truncated archive behind.
+        if mode == 'w':
+            temp_path = _write_temp_file(zip_file_path, b"")
+            try:
+                copies = self._write_members(temp_path, 'w', members, sizes, identities)
+                os.replace(temp_path, zip_file_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        else:
+            copies = self._write_members(zip_file_path, mode, members, sizes, identities)
+
+        seconds = time.perf_counter() - started
+        return {
+            "files": len(members),
+            "bytes_in": sum(sizes),
+            "bytes_out": os.path.getsize(zip_file_path),
+            "seconds": seconds,
+            "mb_per_second": sum(sizes) / (1024 * 1024) / seconds if seconds > 0 else 0.0,
+            "deduplicated": len(copies),
+            "bytes_deduplicated": sum(copies),
+        }
+
+    def _write_members(self, zip_file_path: str, mode: str, members: list, sizes: List[int],
+                       identities: list) -> List[int]:
+        bytes_total = sum(sizes)
+        files_done = 0
+        bytes_done = 0
+        archived = {}  # identity -> arcname of the member holding its data
+        links = {}  # arcname -> arcname of the member holding its data
+        copies = []
+
+        with zipfile.ZipFile(zip_file_path, mode, allowZip64=True) as zip_file, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = collections.deque()
+            buffered_bytes = 0
+            raw_writes = _ZIPFILE_RAW_WRITES and hasattr(zip_file, "start_dir")
+            # An archive being appended to may already have its links member, which can't be replaced.
+            linking = ARCHIVE_LINKS_NAME not in zip_file.namelist()
+
+            def write_next():
+                nonlocal files_done, bytes_done, buffered_bytes
+                # Each entry is (future, size, None) for a compressed member, (None, size, (arcname, source,
+                # compress_type, level)) for a streamed one, or (None, size, None) for a link.
+                future, size, buffered = pending.popleft()
+                if buffered is not None:
+                    arcname, source, compress_type, level = buffered
+                    zip_file.write(source, arcname, compress_type=compress_type, compresslevel=level)
+                elif future is not None:
+                    zinfo, payload, level = future.result()
+                    if raw_writes:
+                        _write_compressed_member(zip_file, zinfo, payload)
+                    else:
+                        zip_file.writestr(zinfo, payload, compress_type=zinfo.compress_type, compresslevel=level)
+                    buffered_bytes -= size
+                files_done += 1
+                bytes_done += size
+                if self.progress is not None:
+                    self.progress(files_done, len(members), bytes_done, bytes_total)
+
+            for (arcname, source), size, identity in zip(members, sizes, identities):
+                compress_type, level = self.choose_compression(arcname)
+                if linking and identity is not None and identity in archived:
+                    # Another link to a file already in the archive: only its name is recorded.
+                    links[arcname.replace("\\", "/")] = archived[identity].replace("\\", "/")
+                    pending.append((None, size, None))
+                    copies.append(size)
+                elif not isinstance(source, bytes) and size > self.max_member_size:
+                    # Streamed by this thread when its turn comes, in archive order.
+                    pending.append((None, size, (arcname, source, compress_type, level)))
+                    if identity is not None:
+                        archived.setdefault(identity, arcname)
+                else:
+                    while pending and buffered_bytes + size > self.max_buffered_bytes:
+                        write_next()
+                    future = executor.submit(_compress_member, arcname, source, compress_type, level, raw_writes)
+                    pending.append((future, size, None))
+                    buffered_bytes += size
+                    if identity is not None:
+                        archived.setdefault(identity, arcname)
+                while len(pending) > self.workers * 4:
+                    write_next()
+
+            while pending:
+                write_next()
+            if links:
+                zip_file.writestr(ARCHIVE_LINKS_NAME, json.dumps(links, indent=4).encode('utf-8'))
+        return copies
+
+
+# Compressing members in worker threads needs zipfile internals (it has no public API for
+# already-compressed data). Without them, workers only read members and zipfile compresses them.
+_ZIPFILE_RAW_WRITES = hasattr(zipfile, "_get_compressor") and hasattr(zipfile.ZipFile, "_writecheck")
+
+
+def _compress_member(arcname: str, source, compress_type: int, level: int, compress: bool = True) -> tuple:
+    if isinstance(source, bytes):
+        data = source
+        zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.external_attr = 0o600 << 16
+    else:
+        zinfo = zipfile.ZipInfo.from_file(source, arcname)
+        with open(source, 'rb') as file:
+            data = file.read()
+
+    zinfo.compress_type = compress_type
+    if not compress:
+        return zinfo, data, level
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    compressor = zipfile._get_compressor(compress_type, level)
+    payload = compressor.compress(data) + compressor.flush() if compressor is not None else data
+    zinfo.compress_size = len(payload)
+    return zinfo, payload, level
+
+
+def _write_compressed_member(zip_file: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes) -> None:
+    # zipfile has no public API for already-compressed data, so this mirrors what
+    # ZipFile.open(..., 'w') does around its compressor.
+    zinfo.flag_bits = 0x00
+    if zinfo.compress_type == zipfile.ZIP_LZMA:
+        zinfo.flag_bits |= 0x02  # Compressed data includes an end-of-stream marker
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zip_file.fp.seek(zip_file.start_dir)
+    zinfo.header_offset = zip_file.fp.tell()
+    zip_file._writecheck(zinfo)
+    zip_file._didModify = True
+    zip_file.fp.write(zinfo.FileHeader(zip64))
+    zip_file.fp.write(payload)
+    zip_file.start_dir = zip_file.fp.tell()
+    zip_file.filelist.append(zinfo)
+    zip_file.NameToInfo[zinfo.filename] = zinfo
+
+
+def collect_archive_members(backend, directory_path: str) -> list:
+    """
+    List every file under a directory as (arcname, source) pairs for ArchiveWriter.
+
+    Args:
+        backend (JsonTreeBackend | SQLiteBackend): The backend holding the files.
+        directory_path (str): The directory to archive; arcnames are relative to it.
+
+    Returns:
+        list: A list of (arcname, source) pairs in walk order.
+    """
+    members = []
+    for root, _, files in backend.walk(directory_path):
+        for file in files:
+            file_path = os.path.join(root, file)
+            arcname = os.path.relpath(file_path, directory_path)
+            members.append((arcname, backend.archive_source(file_path)))
+    return members
+
+class ArchiveReader:
+    def __init__(self, zip_file_path: str):
+        """
+        Open an archive once for random access to its members.
+
+        The central directory is read when the reader opens. Members are only
+        decompressed when asked for, and parsed JSON is kept for the life of the reader,
+        so reading one shot costs one member, not the whole archive. Names recorded in the
+        archive's links member are members too, sharing the data of the file they link to.
+
+        Args:
+            zip_file_path (str): The path of the ZIP archive.
+        """
+        self.zip_file_path = zip_file_path
+        self.zip_file = zipfile.ZipFile(zip_file_path, 'r')
+        self.members = {info.filename: info for info in self.zip_file.infolist() if not info.is_dir()}
+        links = self.members.pop(ARCHIVE_LINKS_NAME, None)
+        if links is not None:
+            for link_name, member_name in json.loads(self.zip_file.read(links)).items():
+                self.members[link_name] = self.members[member_name]
+        self.json_cache = {}
+        self.lock = threading.Lock()
+        self.open_lock = threading.Lock()
+        stat = os.stat(zip_file_path)
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the archive. A closed reader reopens it if it is used again.
+        """
+        with self.open_lock:
+            if self.zip_file is not None:
+                self.zip_file.close()
+                self.zip_file = None
+
+    def open_member(self, member_name: str):
+        """
+        Open one member for streaming its contents.
+
+        Args:
+            member_name (str): The member name, e.g. 'Prop/texture.png'.
+
+        Returns:
+            zipfile.ZipExtFile: A binary file object reading the member.
+        """
+        return self._open().open(self.members[member_name])
+
+    def _open(self) -> zipfile.ZipFile:
+        # Readers evicted from the shared cache are closed while their users may still hold them.
+        with self.open_lock:
+            if self.zip_file is None:
+                stat = os.stat(self.zip_file_path)
+                if (stat.st_mtime_ns, stat.st_size) != self.signature:
+                    raise OSError(f"Archive '{self.zip_file_path}' changed since it was opened.")
+                self.zip_file = zipfile.ZipFile(self.zip_file_path, 'r')
+            return self.zip_file
+
+    def list_members(self, pattern: str = None) -> List[str]:
+        """
+        List the files in the archive, optionally filtered by a glob pattern.
+
+        Args:
+            pattern (str, optional): A glob pattern such as '*.json' or 'Prop/*'.
+
+        Returns:
+            List[str]: A list of member names.
+        """
+        if pattern is None:
+            return list(self.members)
+        return [name for name in self.members if fnmatch.fnmatchcase(name, pattern)]
+
+    def read_bytes(self, member_name: str) -> bytes:
+        """
+        Read the raw contents of one member.
+
+        Args:
+            member_name (str): The member name, e.g. 'Prop/Staff1.json'.
+
+        Returns:
+            bytes: The member's contents.
+        """
+        payload = self._open().read(self.members[member_name])
+        METRICS.count(bytes_read=len(payload))
+        return payload
+
+    def read_json(self, member_name: str) -> Dict:
+        """
+        Read and parse one JSON member, caching the result.
+
+        The same parsed object is returned on every call; copy it before modifying it.
+
+        Args:
+            member_name (str): The member name, e.g. 'doggo1_info.json'.
+
+        Returns:
+            Dict: The parsed JSON data.
+        """
+        with self.lock:
+            if member_name not in self.json_cache:
+                self.json_cache[member_name] = json.loads(self.read_bytes(member_name))
+            return self.json_cache[member_name]
+
+
+MAX_OPEN_ARCHIVES = 32
+
+_open_archives = collections.OrderedDict()  # realpath -> ArchiveReader, least recently used first
+_open_archives_lock = threading.Lock()
+
+
+def open_archive(zip_file_path: str) -> ArchiveReader:
+    """
+    Get the shared reader for an archive, reopening it if the file changed on disk.
+
+    At most MAX_OPEN_ARCHIVES readers are kept open; the least recently used one is
+    closed to make room.
+
+    Args:
+        zip_file_path (str): The path of the ZIP archive.
+
+    Returns:
+        ArchiveReader: The reader of the archive.
+    """
+    key = os.path.realpath(zip_file_path)
+    stat = os.stat(zip_file_path)
+    with _open_archives_lock:
+        reader = _open_archives.get(key)
+        if reader is None or reader.signature != (stat.st_mtime_ns, stat.st_size):
+            if reader is not None:
+                reader.close()
+            reader = ArchiveReader(zip_file_path)
+            _open_archives[key] = reader
+            while len(_open_archives) > MAX_OPEN_ARCHIVES:
+                _open_archives.popitem(last=False)[1].close()
+        _open_archives.move_to_end(key)
+        return reader
+
+
+def print_archive_members(zip_file_path: str, zip_file_name: str, pattern: str = None) -> None:
+    """
+    Print the members of an archive, decoding only the ones that match the pattern.
+
+    Args:
+        zip_file_path (str): The path of the ZIP archive.
+        zip_file_name (str): The archive name used in messages.
+        pattern (str, optional): A glob pattern selecting the members to print. Defaults to all of them.
+    """
+    reader = open_archive(zip_file_path)
+    _emit(f"Contents of ZIP file '{zip_file_name}':")
+
+    for file_name in reader.list_members(pattern):
+        data = reader.read_bytes(file_name).decode('utf-8', errors='replace')
+        _emit(f"\nFile: {file_name}\nData:\n{data}")
+
+ARCHIVE_MANIFEST_NAME = ".manifest.json"
+
+
+def build_archive_manifest(members: list, previous_files: Dict) -> tuple:
+    """
+    Fingerprint archive members and find the ones that changed since the previous manifest.
+
+    A file whose size and mtime match the previous run keeps its recorded hash without
+    being read. Otherwise it is hashed, and it only counts as changed if the hash differs.
+
+    Args:
+        members (list): A list of (arcname, source) pairs, as made by collect_archive_members.
+        previous_files (Dict): The 'files' entry of the previous manifest, or an empty dictionary.
+
+    Returns:
+        tuple: The new 'files' manifest entry and the list of changed (arcname, source) pairs.
+    """
+    files = {}
+    changed = []
+    for arcname, source in members:
+        arcname = arcname.replace("\\", "/")
+        previous = previous_files.get(arcname)
+        if isinstance(source, bytes):
+            size, mtime_ns = len(source), None
+        else:
+            stat = os.stat(source)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+
+        if previous and mtime_ns is not None and previous["size"] == size and previous["mtime_ns"] == mtime_ns:
+            files[arcname] = previous
+            continue
+
+        digest = hashlib.sha256()
+        if isinstance(source, bytes):
+            digest.update(source)
+        else:
+            with open(source, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        files[arcname] = {"size": size, "mtime_ns": mtime_ns, "sha256": digest.hexdigest()}
+        if not previous or previous["sha256"] != files[arcname]["sha256"]:
+            changed.append((arcname, source))
+    return files, changed
+
+
+def read_archive_manifest(zip_file_path: str) -> Dict:
+    """
+    Read the manifest stored in an incremental archive.
+
+    Args:
+        zip_file_path (str): The path of the ZIP archive.
+
+    Returns:
+        Dict: The manifest, or None if the archive has no manifest.
+    """
+    reader = open_archive(zip_file_path)
+    if ARCHIVE_MANIFEST_NAME not in reader.members:
+        return None
+    return reader.read_json(ARCHIVE_MANIFEST_NAME)
+
+# ==================================================================================== END ARCHIVES ====================================================================================
+
+
+
+# ==================================================================================== BEGIN ASYNC MANAGERS ====================================================================================
+
+class _AsyncManager:
+    def __init__(self, manager, max_concurrency: int = 16):
+        """
+        Run a manager's blocking calls on a thread pool so they don't block the event loop.
+
+        Args:
+            manager (ShowManager | ShotManager | AssetManager): The manager doing the work.
+            max_concurrency (int): The maximum number of calls running at once.
+        """
+        self.manager = manager
+        self.backend = manager.backend
+        self.max_concurrency = max_concurrency
+        # The pool's workers are the only limit: calls beyond max_concurrency wait in its queue.
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_concurrency, thread_name_prefix="showshot-async")
+
+    async def _run(self, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _with_captured_messages(functools.partial(function, *args, **kwargs)))
+
+    async def _read_many(self, paths: List[str]) -> List[Dict]:
+        # Hand the paths out in a few chunks per worker: one executor call per file costs more than a local read.
+        chunk_size = max(1, -(-len(paths) // (self.max_concurrency * 4)))
+        chunks = [paths[index:index + chunk_size] for index in range(0, len(paths), chunk_size)]
+        results = await asyncio.gather(*(
+            self._run(lambda chunk: [self.backend.read(path) for path in chunk], chunk) for chunk in chunks
+        ))
+        return [document for chunk in results for document in chunk]
+
+    async def _list_documents(self, directory_path: str) -> List[str]:
+        file_names = await self._run(self.backend.list_files, directory_path)
+        return [file_name for file_name in file_names if file_name.endswith(".json") and file_name != "description.json"]
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool once the running calls have finished.
+        """
+        self.executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+def _add_async_methods(async_class, manager_class, method_names: List[str]) -> None:
+    # Give the async class a coroutine for each manager method, with the same signature and docstring.
+    for method_name in method_names:
+        def make_method(method_name):
+            @functools.wraps(getattr(manager_class, method_name))
+            async def method(self, *args, **kwargs):
+                return await self._run(getattr(self.manager, method_name), *args, **kwargs)
+            return method
+        setattr(async_class, method_name, make_method(method_name))
+
+
+class AsyncShowManager(_AsyncManager):
+    def __init__(self, directory_path: str, directory_name: str, backend=None, max_concurrency: int = 16):
+        """
+        The ShowManager operations as coroutines, for use inside an asyncio event loop.
+
+        Args:
+            directory_path (str): The base directory path.
+            directory_name (str): The name of the show directory.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored. Defaults to the JSON directory tree.
+            max_concurrency (int): The maximum number of file operations running at once.
+        """
+        super().__init__(ShowManager(directory_path, directory_name, backend), max_concurrency)
+        self.directory_path = directory_path
+        self.directory_name = directory_name
+
+    async def get_description_files(self, subdir_names: List[str] = None) -> Dict[str, Dict]:
+        """
+        Read the description files of several subdirectories concurrently.
+
+        Args:
+            subdir_names (List[str], optional): The subdirectories to read. Defaults to all of them.
+
+        Returns:
+            Dict[str, Dict]: The description of each subdirectory that has one.
+        """
+        if subdir_names is None:
+            subdir_names = await self.get_subdirectories()
+        paths = [os.path.join(self.directory_path, self.directory_name, name, "description.json") for name in subdir_names]
+        found = await asyncio.gather(*(self._run(self.backend.is_file, path) for path in paths))
+        present = [(name, path) for name, path, is_file in zip(subdir_names, paths, found) if is_file]
+        documents = await self._read_many([path for _, path in present])
+        return {name: document for (name, _), document in zip(present, documents)}
+
+    async def load_shots(self, subdir_names: List[str] = None) -> Dict[str, Dict[str, Dict]]:
+        """
+        Read every shot JSON file of the show concurrently.
+
+        Args:
+            subdir_names (List[str], optional): The subdirectories to read. Defaults to all of them.
+
+        Returns:
+            Dict[str, Dict[str, Dict]]: For each subdirectory, the contents of each shot file by file name.
+        """
+        if subdir_names is None:
+            subdir_names = await self.get_subdirectories()
+        show_path = os.path.join(self.directory_path, self.directory_name)
+        listings = await asyncio.gather(*(self._list_documents(os.path.join(show_path, name)) for name in subdir_names))
+        paths = [
+            (name, file_name, os.path.join(show_path, name, file_name))
+            for name, file_names in zip(subdir_names, listings) for file_name in file_names
+        ]
+        documents = await self._read_many([path for _, _, path in paths])
+
+        shots = {name: {} for name in subdir_names}
+        for (name, file_name, _), document in zip(paths, documents):
+            shots[name][file_name] = document
+        return shots
+
+
+class AsyncShotManager(_AsyncManager):
+    def __init__(self, directory_path: str, backend=None, max_concurrency: int = 16):
+        """
+        The ShotManager operations as coroutines, for use inside an asyncio event loop.
+
+        Args:
+            directory_path (str): The path to the directory containing the JSON files.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored. Defaults to the JSON directory tree.
+            max_concurrency (int): The maximum number of file operations running at once.
+        """
+        super().__init__(ShotManager(directory_path, backend), max_concurrency)
+        self.directory_path = directory_path
+
+    async def get_json_files_info(self, file_names: List[str] = None) -> Dict[str, Dict]:
+        """
+        Read several shot JSON files concurrently.
+
+        Args:
+            file_names (List[str], optional): The files to read. Defaults to every shot in the directory.
+
+        Returns:
+            Dict[str, Dict]: The contents of each file by file name.
+        """
+        if file_names is None:
+            file_names = await self._list_documents(self.directory_path)
+        documents = await self._read_many([os.path.join(self.directory_path, file_name) for file_name in file_names])
+        return dict(zip(file_names, documents))
+
+
+class AsyncAssetManager(_AsyncManager):
+    def __init__(self, directory_path: str, backend=None, concurrency: str = None,
+                 lock_timeout: float = 10.0, retries: int = 10, max_concurrency: int = 16):
+        """
+        The AssetManager operations as coroutines, for use inside an asyncio event loop.
+
+        Args:
+            directory_path (str): The base directory path.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored. Defaults to the JSON directory tree.
+            concurrency (str, optional): How read-modify-write updates are protected, as for AssetManager.
+            lock_timeout (float): Seconds to wait for a document lock before raising LockTimeout.
+            retries (int): How many times an optimistic update is re-applied before raising ConflictError.
+            max_concurrency (int): The maximum number of file operations running at once.
+        """
+        super().__init__(AssetManager(directory_path, backend, concurrency, lock_timeout, retries), max_concurrency)
+        self.directory_path = directory_path
+
+    async def read_json_files(self, folder_name: str, file_names: List[str] = None) -> Dict[str, Dict]:
+        """
+        Read several asset JSON files of a folder concurrently.
+
+        Args:
+            folder_name (str): The name of the asset folder.
+            file_names (List[str], optional): The files to read. Defaults to every asset in the folder.
+
+        Returns:
+            Dict[str, Dict]: The contents of each file by file name.
+        """
+        folder_path = os.path.join(self.directory_path, folder_name)
+        if file_names is None:
+            file_names = await self._list_documents(folder_path)
+        documents = await self._read_many([os.path.join(folder_path, file_name) for file_name in file_names])
+        return dict(zip(file_names, documents))
+
+
+_add_async_methods(AsyncShowManager, ShowManager, [
+    "create_directory", "create_subdirectories", "get_subdirectories", "create_json_file",
+    "get_description_file", "update_description_file", "delete_subdirectory", "zip_show",
+    "zip_show_incremental", "restore_show", "read_data_from_zip", "read_json_from_zip", "query", "search", "check_integrity",
+    "export", "import_records", "scan", "page_subdirectories", "deduplicate",
+])
+_add_async_methods(AsyncShotManager, ShotManager, [
+    "create_character_info", "create_many", "get_json_files", "get_json_file_info", "edit_json_file",
+    "delete_json_file", "print_assets_key_values", "find_assets_by_shot", "find_shots_by_asset", "query",
+    "page_shots",
+])
+_add_async_methods(AsyncAssetManager, AssetManager, [
+    "create_folders", "add_description_file", "read_asset_folders", "print_description_file",
+    "update_description_file", "delete_asset_folder", "create_json_file", "create_many", "update_shots_key",
+    "add_shots_key_values", "get_shots_key_values", "find_shots_by_asset", "find_assets_by_shot", "query",
+    "list_json_files", "zip_asset_folders", "read_data_from_zip", "page_categories", "page_assets", "deduplicate",
+])
+
+# ==================================================================================== END ASYNC MANAGERS ====================================================================================
+
+
+
+# ==================================================================================== BEGIN WATCHER ====================================================================================
+
+ChangeEvent = collections.namedtuple("ChangeEvent", ["action", "kind", "path", "show_path"])
+ChangeEvent.__doc__ = """
+A change to a watched show tree.
+
+Attributes:
+    action (str): 'created', 'modified' or 'deleted'.
+    kind (str): 'show', 'shot', 'asset_folder', 'asset' or 'description'.
+    path (str): The path of the file or directory that changed.
+    show_path (str): The path of the show directory it belongs to, or None for a change at the top level.
+"""
+
+# inotify(7) flags
+_IN_MODIFY, _IN_CLOSE_WRITE, _IN_MOVED_FROM, _IN_MOVED_TO = 0x2, 0x8, 0x40, 0x80
+_IN_CREATE, _IN_DELETE, _IN_DELETE_SELF = 0x100, 0x200, 0x400
+_IN_Q_OVERFLOW, _IN_IGNORED, _IN_ISDIR = 0x4000, 0x8000, 0x40000000
+_IN_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class ShowWatcher:
+    def __init__(self, directory_path: str, debounce: float = 0.2, poll_interval: float = 1.0, use_inotify: bool = True):
+        """
+        Watch a directory of shows and report changes made to it, including edits made outside the managers.
+
+        The layout is the one the AssetManager uses: every directory under 'directory_path' is a
+        show, JSON files at the top of a show are shots, folders inside a show are asset folders
+        and JSON files inside them are assets. On Linux changes come from inotify; elsewhere, or
+        if inotify can't be used, the tree is rescanned every 'poll_interval' seconds.
+
+        Events are coalesced per path and delivered in one batch once the tree has been quiet
+        for 'debounce' seconds, so a burst of writes to one file is reported once and a file
+        created and deleted within the burst is not reported at all.
+
+        Args:
+            directory_path (str): The directory holding the shows.
+            debounce (float): Seconds without changes before the pending events are delivered.
+            poll_interval (float): Seconds between rescans when polling.
+            use_inotify (bool): Use inotify when it is available.
+        """
+        self.directory_path = os.path.abspath(directory_path)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.subscribers = []
+        self.pending = collections.OrderedDict()  # path -> ChangeEvent waiting for the burst to end
+        self.snapshot = self._scan()
+        self.inotify = _Inotify(self.directory_path) if use_inotify and _Inotify.available() else None
+        self.thread = None
+        self.stopping = threading.Event()
+
+    def subscribe(self, callback) -> None:
+        """
+        Call a function with every batch of events.
+
+        Args:
+            callback (callable): Called with a list of ChangeEvent, on the watcher's thread.
+        """
+        self.subscribers.append(callback)
+
+    def start(self) -> None:
+        """
+        Watch in a background thread until stop() is called.
+        """
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._run, name="showshot-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread, delivering any pending events first.
+        """
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def poll(self, timeout: float = 0.0) -> List[ChangeEvent]:
+        """
+        Collect the changes made since the last call and deliver them, without waiting for the debounce.
+
+        Args:
+            timeout (float): Seconds to wait for the first change.
+
+        Returns:
+            List[ChangeEvent]: The events delivered.
+        """
+        self._collect(timeout)
+        return self._deliver()
+
+    def _run(self) -> None:
+        last_change = time.monotonic()
+        while not self.stopping.is_set():
+            wait = self.debounce if self.pending else (self.poll_interval if self.inotify is None else 0.5)
+            if self._collect(wait):
+                last_change = time.monotonic()
+            elif self.pending and time.monotonic() - last_change >= self.debounce:
+                self._deliver()
+        self._collect(0)
+        self._deliver()
+
+    def _collect(self, timeout: float) -> bool:
+        if self.inotify is None:
+            if timeout:
+                self.stopping.wait(timeout)
+            return self._rescan()
+
+        changed_paths = self.inotify.read(timeout)
+        if changed_paths is None:  # the kernel queue overflowed: compare the whole tree instead
+            return self._rescan()
+        found = False
+        for path in changed_paths:
+            found = self._rescan(path) or found
+        return found
+
+    def _rescan(self, path: str = None) -> bool:
+        # Compare the snapshot of 'path' (or of the whole tree) with the disk and queue the differences.
+        path = self.directory_path if path is None else path
+        prefix = os.path.join(path, "")
+        old = {key: value for key, value in self.snapshot.items() if key == path or key.startswith(prefix)}
+        new = self._scan(path)
+        found = False
+        for key in sorted(old.keys() | new.keys()):
+            before, after = old.get(key), new.get(key)
+            if before == after:
+                continue
+            if after is None:
+                self.snapshot.pop(key)
+                found = self._queue("deleted", key, before[0]) or found
+            else:
+                self.snapshot[key] = after
+                if before is not None and before[0] == after[0] and after[0]:
+                    continue  # a directory's own mtime changes with its entries, which are reported themselves
+                found = self._queue("created" if before is None else "modified", key, after[0]) or found
+        if self.inotify is not None:
+            for key, (is_dir, _, _) in new.items():
+                if is_dir and key not in old:
+                    self.inotify.add_watch(key)
+        return found
+
+    def _scan(self, path: str = None) -> Dict:
+        # path -> (is_dir, mtime_ns, size) for 'path' and everything below it.
+        path = self.directory_path if path is None else path
+        entries = {}
+        if path != self.directory_path:
+            if not _is_watched_name(os.path.basename(path)):
+                return entries
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return entries
+            entries[path] = (os.path.isdir(path), stat.st_mtime_ns, stat.st_size)
+            if not entries[path][0]:
+                return entries
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as iterator:
+                    for entry in iterator:
+                        if not _is_watched_name(entry.name):
+                            continue
+                        try:
+                            stat = entry.stat(follow_symlinks=False)
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        entries[entry.path] = (is_dir, stat.st_mtime_ns, stat.st_size)
+                        if is_dir:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+        return entries
+
+    def _queue(self, action: str, path: str, is_dir: bool) -> bool:
+        kind, show_path = self._classify(path, is_dir)
+        if kind is None:
+            return False
+        previous = self.pending.pop(path, None)
+        if previous is not None:
+            if previous.action == "created" and action == "deleted":
+                return True  # created and deleted within one burst: nothing to report
+            if previous.action == "created" or (previous.action == "deleted" and action == "created"):
+                action = "created" if previous.action == "created" else "modified"
+        self.pending[path] = ChangeEvent(action, kind, path, show_path)
+        return True
+
+    def _classify(self, path: str, is_dir: bool) -> tuple:
+        parts = os.path.relpath(path, self.directory_path).split(os.sep)
+        show_path = os.path.join(self.directory_path, parts[0]) if len(parts) > 1 or is_dir else None
+        if is_dir:
+            return ("show" if len(parts) == 1 else "asset_folder"), show_path
+        if not parts[-1].endswith(".json"):
+            return None, None
+        if parts[-1] == "description.json":
+            return "description", show_path
+        if len(parts) == 2:
+            return "shot", show_path
+        if len(parts) > 2:
+            return "asset", show_path
+        return None, None
+
+    def _deliver(self) -> List[ChangeEvent]:
+        events = list(self.pending.values())
+        self.pending.clear()
+        if events:
+            for callback in list(self.subscribers):
+                try:
+                    callback(events)
+                except Exception as error:
+                    _emit(f"Watcher subscriber {callback!r} failed: {error}", logging.ERROR)
+        return events
+
+
+def _is_watched_name(name: str) -> bool:
+    # Hidden files cover the library's bookkeeping (index, locks, temporary files) and editors' swap files.
+    return _is_tree_file(name) and not name.startswith(".")
+
+
+class _Inotify:
+    def __init__(self, directory_path: str):
+        # Watches every directory under 'directory_path'; read() reports the directories that changed.
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.file_descriptor = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.file_descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths = {}  # watch descriptor -> directory path
+        self.add_watch(directory_path)
+        for root, dirs, _ in os.walk(directory_path):
+            for name in dirs:
+                self.add_watch(os.path.join(root, name))
+
+    @staticmethod
+    def available() -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        library = ctypes.util.find_library("c")
+        return library is not None and hasattr(ctypes.CDLL(library), "inotify_init1")
+
+    def add_watch(self, path: str) -> None:
+        watch_descriptor = self.libc.inotify_add_watch(self.file_descriptor, os.fsencode(path), _IN_WATCH_MASK)
+        if watch_descriptor >= 0:
+            self.paths[watch_descriptor] = path
+
+    def read(self, timeout: float) -> List[str]:
+        # The changed paths (the entry, or the directory for a removed entry), or None after a queue overflow.
+        if not select.select([self.file_descriptor], [], [], timeout)[0]:
+            return []
+        try:
+            buffer = os.read(self.file_descriptor, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, length = _INOTIFY_EVENT.unpack_from(buffer, offset)
+            name = buffer[offset + _INOTIFY_EVENT.size:offset + _INOTIFY_EVENT.size + length].rstrip(b"\0")
+            offset += _INOTIFY_EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if mask & _IN_IGNORED:
+                self.paths.pop(watch_descriptor, None)
+                continue
+            directory = self.paths.get(watch_descriptor)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if path not in changed:
+                changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.file_descriptor)
+
+
+def index_subscriber(backend=None):
+    """
+    Make a watcher subscriber that keeps the show indexes up to date with the changes.
+
+    Example:
+        watcher.subscribe(index_subscriber())
+
+    Args:
+        backend (JsonTreeBackend | CachedBackend, optional): The backend the managers use. Defaults to the JSON directory tree.
+
+    Returns:
+        callable: The subscriber.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+
+    def update_indexes(events: List[ChangeEvent]) -> None:
+        # A deleted show takes its index with it, so its other events are skipped.
+        deleted_shows = {event.path for event in events if event.kind == "show" and event.action == "deleted"}
+        for show_path in deleted_shows:
+            close_show_index(show_path, backend)
+        for event in events:
+            if event.kind not in ("shot", "asset", "asset_folder") or event.show_path in deleted_shows:
+                continue
+            index = get_show_index(event.show_path, backend)
+            document = os.path.relpath(event.path, event.show_path).replace(os.sep, "/")
+            if event.kind == "asset_folder":
+                if event.action == "deleted":
+                    index.remove_folder(document)
+                continue
+            if event.action == "deleted":
+                index.remove_document(document)
+                continue
+            try:
+                data = backend.read(event.path)
+            except (OSError, ValueError):
+                continue  # half-written; the next event for the file brings the finished version
+            if not isinstance(data, dict):
+                continue
+            if event.kind == "shot":
+                index.set_shot_document(document, data)
+            else:
+                category, file_name = document.rsplit("/", 1)
+                index.set_asset_document(category, file_name, data)
+
+    return update_indexes
+
+
+def cache_subscriber(cache: "CachedBackend"):
+    """
+    Make a watcher subscriber that drops changed documents from a CachedBackend.
+
+    Args:
+        cache (CachedBackend): The cache shared by the managers.
+
+    Returns:
+        callable: The subscriber.
+    """
+    def drop_documents(events: List[ChangeEvent]) -> None:
+        for event in events:
+            if event.kind in ("show", "asset_folder"):
+                if event.action == "deleted":
+                    cache.invalidate(event.path, tree=True)
+            else:
+                cache.invalidate(event.path)
+
+    return drop_documents
+
+# ==================================================================================== END WATCHER ====================================================================================
+
+
+
+# ==================================================================================== BEGIN SCANNER ====================================================================================
+
+SNAPSHOT_VERSION = 1
+
+
+class ShowSnapshot:
+    def __init__(self, directory_path: str, directories: Dict = None, stats: Dict = None):
+        """
+        A compact picture of a directory of shows, as made by scan_shows.
+
+        Every directory is stored once, by its path relative to 'directory_path' ('' for the top),
+        as a (mtime_ns, subdirectory names, files) tuple where files are (name, size, mtime_ns)
+        tuples. The accessors read it with the AssetManager layout: top-level directories are
+        shows, JSON files at the top of a show are shots, folders inside a show are asset
+        categories, and JSON files inside them are assets.
+
+        Args:
+            directory_path (str): The directory that was scanned.
+            directories (Dict, optional): The directory entries, by relative path.
+            stats (Dict, optional): How many directories the scan listed and reused.
+        """
+        self.directory_path = directory_path
+        self.directories = directories if directories is not None else {}
+        self.stats = stats if stats is not None else {}
+
+    def shows(self) -> List[str]:
+        """
+        Get the names of the shows.
+
+        Returns:
+            List[str]: A sorted list of show names.
+        """
+        return sorted(self.directories.get("", (0, (), ()))[1])
+
+    def categories(self, show_name: str) -> List[str]:
+        """
+        Get the asset categories of a show, including nested ones such as 'Environment/Cat'.
+
+        Args:
+            show_name (str): The name of the show.
+
+        Returns:
+            List[str]: A sorted list of category paths inside the show.
+        """
+        prefix = f"{show_name}/"
+        return sorted(path[len(prefix):] for path in self.directories if path.startswith(prefix))
+
+    def shot_files(self, show_name: str) -> List[tuple]:
+        """
+        Get the shot files of a show.
+
+        Args:
+            show_name (str): The name of the show.
+
+        Returns:
+            List[tuple]: (file name, size, mtime_ns) tuples.
+        """
+        return self._json_files(show_name)
+
+    def asset_files(self, show_name: str, category: str = None) -> List[tuple]:
+        """
+        Get the asset files of a show, or of one of its categories.
+
+        Args:
+            show_name (str): The name of the show.
+            category (str, optional): The category path inside the show. Defaults to every category.
+
+        Returns:
+            List[tuple]: (path relative to the show, size, mtime_ns) tuples, e.g. ('Prop/Staff1.json', 120, ...).
+        """
+        categories = [category] if category is not None else self.categories(show_name)
+        return [
+            (f"{name}/{file_name}", size, mtime_ns)
+            for name in categories
+            for file_name, size, mtime_ns in self._json_files(f"{show_name}/{name}")
+        ]
+
+    def description_files(self) -> List[tuple]:
+        """
+        Get every description.json file.
+
+        Returns:
+            List[tuple]: (path relative to the scanned directory, size, mtime_ns) tuples.
+        """
+        return sorted(
+            (f"{path}/description.json" if path else "description.json", size, mtime_ns)
+            for path, (_, _, files) in self.directories.items()
+            for file_name, size, mtime_ns in files if file_name == "description.json"
+        )
+
+    def to_dict(self) -> Dict:
+        """
+        Get the snapshot as JSON-serializable data.
+
+        Returns:
+            Dict: The snapshot, readable by ShowSnapshot.from_dict.
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "directory_path": self.directory_path,
+            "directories": {path: [mtime_ns, list(dirs), [list(file) for file in files]]
+                            for path, (mtime_ns, dirs, files) in self.directories.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ShowSnapshot":
+        """
+        Rebuild a snapshot from the output of to_dict.
+
+        Args:
+            data (Dict): The serialized snapshot.
+
+        Returns:
+            ShowSnapshot: The snapshot, or an empty one if the data is from another version.
+        """
+        if data.get("version") != SNAPSHOT_VERSION:
+            return cls(data.get("directory_path", ""))
+        return cls(data["directory_path"], {
+            path: (mtime_ns, tuple(dirs), tuple(tuple(file) for file in files))
+            for path, (mtime_ns, dirs, files) in data["directories"].items()
+        })
+
+    def save(self, snapshot_path: str) -> None:
+        """
+        Write the snapshot to a JSON file.
+
+        Args:
+            snapshot_path (str): The path of the snapshot file.
+        """
+        atomic_write(snapshot_path, json.dumps(self.to_dict(), separators=(",", ":")).encode('utf-8'))
+
+    @classmethod
+    def load(cls, snapshot_path: str) -> "ShowSnapshot":
+        """
+        Read a snapshot written by save.
+
+        Args:
+            snapshot_path (str): The path of the snapshot file.
+
+        Returns:
+            ShowSnapshot: The snapshot, or None if the file does not exist.
+        """
+        if not os.path.isfile(snapshot_path):
+            return None
+        with open(snapshot_path, 'r', encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
+
+    def _json_files(self, path: str) -> List[tuple]:
+        files = self.directories.get(path, (0, (), ()))[2]
+        return [file for file in files if file[0].endswith(".json") and file[0] != "description.json"]
+
+
+def scan_shows(directory_path: str, previous: ShowSnapshot = None, workers: int = None) -> ShowSnapshot:
+    """
+    Walk a directory of shows once, listing directories in parallel with os.scandir.
+
+    With a previous snapshot, a directory whose mtime hasn't changed keeps its previous
+    listing and only its subdirectories are visited. Adding, removing or renaming files
+    (which includes every write made by the managers) changes a directory's mtime. Files
+    rewritten in place by other tools keep their old size and mtime until their directory
+    changes or a full scan is made.
+
+    Args:
+        directory_path (str): The directory holding the shows. Only the JSON directory tree can be scanned.
+        previous (ShowSnapshot, optional): The snapshot of an earlier scan of the same directory.
+        workers (int, optional): The number of threads listing directories. Defaults to the number of CPUs.
+
+    Returns:
+        ShowSnapshot: The new snapshot. Its stats count the directories 'listed' and 'reused'.
+    """
+    directory_path = os.path.abspath(directory_path)
+    previous_directories = {}
+    if previous is not None and os.path.abspath(previous.directory_path) == directory_path:
+        previous_directories = previous.directories
+    workers = workers if workers else min(32, os.cpu_count() or 1)
+
+    def scan_directory(relative_path):
+        path = os.path.join(directory_path, *relative_path.split("/")) if relative_path else directory_path
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return relative_path, None, False
+        cached = previous_directories.get(relative_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return relative_path, cached, True
+
+        dirs, files = [], []
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    if not _is_watched_name(entry.name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            files.append((entry.name, stat.st_size, stat.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            return relative_path, None, False
+        return relative_path, (mtime_ns, tuple(sorted(dirs)), tuple(sorted(files))), False
+
+    directories = {}
+    stats = {"listed": 0, "reused": 0}
+    with concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix="showshot-scan") as executor:
+        pending = {executor.submit(scan_directory, "")}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                relative_path, entry, reused = future.result()
+                if entry is None:
+                    continue
+                directories[relative_path] = entry
+                stats["reused" if reused else "listed"] += 1
+                for name in entry[1]:
+                    pending.add(executor.submit(scan_directory, f"{relative_path}/{name}" if relative_path else name))
+    return ShowSnapshot(directory_path, directories, stats)
+
+# ==================================================================================== END SCANNER ====================================================================================
+
+
+
+# ==================================================================================== BEGIN MODEL ====================================================================================
+
+class ReferenceTable:
+    __slots__ = ("names", "ids")
+
+    def __init__(self):
+        """
+        Give every distinct reference name (e.g. 'Prop_collar', 'character3') a small integer ID.
+        """
+        self.names = []
+        self.ids = {}
+
+    def intern(self, name: str) -> int:
+        """
+        Get the ID of a name, adding it if it is new.
+
+        Args:
+            name (str): The reference name.
+
+        Returns:
+            int: The ID of the name.
+        """
+        reference_id = self.ids.get(name)
+        if reference_id is None:
+            reference_id = self.ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return reference_id
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+_MISSING = object()  # a key the JSON file doesn't have
+_NO_LIST = 0xFFFFFFFF
+
+
+class ReferenceColumn:
+    __slots__ = ("ids", "starts", "lengths")
+
+    def __init__(self):
+        """
+        The reference lists of many records in three flat integer arrays.
+
+        Row i's list is ids[starts[i]:starts[i] + lengths[i]]. Replacing a list appends the new
+        IDs and repoints the row, so the old IDs stay in 'ids' until the column is rebuilt.
+        A row whose document has no list at all has the length _NO_LIST.
+        """
+        self.ids = array.array('I')
+        self.starts = array.array('I')
+        self.lengths = array.array('I')
+
+    def append(self, reference_ids: List[int] = None) -> int:
+        """
+        Add a row.
+
+        Args:
+            reference_ids (List[int], optional): The IDs of the row's references, or None if the document has no list.
+
+        Returns:
+            int: The row number.
+        """
+        self.starts.append(len(self.ids))
+        self.lengths.append(_NO_LIST if reference_ids is None else len(reference_ids))
+        self.ids.extend(reference_ids or [])
+        return len(self.starts) - 1
+
+    def has_list(self, row: int) -> bool:
+        """
+        Check whether a row's document has a reference list.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            bool: False if the document has no list.
+        """
+        return self.lengths[row] != _NO_LIST
+
+    def get(self, row: int) -> array.array:
+        """
+        Get the reference IDs of a row.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            array.array: The IDs.
+        """
+        start, length = self.starts[row], self.lengths[row]
+        return self.ids[start:start + length] if length != _NO_LIST else array.array('I')
+
+    def replace(self, row: int, reference_ids: List[int]) -> None:
+        """
+        Replace the reference IDs of a row.
+
+        Args:
+            row (int): The row number.
+            reference_ids (List[int]): The new IDs.
+        """
+        self.starts[row] = len(self.ids)
+        self.lengths[row] = len(reference_ids)
+        self.ids.extend(reference_ids)
+
+
+class Shot:
+    __slots__ = ("show", "row", "file_name", "name", "age", "breed", "extra")
+
+    def __init__(self, show: "Show", row: int, file_name: str, name, age, breed, extra: Dict = None):
+        """
+        A shot file, as in doggo1_info.json. Its 'assets' live in the show's reference column.
+
+        Args:
+            show (Show): The show the shot belongs to.
+            row (int): The shot's row in the show's reference column.
+            file_name (str): The name of the shot JSON file.
+            name: The 'name' key.
+            age: The 'age' key.
+            breed: The 'breed' key.
+            extra (Dict, optional): Any other keys of the file.
+        """
+        self.show = show
+        self.row = row
+        self.file_name = file_name
+        self.name = name
+        self.age = age
+        self.breed = breed
+        self.extra = extra or None
+
+    @property
+    def assets(self) -> List[str]:
+        names = self.show.references.names
+        return [names[reference_id] for reference_id in self.show.shot_assets.get(self.row)]
+
+    @assets.setter
+    def assets(self, assets: List[str]) -> None:
+        self.show.shot_assets.replace(self.row, [self.show.references.intern(asset) for asset in assets])
+
+    def to_json(self) -> Dict:
+        """
+        Get the shot in the JSON file schema.
+
+        Returns:
+            Dict: The contents of the shot file.
+        """
+        data = {"name": self.name, "age": self.age, "breed": self.breed,
+                "assets": self.assets if self.show.shot_assets.has_list(self.row) else _MISSING}
+        data = {key: value for key, value in data.items() if value is not _MISSING}
+        data.update(self.extra or {})
+        return data
+
+
+class Asset:
+    __slots__ = ("show", "row", "category", "file_name", "name", "additional_info", "extra")
+
+    def __init__(self, show: "Show", row: int, category: str, file_name: str, name, additional_info, extra: Dict = None):
+        """
+        An asset file, as in Prop/Staff1.json. Its 'Shots' live in the show's reference column.
+
+        Args:
+            show (Show): The show the asset belongs to.
+            row (int): The asset's row in the show's reference column.
+            category (str): The asset category path inside the show, e.g. 'Prop'.
+            file_name (str): The name of the asset JSON file.
+            name: The 'name' key.
+            additional_info: The 'additional_info' key.
+            extra (Dict, optional): Any other keys of the file.
+        """
+        self.show = show
+        self.row = row
+        self.category = category
+        self.file_name = file_name
+        self.name = name
+        self.additional_info = additional_info
+        self.extra = extra or None
+
+    @property
+    def shots(self) -> List[str]:
+        names = self.show.references.names
+        return [names[reference_id] for reference_id in self.show.asset_shots.get(self.row)]
+
+    @shots.setter
+    def shots(self, shots: List[str]) -> None:
+        self.show.asset_shots.replace(self.row, [self.show.references.intern(shot) for shot in shots])
+
+    @property
+    def reference(self) -> str:
+        return asset_reference(self.category, self.file_name)
+
+    def to_json(self) -> Dict:
+        """
+        Get the asset in the JSON file schema.
+
+        Returns:
+            Dict: The contents of the asset file.
+        """
+        data = {"name": self.name, "additional_info": self.additional_info,
+                "Shots": self.shots if self.show.asset_shots.has_list(self.row) else _MISSING}
+        data = {key: value for key, value in data.items() if value is not _MISSING}
+        data.update(self.extra or {})
+        return data
+
+
+class Show:
+    __slots__ = ("name", "description", "references", "shots", "assets", "shot_assets", "asset_shots")
+
+    def __init__(self, name: str, description: Dict = None):
+        """
+        The shots and assets of one show, held compactly in memory.
+
+        Reference names are stored once in a ReferenceTable and the records hold integer IDs
+        in array-backed columns, so a name listed by thousands of documents costs 4 bytes per
+        mention instead of a list slot and a string.
+
+        Args:
+            name (str): The name of the show.
+            description (Dict, optional): The show's description.json.
+        """
+        self.name = name
+        self.description = description
+        self.references = ReferenceTable()
+        self.shots = {}   # file name -> Shot
+        self.assets = {}  # 'category/file name' -> Asset
+        self.shot_assets = ReferenceColumn()
+        self.asset_shots = ReferenceColumn()
+
+    def add_shot(self, file_name: str, data: Dict) -> Shot:
+        """
+        Add a shot from the contents of its JSON file.
+
+        Args:
+            file_name (str): The name of the shot JSON file.
+            data (Dict): The contents of the file.
+
+        Returns:
+            Shot: The new shot.
+        """
+        data = dict(data)
+        row = self.shot_assets.append(self._intern_list(data, "assets"))
+        breed = data.pop("breed", _MISSING)
+        shot = Shot(self, row, file_name, data.pop("name", _MISSING), data.pop("age", _MISSING),
+                    sys.intern(breed) if isinstance(breed, str) else breed, data)
+        self.shots[file_name] = shot
+        return shot
+
+    def add_asset(self, category: str, file_name: str, data: Dict) -> Asset:
+        """
+        Add an asset from the contents of its JSON file.
+
+        Args:
+            category (str): The asset category path inside the show, e.g. 'Prop'.
+            file_name (str): The name of the asset JSON file.
+            data (Dict): The contents of the file.
+
+        Returns:
+            Asset: The new asset.
+        """
+        data = dict(data)
+        row = self.asset_shots.append(self._intern_list(data, "Shots"))
+        additional_info = data.pop("additional_info", _MISSING)
+        asset = Asset(self, row, sys.intern(category), file_name, data.pop("name", _MISSING),
+                      sys.intern(additional_info) if isinstance(additional_info, str) else additional_info, data)
+        self.assets[f"{category}/{file_name}"] = asset
+        return asset
+
+    def _intern_list(self, data: Dict, key: str) -> List[int]:
+        # Only a list of names goes into the column; anything else stays in the record's extra keys.
+        values = data.get(key, _MISSING)
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            return None
+        del data[key]
+        return [self.references.intern(value) for value in values]
+
+    def to_json_documents(self) -> Dict[str, Dict]:
+        """
+        Get every shot and asset in the JSON file schema.
+
+        Returns:
+            Dict[str, Dict]: The contents of each file, by path relative to the show.
+        """
+        documents = {file_name: shot.to_json() for file_name, shot in self.shots.items()}
+        documents.update((path, asset.to_json()) for path, asset in self.assets.items())
+        return documents
+
+
+def load_show_model(show_path: str, backend=None) -> Show:
+    """
+    Read every shot and asset file of a show into a compact Show.
+
+    Args:
+        show_path (str): The path of the show directory, e.g. '<base>/Animal_Kingdom/Dogs'.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show.
+
+    Returns:
+        Show: The show's shots and assets.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    description_path = os.path.join(show_path, "description.json")
+    show = Show(os.path.basename(os.path.normpath(show_path)),
+                backend.read(description_path) if backend.is_file(description_path) else None)
+    for root, dirs, files in backend.walk(show_path):
+        dirs.sort()
+        category = os.path.relpath(root, show_path).replace("\\", "/")
+        category = "" if category == "." else category
+        for file_name in sorted(files):
+            if not file_name.endswith(".json") or file_name == "description.json":
+                continue
+            data = backend.read(os.path.join(root, file_name))
+            if not isinstance(data, dict):
+                continue
+            if category:
+                show.add_asset(category, file_name, data)
+            else:
+                show.add_shot(file_name, data)
+    return show
+
+
+def save_show_model(show: Show, show_path: str, backend=None, workers: int = None) -> Dict:
+    """
+    Write every shot and asset of a Show back to its JSON files, and update the show index.
+
+    Args:
+        show (Show): The show to write.
+        show_path (str): The path of the show directory.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show.
+        workers (int, optional): The number of writer threads.
+
+    Returns:
+        Dict: The exception raised for each path that could not be written.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    documents = show.to_json_documents()
+    for category in {asset.category for asset in show.assets.values()}:
+        backend.make_dirs(os.path.join(show_path, category))
+    errors = _write_documents(
+        backend, {os.path.join(show_path, *path.split("/")): data for path, data in documents.items()}, workers
+    )
+    index = get_show_index(show_path, backend)
+    with index.transaction():
+        for path, data in documents.items():
+            if os.path.join(show_path, *path.split("/")) in errors:
+                continue
+            if path in show.shots:
+                index.set_shot_document(path, data)
+            else:
+                category, file_name = path.rsplit("/", 1)
+                index.set_asset_document(category, file_name, data)
+    _search_documents_changed({
+        os.path.join(show_path, *path.split("/")): data for path, data in documents.items()
+        if os.path.join(show_path, *path.split("/")) not in errors
+    })
+    return errors
+
+# ==================================================================================== END MODEL ====================================================================================
+
+
+
+# ==================================================================================== BEGIN INTEGRITY ====================================================================================
+
+def check_show_integrity(show_path: str, backend=None, repair: bool = False, workers: int = None) -> Dict:
+    """
+    Check that the shot and asset files of a show agree about which shots use which assets.
+
+    Every file is read once and its references go into hash maps, so the check takes
+    linear time. A reference is dangling when the shot or asset it names doesn't exist,
+    and one-sided when the named file exists but doesn't list the file back.
+
+    Args:
+        show_path (str): The path of the show directory, e.g. '<base>/Animal_Kingdom/Dogs'.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show.
+        repair (bool): Remove dangling references and add the missing side of one-sided ones,
+            writing every changed file in one batch.
+        workers (int, optional): The number of writer threads used by the repair.
+
+    Returns:
+        Dict: The number of 'shots' and 'assets', the 'dangling' and 'one_sided' problems as
+        dictionaries with 'file', 'kind' and 'reference' keys, and the number of files 'repaired'.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    shot_files = {}   # shot reference -> file name
+    asset_files = {}  # asset reference -> 'category/file name'
+    declared = {}     # document -> list of references it declares
+    for root, dirs, files in backend.walk(show_path):
+        category = os.path.relpath(root, show_path).replace("\\", "/")
+        category = "" if category == "." else category
+        for file_name in files:
+            if not file_name.endswith(".json") or file_name == "description.json":
+                continue
+            try:
+                data = backend.read(os.path.join(root, file_name))
+            except (OSError, ValueError):
+                continue
+            if not isinstance(data, dict):
+                continue
+            if category:
+                document = f"{category}/{file_name}"
+                asset_files[asset_reference(category, file_name)] = document
+                declared[document] = _as_name_list(data.get("Shots"))
+            else:
+                shot_files[shot_reference(file_name)] = file_name
+                declared[file_name] = _as_name_list(data.get("assets"))
+
+    # Both sides as sets of (shot, asset) pairs.
+    shot_side = {(shot, asset) for shot, file_name in shot_files.items() for asset in declared[file_name]}
+    asset_side = {(shot, asset) for asset, document in asset_files.items() for shot in declared[document]}
+
+    dangling, one_sided = [], []
+    remove = collections.defaultdict(set)  # document -> references to drop
+    add = collections.defaultdict(list)    # document -> references to append
+    for shot, asset in sorted(shot_side - asset_side):
+        problem = {"file": shot_files[shot], "kind": "shot", "reference": asset}
+        if asset not in asset_files:
+            dangling.append(problem)
+            remove[shot_files[shot]].add(asset)
+        else:
+            one_sided.append(problem)
+            add[asset_files[asset]].append(shot)
+    for shot, asset in sorted(asset_side - shot_side):
+        problem = {"file": asset_files[asset], "kind": "asset", "reference": shot}
+        if shot not in shot_files:
+            dangling.append(problem)
+            remove[asset_files[asset]].add(shot)
+        else:
+            one_sided.append(problem)
+            add[shot_files[shot]].append(asset)
+
+    repaired = 0
+    if repair and (remove or add):
+        documents = {}
+        for document in remove.keys() | add.keys():
+            path = os.path.join(show_path, *document.split("/"))
+            data = backend.read(path)
+            key = "Shots" if "/" in document else "assets"
+            values = [value for value in _as_name_list(data.get(key)) if value not in remove[document]]
+            data[key] = values + [value for value in add[document] if value not in values]
+            documents[path] = data
+        errors = _write_documents(backend, documents, workers)
+        index = get_show_index(show_path, backend)
+        with index.transaction():
+            for path, data in documents.items():
+                if path in errors:
+                    continue
+                document = os.path.relpath(path, show_path).replace(os.sep, "/")
+                if "/" in document:
+                    category, file_name = document.rsplit("/", 1)
+                    index.set_asset_document(category, file_name, data)
+                else:
+                    index.set_shot_document(document, data)
+        _search_documents_changed({path: data for path, data in documents.items() if path not in errors})
+        repaired = len(documents) - len(errors)
+
+    return {"shots": len(shot_files), "assets": len(asset_files), "dangling": dangling,
+            "one_sided": one_sided, "repaired": repaired}
+
+# ==================================================================================== END INTEGRITY ====================================================================================
+
+
+
+# ==================================================================================== BEGIN STUDIO ====================================================================================
+
+def _run_show_operation(studio_path: str, show_name: str, function, args: tuple, kwargs: Dict,
+                        backend_factory=None) -> Dict:
+    # Runs in a worker process: the managers' messages are captured (see _emit) and returned.
+    start = time.perf_counter()
+    messages = []
+    result = {"show": show_name, "result": None, "error": None}
+    _captured_messages.messages = messages
+    try:
+        backend = backend_factory(studio_path, show_name) if backend_factory is not None else None
+        try:
+            result["result"] = function(ShowManager(studio_path, show_name, backend), *args, **kwargs)
+        finally:
+            if hasattr(backend, "close"):
+                backend.close()
+    except Exception:
+        result["error"] = traceback.format_exc()
+    finally:
+        _captured_messages.messages = None
+    result["output"] = "".join(f"{message}\n" for message, _ in messages)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _zip_show(show_manager: ShowManager, compression: str, level: int, threads: int) -> Dict:
+    return show_manager.zip_show(f"{show_manager.directory_name}.zip", compression, level, threads)
+
+
+def _read_descriptions(show_manager: ShowManager) -> Dict:
+    show_path = os.path.join(show_manager.directory_path, show_manager.directory_name)
+    descriptions = {}
+    if show_manager.backend.is_file(os.path.join(show_path, "description.json")):
+        descriptions[""] = show_manager.backend.read(os.path.join(show_path, "description.json"))
+    for subdir_name in show_manager.get_subdirectories():
+        if show_manager.backend.is_file(os.path.join(show_path, subdir_name, "description.json")):
+            descriptions[subdir_name] = show_manager.get_description_file(subdir_name)
+    return descriptions
+
+
+def _list_show(show_manager: ShowManager) -> Dict:
+    show_path = os.path.join(show_manager.directory_path, show_manager.directory_name)
+    if isinstance(show_manager.backend, JsonTreeBackend):
+        return {
+            subdir_name: {
+                "shots": [name for name, _, _ in snapshot.shot_files(subdir_name)],
+                "assets": [name for name, _, _ in snapshot.asset_files(subdir_name)],
+            }
+            for snapshot in [scan_shows(show_path, workers=1)]
+            for subdir_name in snapshot.shows()
+        }
+
+    # Other backends are walked, with the same layout as the scanner.
+    listing = {}
+    for subdir_name in show_manager.get_subdirectories():
+        subdir_path = os.path.join(show_path, subdir_name)
+        entry = listing[subdir_name] = {"shots": [], "assets": []}
+        for root, _, files in show_manager.backend.walk(subdir_path):
+            category = os.path.relpath(root, subdir_path).replace(os.sep, "/")
+            names = sorted(name for name in files if name.endswith(".json") and name != "description.json")
+            if category == ".":
+                entry["shots"] = names
+            else:
+                entry["assets"].extend(f"{category}/{name}" for name in names)
+    return listing
+
+
+def _check_integrity(show_manager: ShowManager, repair: bool) -> Dict:
+    return show_manager.check_integrity(repair=repair)
+
+
+class StudioCoordinator:
+    def __init__(self, studio_path: str, workers: int = None, backend_factory=None):
+        """
+        Run an operation on many shows of a studio at once, one show per worker process.
+
+        Every directory under 'studio_path' is a show, as the 'directory_name' of a ShowManager.
+        The messages the managers emit are captured per show instead of interleaving on the
+        console, and are logged as configured (see configure_output) in the worker.
+
+        Args:
+            studio_path (str): The directory holding the shows.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            backend_factory (callable, optional): A module-level function called in the worker as
+                backend_factory(studio_path, show_name) to make the show's backend, which is closed
+                afterwards if it has a close() method. Defaults to the JSON directory tree.
+        """
+        self.studio_path = studio_path
+        self.workers = workers or os.cpu_count() or 1
+        self.backend_factory = backend_factory
+        self.cancelled = threading.Event()
+
+    def show_names(self) -> List[str]:
+        """
+        Get the names of the shows in the studio.
+
+        Returns:
+            List[str]: A sorted list of show directory names.
+        """
+        return sorted(entry.name for entry in os.scandir(self.studio_path)
+                      if entry.is_dir() and not entry.name.startswith("."))
+
+    def run(self, function, show_names: List[str] = None, args: tuple = (), kwargs: Dict = None,
+            progress=None) -> Dict:
+        """
+        Call a function with the ShowManager of each show, spread over the worker processes.
+
+        Args:
+            function (callable): A module-level function called as function(show_manager, *args, **kwargs).
+            show_names (List[str], optional): The shows to run on. Defaults to every show in the studio.
+            args (tuple): More positional arguments for the function.
+            kwargs (Dict, optional): Keyword arguments for the function.
+            progress (callable, optional): Called with each show's result dictionary as it finishes.
+
+        Returns:
+            Dict: 'results' (the function's return value by show), 'errors' (the traceback by show),
+            'output' (the managers' messages, one per line, by show), 'seconds' (by show) and 'cancelled'
+            (the shows that never started because cancel() was called).
+        """
+        show_names = self.show_names() if show_names is None else list(show_names)
+        self.cancelled.clear()
+        report = {"results": {}, "errors": {}, "output": {}, "seconds": {}, "cancelled": []}
+        waiting = collections.deque(show_names)
+        workers = min(self.workers, max(len(show_names), 1))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            # Only as many shows as there are workers are handed out, so cancel() takes effect at once.
+            running = set()
+            try:
+                while waiting or running:
+                    while waiting and len(running) < workers and not self.cancelled.is_set():
+                        running.add(executor.submit(
+                            _run_show_operation, self.studio_path, waiting.popleft(), function, args, kwargs or {},
+                            self.backend_factory
+                        ))
+                    if not running:
+                        break
+                    done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        show_name = result["show"]
+                        if result["error"] is not None:
+                            report["errors"][show_name] = result["error"]
+                        else:
+                            report["results"][show_name] = result["result"]
+                        report["output"][show_name] = result["output"]
+                        report["seconds"][show_name] = result["seconds"]
+                        if progress is not None:
+                            progress(result)
+            except KeyboardInterrupt:
+                self.cancel()
+                raise
+        report["cancelled"] = list(waiting)
+        return report
+
+    def cancel(self) -> None:
+        """
+        Stop a running run(): shows not started yet are skipped, shows already running finish.
+        Can be called from another thread or from the progress callback.
+        """
+        self.cancelled.set()
+
+    def zip_shows(self, show_names: List[str] = None, compression: str = "deflate", level: int = None,
+                  threads: int = 1, progress=None) -> Dict:
+        """
+        Zip every show to '<show>.zip' in the studio directory.
+
+        Args:
+            show_names (List[str], optional): The shows to zip. Defaults to every show.
+            compression (str): 'stored', 'deflate', 'bzip2' or 'lzma'.
+            level (int, optional): The compression level.
+            threads (int): The compression threads inside each worker process.
+            progress (callable, optional): Called with each show's result as it finishes.
+
+        Returns:
+            Dict: The report of run(), with the archive statistics of each show.
+        """
+        return self.run(_zip_show, show_names, (compression, level, threads), progress=progress)
+
+    def read_descriptions(self, show_names: List[str] = None, progress=None) -> Dict:
+        """
+        Read the description files of every show and of its subdirectories.
+
+        Returns:
+            Dict: The report of run(), with the descriptions of each show by subdirectory ('' for the show itself).
+        """
+        return self.run(_read_descriptions, show_names, progress=progress)
+
+    def list_shows(self, show_names: List[str] = None, progress=None) -> Dict:
+        """
+        List the shot and asset files of every show.
+
+        Returns:
+            Dict: The report of run(), with {'shots': [...], 'assets': [...]} by subdirectory for each show.
+        """
+        return self.run(_list_show, show_names, progress=progress)
+
+    def check_integrity(self, show_names: List[str] = None, repair: bool = False, progress=None) -> Dict:
+        """
+        Check (and optionally repair) the references of every show, as ShowManager.check_integrity.
+
+        Returns:
+            Dict: The report of run(), with the integrity reports of each show by subdirectory.
+        """
+        return self.run(_check_integrity, show_names, (repair,), progress=progress)
+
+# ==================================================================================== END STUDIO ====================================================================================
+
+
+
+# ==================================================================================== BEGIN EXPORT ====================================================================================
+
+EXPORT_FORMATS = ("jsonl", "csv")
+EXPORT_COLUMNS = ["show", "kind", "category", "file", "name", "age", "breed", "assets", "additional_info", "Shots", "extra"]
+EDGE_COLUMNS = ["show", "shot", "asset", "declared_by"]
+
+
+def iter_show_records(source_path: str, backend=None):
+    """
+    Yield every shot and asset record of a show directory or of a full show archive, one at a time.
+
+    The layout is the one zip_show archives: each subdirectory of the show holds shot files,
+    and asset folders with asset files. Only one document is held in memory at a time.
+
+    Args:
+        source_path (str): The show directory (e.g. '<base>/Animal_Kingdom') or an archive made by zip_show.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show directory.
+
+    Yields:
+        Dict: Records with 'show' (the subdirectory), 'kind' ('shot' or 'asset'), 'category' ('' for shots),
+        'file' and 'data' keys.
+    """
+    if os.path.isfile(source_path) and zipfile.is_zipfile(source_path):
+        reader = open_archive(source_path)
+        for member_name in reader.list_members():
+            parts = member_name.split("/")
+            record = _export_record(parts)
+            if record is None:
+                continue
+            try:
+                record["data"] = decode_document(reader.read_bytes(member_name), CODECS["fast"])
+            except ValueError:
+                continue
+            if isinstance(record["data"], dict):
+                yield record
+        return
+
+    backend = backend if backend is not None else JsonTreeBackend()
+    for root, dirs, files in backend.walk(source_path):
+        dirs.sort()
+        relative_path = os.path.relpath(root, source_path)
+        parts = [] if relative_path == "." else relative_path.split(os.sep)
+        for file_name in sorted(files):
+            record = _export_record(parts + [file_name])
+            if record is None:
+                continue
+            try:
+                record["data"] = backend.read(os.path.join(root, file_name))
+            except (OSError, ValueError):
+                continue
+            if isinstance(record["data"], dict):
+                yield record
+
+
+def _export_record(parts: List[str]) -> Dict:
+    # Classify a path inside the show: '<subdir>/<shot>.json' or '<subdir>/<category...>/<asset>.json'.
+    file_name = parts[-1]
+    if len(parts) < 2 or not file_name.endswith(".json") or file_name == "description.json" or file_name.startswith("."):
+        return None
+    kind = "shot" if len(parts) == 2 else "asset"
+    return {"show": parts[0], "kind": kind, "category": "/".join(parts[1:-1]), "file": file_name}
+
+
+def iter_record_edges(record: Dict):
+    """
+    Yield the shot-asset references a record declares.
+
+    Args:
+        record (Dict): A record from iter_show_records.
+
+    Yields:
+        Dict: Edges with 'show', 'shot', 'asset' and 'declared_by' ('shot' or 'asset') keys.
+    """
+    if record["kind"] == "shot":
+        shot = shot_reference(record["file"])
+        for asset in _as_name_list(record["data"].get("assets")):
+            yield {"show": record["show"], "shot": shot, "asset": asset, "declared_by": "shot"}
+    else:
+        asset = asset_reference(record["category"], record["file"])
+        for shot in _as_name_list(record["data"].get("Shots")):
+            yield {"show": record["show"], "shot": shot, "asset": asset, "declared_by": "asset"}
+
+
+class _ExportFile:
+    def __init__(self, output_path: str, export_format: str, columns: List[str]):
+        # Writes to a temporary file next to the output, renamed over it by commit().
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{export_format}'. Use one of {EXPORT_FORMATS}.")
+        self.output_path = output_path
+        self.export_format = export_format
+        self.columns = columns
+        file_descriptor, self.temp_path = _open_temp_file(output_path)
+        self.file = open(file_descriptor, 'w', encoding='utf-8', newline='', buffering=1024 * 1024)
+        self.count = 0
+        if export_format == "csv":
+            self.csv_writer = csv.writer(self.file)
+            self.csv_writer.writerow(columns)
+
+    def write(self, row: Dict) -> None:
+        if self.export_format == "jsonl":
+            self.file.write(CODECS["fast"].encode(row).decode('utf-8'))
+            self.file.write("\n")
+        else:
+            self.csv_writer.writerow([row.get(column, "") for column in self.columns])
+        self.count += 1
+
+    def commit(self) -> None:
+        self.file.close()
+        os.replace(self.temp_path, self.output_path)
+
+    def discard(self) -> None:
+        self.file.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.temp_path)
+
+
+def _flatten_record(record: Dict) -> Dict:
+    # One CSV row: lists, objects and keys outside the usual schemas are written as JSON.
+    row = {"show": record["show"], "kind": record["kind"], "category": record["category"], "file": record["file"]}
+    extra = {}
+    for key, value in record["data"].items():
+        if key not in EXPORT_COLUMNS:
+            extra[key] = value
+        elif value is None:
+            continue
+        else:
+            row[key] = json.dumps(value, separators=(",", ":")) if isinstance(value, (list, dict)) else value
+    if extra:
+        row["extra"] = json.dumps(extra, separators=(",", ":"))
+    return row
+
+
+def export_show(source_path: str, output_path: str, export_format: str = "jsonl", edges_path: str = None,
+                backend=None) -> Dict:
+    """
+    Export every shot and asset record of a show directory or archive to JSON Lines or CSV, in one streaming pass.
+
+    JSON Lines rows are the records of iter_show_records. CSV rows have the EXPORT_COLUMNS:
+    the usual keys of the shot and asset schemas, lists as JSON, and any other keys as a
+    JSON object in 'extra'. Files are written to a temporary file and renamed when complete.
+
+    Args:
+        source_path (str): The show directory or an archive made by zip_show.
+        output_path (str): The file to write the records to.
+        export_format (str): 'jsonl' or 'csv'.
+        edges_path (str, optional): Also write one row per shot-asset reference (EDGE_COLUMNS) to this file, in the same format.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show directory.
+
+    Returns:
+        Dict: The number of 'records' and 'edges' written.
+    """
+    records_file = _ExportFile(output_path, export_format, EXPORT_COLUMNS)
+    edges_file = _ExportFile(edges_path, export_format, EDGE_COLUMNS) if edges_path else None
+    try:
+        for record in iter_show_records(source_path, backend):
+            records_file.write(record if export_format == "jsonl" else _flatten_record(record))
+            if edges_file is not None:
+                for edge in iter_record_edges(record):
+                    edges_file.write(edge)
+    except BaseException:
+        records_file.discard()
+        if edges_file is not None:
+            edges_file.discard()
+        raise
+    records_file.commit()
+    if edges_file is not None:
+        edges_file.commit()
+    return {"records": records_file.count, "edges": edges_file.count if edges_file is not None else 0}
+
+# ==================================================================================== END EXPORT ====================================================================================
+
+
+
+# ==================================================================================== BEGIN IMPORT ====================================================================================
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def iter_import_rows(source_path: str, import_format: str = None, start_row: int = 0):
+    """
+    Read the records of a JSON Lines or CSV breakdown, one row at a time.
+
+    The rows are the ones export_show writes. A JSON Lines row is an object with 'show', 'kind',
+    'category', 'file' and 'data' keys. A CSV row has the EXPORT_COLUMNS, with lists and the
+    'extra' column as JSON.
+
+    Args:
+        source_path (str): The breakdown file.
+        import_format (str, optional): 'jsonl' or 'csv'. Defaults to the file's extension.
+        start_row (int): Skip the rows up to and including this one, without decoding them.
+
+    Yields:
+        tuple: (row, record, problem) where row is the 1-based row number (the line for JSON Lines,
+        the row after the header for CSV), and either record or problem (a message) is None.
+    """
+    import_format = import_format or os.path.splitext(source_path)[1].lstrip(".").lower()
+    if import_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown import format '{import_format}'. Use one of {EXPORT_FORMATS}.")
+
+    with open(source_path, 'r', encoding='utf-8', newline='') as file:
+        if import_format == "jsonl":
+            for row, line in enumerate(file, 1):
+                if row <= start_row or not line.strip():
+                    continue
+                try:
+                    yield row, CODECS["fast"].decode(line.encode('utf-8')), None
+                except ValueError as error:
+                    yield row, None, f"Invalid JSON: {error}"
+            return
+
+        for row, cells in enumerate(csv.DictReader(file), 1):
+            if row <= start_row:
+                continue
+            try:
+                yield row, _unflatten_row(cells), None
+            except ValueError as error:
+                yield row, None, f"Invalid JSON cell: {error}"
+
+
+def _unflatten_row(cells: Dict) -> Dict:
+    # The reverse of _flatten_record: empty cells are missing keys, list and object cells are JSON.
+    data = {}
+    for column in EXPORT_COLUMNS[4:-1]:
+        value = cells.get(column)
+        if not value:
+            continue
+        if column == "age" and value.isdigit():
+            value = int(value)
+        elif value[0] in "[{":
+            value = json.loads(value)
+        data[column] = value
+    if cells.get("extra"):
+        data.update(json.loads(cells["extra"]))
+    return {"show": cells.get("show"), "kind": cells.get("kind"), "category": cells.get("category") or "",
+            "file": cells.get("file"), "data": data}
+
+
+def _validate_record(record) -> str:
+    if not isinstance(record, dict):
+        return "The row must be an object."
+    kind, category = record.get("kind"), record.get("category") or ""
+    if kind not in ("shot", "asset"):
+        return "The kind must be 'shot' or 'asset'."
+    problem = _validate_file_name(record.get("show")) or _validate_file_name(record.get("file"), ".json")
+    if problem:
+        return problem
+    if not isinstance(category, str):
+        return "The category must be a string."
+    if kind == "shot" and category:
+        return "Shots have no category."
+    if kind == "asset" and any(part in ("", ".", "..") or "\\" in part for part in category.split("/")):
+        return f"Asset category '{category}' must be a relative folder path, e.g. 'Prop'."
+    return _validate_document(record.get("data"), "assets" if kind == "shot" else "Shots")
+
+
+def _read_checkpoint(checkpoint_path: str, source_path: str, show_path: str) -> Dict:
+    try:
+        with open(checkpoint_path, 'rb') as file:
+            checkpoint = json.loads(file.read())
+    except FileNotFoundError:
+        return None
+    if checkpoint.get("source") != os.path.abspath(source_path) or checkpoint.get("show_path") != os.path.abspath(show_path):
+        raise ValueError(f"Checkpoint '{checkpoint_path}' belongs to another import.")
+    return checkpoint
+
+
+def import_show(source_path: str, show_path: str, import_format: str = None, backend=None, workers: int = None,
+                checkpoint_path: str = None, batch_size: int = IMPORT_BATCH_SIZE) -> Dict:
+    """
+    Create the shot and asset files of a JSON Lines or CSV breakdown in a show directory.
+
+    Rows are read one batch at a time and validated; invalid rows are reported and skipped.
+    Each subdirectory and asset folder is created once, each batch of files is written by
+    a thread pool, and the show indexes are updated once per batch. Existing files are left
+    untouched, as with ShotManager.create_many and AssetManager.create_many.
+
+    With a checkpoint file, the last row of every completed batch is recorded, and an
+    interrupted import started again with the same arguments resumes after it. The
+    checkpoint is removed once the import finishes.
+
+    Args:
+        source_path (str): The breakdown file, e.g. one written by export_show.
+        show_path (str): The show directory (e.g. '<base>/Animal_Kingdom'), created if needed.
+        import_format (str, optional): 'jsonl' or 'csv'. Defaults to the file's extension.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): Where the documents are stored.
+        workers (int, optional): The number of writer threads. Defaults to the number of CPUs.
+        checkpoint_path (str, optional): The checkpoint file that makes the import resumable.
+        batch_size (int): The number of rows written per batch.
+
+    Returns:
+        Dict: 'rows' read, the number of files 'created', 'exists' (left untouched), 'invalid' and 'failed',
+        'resumed_from' (the row the import started after) and 'problems', one {'row', 'status', 'message'}
+        per invalid or failed row.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    report = {"rows": 0, "created": 0, "exists": 0, "invalid": 0, "failed": 0, "resumed_from": 0, "problems": []}
+    checkpoint = _read_checkpoint(checkpoint_path, source_path, show_path) if checkpoint_path else None
+    if checkpoint is not None:
+        report.update(checkpoint["report"], resumed_from=checkpoint["row"])
+
+    folders = {}  # folder path -> names of the files in it
+    batch = []
+
+    def add_problem(row, status, message):
+        report[status] += 1
+        report["problems"].append({"row": row, "status": status, "message": message})
+
+    def write_batch(last_row):
+        documents = {}
+        for row, record in batch:
+            parts = [record["show"]] + (record["category"].split("/") if record["kind"] == "asset" else [])
+            folder_path = os.path.join(show_path, *parts)
+            if folder_path not in folders:
+                backend.make_dirs(folder_path)
+                folders[folder_path] = set(backend.list_files(folder_path))
+            if record["file"] in folders[folder_path] or os.path.join(folder_path, record["file"]) in documents:
+                report["exists"] += 1
+            else:
+                documents[os.path.join(folder_path, record["file"])] = (row, record)
+
+        errors = _write_documents(backend, {path: record["data"] for path, (_, record) in documents.items()}, workers)
+        by_show = collections.defaultdict(list)
+        for path, (row, record) in documents.items():
+            if errors.get(path) is not None:
+                add_problem(row, "failed", str(errors[path]))
+            else:
+                report["created"] += 1
+                folders[os.path.dirname(path)].add(record["file"])
+                by_show[os.path.join(show_path, record["show"])].append(record)
+        for subdirectory_path, records in by_show.items():
+            index = get_show_index(subdirectory_path, backend)
+            with index.transaction():
+                for record in records:
+                    if record["kind"] == "shot":
+                        index.set_shot_document(record["file"], record["data"])
+                    else:
+                        index.set_asset_document(record["category"], record["file"], record["data"])
+        _search_documents_changed({
+            path: record["data"] for path, (_, record) in documents.items() if errors.get(path) is None
+        })
+        batch.clear()
+        if checkpoint_path:
+            atomic_write(checkpoint_path, json.dumps({
+                "source": os.path.abspath(source_path), "show_path": os.path.abspath(show_path),
+                "row": last_row, "report": {key: value for key, value in report.items() if key != "resumed_from"},
+            }).encode('utf-8'))
+
+    row = report["resumed_from"]
+    for row, record, problem in iter_import_rows(source_path, import_format, report["resumed_from"]):
+        report["rows"] += 1
+        problem = problem or _validate_record(record)
+        if problem:
+            add_problem(row, "invalid", problem)
+            continue
+        record["category"] = record.get("category") or ""
+        batch.append((row, record))
+        if len(batch) >= batch_size:
+            write_batch(row)
+    if batch:
+        write_batch(row)
+
+    if checkpoint_path:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(checkpoint_path)
+    return report
+
+# ==================================================================================== END IMPORT ====================================================================================
+
+
+
+# ==================================================================================== BEGIN LISTING ====================================================================================
+
+# One page of a listing: the names, and the cursor to pass for the next page (None on the last page).
+Page = collections.namedtuple("Page", ["items", "cursor"])
+
+
+def iter_entries(backend, path: str, directories: bool = False, pattern: str = None, exclude=()):
+    """
+    Yield the names in a directory lazily, as the backend lists them.
+
+    Args:
+        backend (JsonTreeBackend | SQLiteBackend | ArchiveBackend | CachedBackend): The backend holding the directory.
+        path (str): The directory to list.
+        directories (bool): Yield directory names instead of file names.
+        pattern (str, optional): Only yield names matching this glob pattern, e.g. 'character1*.json'.
+        exclude (tuple): Names never to yield, e.g. ('description.json',).
+
+    Yields:
+        str: The names, in name order on catalog and archive backends, in directory order otherwise.
+    """
+    for name in backend.iter_names(path, directories, pattern):
+        if name not in exclude:
+            yield name
+
+
+def page_entries(backend, path: str, directories: bool = False, limit: int = 100, cursor: str = None,
+                 pattern: str = None, descending: bool = False, exclude=()) -> Page:
+    """
+    Get one page of the names in a directory, in name order.
+
+    The cursor is the last name of the previous page, so pages stay consistent when
+    entries are added or removed between calls: nothing is repeated or skipped.
+    Catalog and archive backends return their names in order, so only the page is read.
+    On the directory tree the listing is streamed through a heap holding one page.
+
+    Args:
+        backend (JsonTreeBackend | SQLiteBackend | ArchiveBackend | CachedBackend): The backend holding the directory.
+        path (str): The directory to list.
+        directories (bool): List directory names instead of file names.
+        limit (int): The maximum number of names in the page.
+        cursor (str, optional): The cursor of the previous page. Defaults to the first page.
+        pattern (str, optional): Only list names matching this glob pattern, e.g. '*.json'.
+        descending (bool): List the names in reverse order.
+        exclude (tuple): Names never to list, e.g. ('description.json',).
+
+    Returns:
+        Page: The names and the cursor of the next page.
+    """
+    if limit < 1:
+        raise ValueError("The page limit must be at least 1.")
+    names = (name for name in backend.iter_names(path, directories, pattern, cursor, descending) if name not in exclude)
+    if getattr(backend, "sorted_listing", False):
+        items = list(itertools.islice(names, limit + 1))
+    else:
+        items = (heapq.nlargest if descending else heapq.nsmallest)(limit + 1, names)
+    if len(items) > limit:
+        return Page(items[:limit], items[limit - 1])
+    return Page(items, None)
+
+# ==================================================================================== END LISTING ====================================================================================
+
+
+
+# ==================================================================================== BEGIN SEARCH ====================================================================================
+
+SEARCH_KINDS = ("description", "shot", "asset", "document")
+
+_open_search_indexes = {}
+_open_search_indexes_lock = threading.Lock()
+_SEARCH_TOKEN = re.compile(r"\w+\*?")
+
+
+def _search_kind(document: str) -> str:
+    # The layout of the watcher: '<subdir>/<shot>.json' and '<subdir>/<category...>/<asset>.json'.
+    parts = document.split("/")
+    if parts[-1] == "description.json":
+        return "description"
+    if len(parts) == 1:
+        return "document"
+    return "shot" if len(parts) == 2 else "asset"
+
+
+def _fold(word: str) -> str:
+    # Lower case without diacritics, as the unicode61 tokenizer indexes words.
+    return "".join(char for char in unicodedata.normalize("NFKD", word) if not unicodedata.combining(char)).casefold()
+
+
+def _snippet(text: str, words: List[tuple], size: int = 12) -> str:
+    # Up to 'size' words of text around the first match, with the matching words in [brackets].
+    tokens = re.split(r"(\W+)", text)
+    matched = []
+    for position in range(0, len(tokens), 2):
+        token = _fold(tokens[position])
+        if token and any(token.startswith(word) if is_prefix else token == word for word, is_prefix in words):
+            matched.append(position)
+            tokens[position] = f"[{tokens[position]}]"
+    start = max(0, (matched[0] if matched else 0) - size // 2 * 2)
+    end = start + size * 2 - 1
+    return ("..." if start else "") + "".join(tokens[start:end]).strip() + ("..." if end < len(tokens) else "")
+
+
+def _document_text(value) -> List[str]:
+    # Every string and number in a document, depth first.
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _document_text(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _document_text(item)]
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool) and value != "":
+        return [str(value)]
+    return []
+
+
+class SearchIndex:
+    def __init__(self, show_path: str, backend=None):
+        """
+        Open the full-text index of a show tree: every description.json and every shot and asset file.
+
+        The index is a SQLite FTS5 table stored with the show indexes (see ShowIndex), with
+        a prefix index for prefix queries, and results ranked by BM25. Each document's name
+        and folder path are weighted above the rest of its text. Use get_search_index instead
+        of creating instances, so writes made through the managers reach the index.
+
+        Args:
+            show_path (str): The main show directory, e.g. '<base>/Animal_Kingdom'.
+            backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show.
+        """
+        self.show_path = os.path.abspath(show_path)
+        self.backend = backend if backend is not None else JsonTreeBackend()
+        self.catalog, self.show_key = self.backend.open_index(self.show_path)
+        with self.catalog.transaction():
+            self.catalog.execute(
+                "CREATE TABLE IF NOT EXISTS search_documents ("
+                "id INTEGER PRIMARY KEY, show TEXT NOT NULL, path TEXT NOT NULL, kind TEXT NOT NULL, name TEXT, signature TEXT, "
+                "UNIQUE (show, path))"
+            )
+            self.catalog.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5("
+                "name, text, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+
+    def close(self) -> None:
+        """
+        Release the index connection.
+        """
+        self.backend.close_index(self.catalog)
+
+    def refresh(self, workers: int = None) -> Dict:
+        """
+        Bring the index up to date with the show tree, reading only the files that changed.
+
+        Files are compared by their size and modification time, so a refresh of an unchanged
+        tree costs one directory walk (the SQLite backend keeps no such signature, so there
+        every file is read again). Changed files are read by a pool of threads.
+
+        Args:
+            workers (int, optional): The number of reader threads. Defaults to the number of CPUs.
+
+        Returns:
+            Dict: The number of documents 'added', 'updated' and 'removed', and the 'documents' indexed.
+        """
+        indexed = {path: signature for path, signature in self.catalog.query(
+            "SELECT path, signature FROM search_documents WHERE show = ?", (self.show_key,))}
+        changed = []
+        seen = set()
+        for root, dirs, files in self.backend.walk(self.show_path):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            for file_name in files:
+                if not file_name.endswith(".json") or file_name.startswith("."):
+                    continue
+                path = os.path.join(root, file_name)
+                document = self._document(path)
+                seen.add(document)
+                try:
+                    signature = repr(self.backend.signature(path))
+                except OSError:
+                    continue
+                if indexed.get(document) != signature or signature == "None":
+                    changed.append((path, document, signature))
+
+        def read(item):
+            try:
+                return item, self.backend.read(item[0])
+            except (OSError, ValueError):
+                return item, None
+
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            # Files are read in batches outside the transaction: the SQLite backend reads through the same catalog.
+            for batch_start in range(0, len(changed), LISTING_BATCH_SIZE):
+                documents = list(executor.map(read, changed[batch_start:batch_start + LISTING_BATCH_SIZE]))
+                with self.catalog.transaction():
+                    for (path, document, signature), data in documents:
+                        if data is None:
+                            continue
+                        counts["updated" if document in indexed else "added"] += 1
+                        self._set(document, data, signature)
+        with self.catalog.transaction():
+            for document in set(indexed) - seen:
+                self._remove(document, False)
+                counts["removed"] += 1
+        counts["documents"] = len(seen)
+        return counts
+
+    def set_document(self, path: str, data: Dict) -> None:
+        """
+        Index (or re-index) one file of the show tree.
+
+        Args:
+            path (str): The path of the JSON file.
+            data (Dict): Its contents.
+        """
+        self.set_documents({path: data})
+
+    def set_documents(self, documents: Dict) -> None:
+        """
+        Index (or re-index) several files of the show tree in one transaction.
+
+        Args:
+            documents (Dict): The contents of each file, keyed by path.
+        """
+        with self.catalog.transaction():
+            for path, data in documents.items():
+                try:
+                    signature = repr(self.backend.signature(path))
+                except OSError:
+                    signature = None
+                self._set(self._document(path), data, signature)
+
+    def remove_path(self, path: str) -> None:
+        """
+        Remove a file, or every file under a folder, from the index.
+
+        Args:
+            path (str): The path of the file or folder.
+        """
+        with self.catalog.transaction():
+            self._remove(self._document(path), True)
+
+    def search(self, query: str, kind: str = None, limit: int = 20, prefix: bool = False) -> List[Dict]:
+        """
+        Find the documents matching every word of a query, best matches first.
+
+        Example:
+            index.search("environment")          # every document mentioning 'environment'
+            index.search("env*", kind="asset")   # assets with a word starting with 'env'
+            index.search("golden retr", prefix=True)
+
+        Args:
+            query (str): Words to look for. A word ending with '*' matches every word starting with it.
+            kind (str, optional): Only return 'description', 'shot', 'asset' or 'document' files.
+            limit (int): The maximum number of results.
+            prefix (bool): Treat every word as a prefix.
+
+        Returns:
+            List[Dict]: Results with the 'path' relative to the show, 'kind', 'name', 'score'
+            (lower is better) and a 'snippet' with the matches in [brackets].
+        """
+        if kind is not None and kind not in SEARCH_KINDS:
+            raise ValueError(f"Unknown kind '{kind}'. Use one of {SEARCH_KINDS}.")
+        terms = []
+        for token in _SEARCH_TOKEN.findall(query):
+            word = token.rstrip("*")
+            terms.append(f'"{word}"*' if prefix or token.endswith("*") else f'"{word}"')
+        if not terms:
+            return []
+        match = " AND ".join(terms)
+        sql = (
+            "SELECT search_documents.id, search_documents.path, search_documents.kind, search_documents.name, "
+            "bm25(search_text, 4.0, 1.0) AS score "
+            "FROM search_text JOIN search_documents ON search_documents.id = search_text.rowid "
+            "WHERE search_text MATCH ? AND search_documents.show = ?"
+        )
+        parameters = [match, self.show_key]
+        if kind is not None:
+            sql += " AND search_documents.kind = ?"
+            parameters.append(kind)
+        sql += " ORDER BY score LIMIT ?"
+        parameters.append(limit)
+        rows = self.catalog.query(sql, tuple(parameters))
+        if not rows:
+            return []
+        # Snippets are made for the returned rows only: FTS5's snippet() would run the query again.
+        texts = dict(self.catalog.query(
+            f"SELECT rowid, text FROM search_text WHERE rowid IN ({', '.join('?' * len(rows))})", tuple(row[0] for row in rows)
+        ))
+        words = [(_fold(token.rstrip("*")), prefix or token.endswith("*")) for token in _SEARCH_TOKEN.findall(query)]
+        return [
+            {"path": path, "kind": document_kind, "name": name, "score": round(score, 4),
+             "snippet": _snippet(texts.get(document_id, ""), words)}
+            for document_id, path, document_kind, name, score in rows
+        ]
+
+    def _document(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.show_path).replace(os.sep, "/")
+
+    def _set(self, document: str, data, signature: str) -> None:
+        kind = _search_kind(document)
+        parts = document.split("/")
+        name = data.get("name") if isinstance(data, dict) and isinstance(data.get("name"), str) else parts[-1][:-5]
+        rows = self.catalog.query("SELECT id FROM search_documents WHERE show = ? AND path = ?", (self.show_key, document))
+        if rows:
+            document_id = rows[0][0]
+            self.catalog.execute("DELETE FROM search_text WHERE rowid = ?", (document_id,))
+            self.catalog.execute("UPDATE search_documents SET kind = ?, name = ?, signature = ? WHERE id = ?",
+                                 (kind, name, signature, document_id))
+        else:
+            self.catalog.execute("INSERT INTO search_documents (show, path, kind, name, signature) VALUES (?, ?, ?, ?, ?)",
+                                 (self.show_key, document, kind, name, signature))
+            document_id = self.catalog.query("SELECT last_insert_rowid()")[0][0]
+        # The name column (weighted higher) also holds the folder path and file name, so 'Prop' finds the props.
+        self.catalog.execute("INSERT INTO search_text (rowid, name, text) VALUES (?, ?, ?)",
+                             (document_id, " ".join([name] + parts[:-1] + [parts[-1][:-5]]), " ".join(_document_text(data))))
+
+    def _remove(self, document: str, tree: bool) -> None:
+        # With 'tree', a folder takes every document under it; '.' is the whole show.
+        if document == ".":
+            condition, parameters = "show = ?", (self.show_key,)
+        elif tree:
+            condition = "show = ? AND (path = ? OR substr(path, 1, ?) = ?)"
+            parameters = (self.show_key, document, len(document) + 1, f"{document}/")
+        else:
+            condition, parameters = "show = ? AND path = ?", (self.show_key, document)
+        self.catalog.execute(f"DELETE FROM search_text WHERE rowid IN (SELECT id FROM search_documents WHERE {condition})", parameters)
+        self.catalog.execute(f"DELETE FROM search_documents WHERE {condition}", parameters)
+
+
+def get_search_index(show_path: str, backend=None) -> SearchIndex:
+    """
+    Get the shared full-text index of a show tree, opening it (and bringing it up to date) on first use.
+
+    Args:
+        show_path (str): The main show directory, e.g. '<base>/Animal_Kingdom'.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show.
+
+    Returns:
+        SearchIndex: The index of the show tree.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    key = backend.index_key(show_path)
+    with _open_search_indexes_lock:
+        index = _open_search_indexes.get(key)
+        if index is None:
+            index = SearchIndex(show_path, backend)
+            index.refresh()
+            _open_search_indexes[key] = index
+        return index
+
+
+def close_search_index(show_path: str, backend=None) -> None:
+    """
+    Close the shared full-text index of a show tree.
+
+    Args:
+        show_path (str): The main show directory.
+        backend (JsonTreeBackend | SQLiteBackend | CachedBackend, optional): The backend holding the show.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+    with _open_search_indexes_lock:
+        index = _open_search_indexes.pop(backend.index_key(show_path), None)
+    if index is not None:
+        index.close()
+
+
+def _search_indexes_for(path: str) -> List[SearchIndex]:
+    path = os.path.abspath(path)
+    with _open_search_indexes_lock:
+        indexes = list(_open_search_indexes.values())
+    return [index for index in indexes if path == index.show_path or path.startswith(index.show_path + os.sep)]
+
+
+def _search_documents_changed(documents: Dict) -> None:
+    # Called by the managers after they write JSON files ({path: data}), to update the open search indexes holding them.
+    with _open_search_indexes_lock:
+        if not _open_search_indexes:
+            return
+    by_index = collections.defaultdict(dict)
+    for path, data in documents.items():
+        for index in _search_indexes_for(path):
+            by_index[index][path] = data
+    for index, changed in by_index.items():
+        index.set_documents(changed)
+
+
+def _search_path_removed(path: str) -> None:
+    # Called by the managers after they delete a file or folder.
+    for index in _search_indexes_for(path):
+        index.remove_path(path)
+
+
+def search_subscriber(show_path: str, backend=None):
+    """
+    Make a watcher subscriber that keeps the full-text index of a show tree up to date.
+
+    Example:
+        ShowWatcher("<base>/Animal_Kingdom").subscribe(search_subscriber("<base>/Animal_Kingdom"))
+
+    Args:
+        show_path (str): The main show directory, the one being watched.
+        backend (JsonTreeBackend | CachedBackend, optional): The backend the managers use. Defaults to the JSON directory tree.
+
+    Returns:
+        callable: The subscriber.
+    """
+    backend = backend if backend is not None else JsonTreeBackend()
+
+    def update_index(events: List[ChangeEvent]) -> None:
+        index = get_search_index(show_path, backend)
+        for event in events:
+            if event.action == "deleted":
+                index.remove_path(event.path)
+            elif event.kind in ("shot", "asset", "description"):
+                try:
+                    data = backend.read(event.path)
+                except (OSError, ValueError):
+                    continue  # half-written; the next event for the file brings the finished version
+                index.set_document(event.path, data)
+
+    return update_index
+
+# ==================================================================================== END SEARCH ====================================================================================
+
+
+# ==================================================================================== BEGIN BLOBS ====================================================================================
+
+BLOB_STORE_NAME = ".showshot-blobs"
+LINK_MODES = ("hardlink", "reflink")
+FICLONE = 0x40049409  # Linux ioctl cloning a file's extents (btrfs, XFS)
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(source_path: str, target_path: str) -> None:
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this platform.")
+    with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+        fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+
+
+class BlobStore:
+    def __init__(self, studio_path: str, link: str = "hardlink"):
+        """
+        Open the content-addressed store of a studio, where identical files are kept once.
+
+        Blobs live in '<studio>/.showshot-blobs/<first two hex digits>/<sha256>'. A deduplicated
+        file is a hard link to its blob (or a reflink, a copy-on-write clone sharing its disk
+        blocks), so shows keep their usual layout and nothing reading them has to change.
+        The managers always replace files instead of rewriting them in place, which gives an
+        edited file its own copy again. Tools that edit files in place must not be used on
+        hard-linked files, since every copy would change; reflinks are safe.
+
+        Args:
+            studio_path (str): The studio root holding the shows; the store is created inside it.
+            link (str): 'hardlink' (any POSIX or NTFS file system) or 'reflink' (btrfs or XFS on Linux).
+        """
+        if link not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{link}'. Use one of {LINK_MODES}.")
+        self.studio_path = studio_path
+        self.link = link
+        self.store_path = os.path.join(studio_path, BLOB_STORE_NAME)
+
+    def blob_path(self, digest: str) -> str:
+        """
+        Get the path of a blob.
+
+        Args:
+            digest (str): The SHA-256 hex digest of the blob's contents.
+
+        Returns:
+            str: The blob path, which may not exist.
+        """
+        return os.path.join(self.store_path, digest[:2], digest)
+
+    def deduplicate(self, paths: List[str], min_size: int = 1, workers: int = None) -> Dict:
+        """
+        Store every file under some directories once, replacing the copies with links to their blob.
+
+        Files are hashed by a pool of threads. Files already linked to their blob are skipped,
+        and a file that changes while it is being hashed is left alone.
+
+        Args:
+            paths (List[str]): The directories (or files) to deduplicate, e.g. show or asset folders.
+            min_size (int): Files smaller than this many bytes are left alone.
+            workers (int, optional): The number of hashing threads. Defaults to the number of CPUs.
+
+        Returns:
+            Dict: 'files' examined, 'linked' (replaced by a link to an existing blob), 'stored' (new blobs),
+            'already_linked', 'bytes_reclaimed' by this run, and 'errors' ({path: message}).
+        """
+        files = []
+        for path in _as_name_list(paths):
+            if os.path.isfile(path):
+                files.append(path)
+                continue
+            for root, dirs, names in os.walk(path):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                files.extend(os.path.join(root, name) for name in names
+                             if _is_tree_file(name) and not name.startswith("."))
+
+        report = {"files": 0, "linked": 0, "stored": 0, "already_linked": 0, "bytes_reclaimed": 0, "errors": {}}
+
+        def examine(path):
+            stat = os.stat(path, follow_symlinks=False)
+            if not stat_module.S_ISREG(stat.st_mode) or stat.st_size < min_size:
+                return path, stat, None
+            return path, stat, _hash_file(path)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            futures = [executor.submit(examine, path) for path in files]
+            for future in futures:
+                try:
+                    path, stat, digest = future.result()
+                    if digest is not None:
+                        report["files"] += 1
+                        status = self._link(path, stat, digest)
+                        report[status] += 1
+                        if status == "linked" and stat.st_nlink == 1:
+                            # The copy's own blocks are freed (other hard links would keep them alive).
+                            report["bytes_reclaimed"] += stat.st_size
+                except OSError as error:
+                    report["errors"][getattr(error, "filename", None) or str(error)] = str(error)
+        return report
+
+    def _link(self, path: str, stat: os.stat_result, digest: str) -> str:
+        blob_path = self.blob_path(digest)
+        try:
+            blob_stat = os.stat(blob_path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            try:
+                if self.link == "hardlink":
+                    os.link(path, blob_path)
+                else:
+                    _reflink(path, blob_path)
+                    os.chmod(blob_path, 0o444)
+                return "stored"
+            except FileExistsError:
+                blob_stat = os.stat(blob_path)
+        if (blob_stat.st_dev, blob_stat.st_ino) == (stat.st_dev, stat.st_ino):
+            return "already_linked"
+
+        # Link the blob under a temporary name, then rename it over the copy, unless the copy changed meanwhile.
+        directory = os.path.dirname(path)
+        temp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}{ATOMIC_TEMP_SUFFIX}")
+        if self.link == "hardlink":
+            os.link(blob_path, temp_path)
+        else:
+            _reflink(blob_path, temp_path)
+        try:
+            current = os.stat(path, follow_symlinks=False)
+            if (current.st_ino, current.st_mtime_ns, current.st_size) != (stat.st_ino, stat.st_mtime_ns, stat.st_size):
+                raise OSError(f"'{path}' changed while it was being deduplicated.")
+            if self.link == "reflink":
+                os.chmod(temp_path, stat.st_mode & 0o7777)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return "linked"
+
+    def report(self) -> Dict:
+        """
+        Measure the space the store saves.
+
+        Returns:
+            Dict: 'blobs' and the 'bytes_stored' once, the 'links' to them across the studio,
+            the 'bytes_referenced' by those links, 'bytes_reclaimed' (referenced minus stored)
+            and the 'unreferenced' blobs that collect_garbage would remove. Link counts are
+            only known for hard links.
+        """
+        report = {"blobs": 0, "bytes_stored": 0, "links": 0, "bytes_referenced": 0, "bytes_reclaimed": 0, "unreferenced": 0}
+        for blob_path in self._blob_paths():
+            stat = os.stat(blob_path)
+            links = stat.st_nlink - 1
+            report["blobs"] += 1
+            report["bytes_stored"] += stat.st_size
+            report["links"] += links
+            report["bytes_referenced"] += stat.st_size * links
+            report["unreferenced"] += links == 0
+        report["bytes_reclaimed"] = max(0, report["bytes_referenced"] - report["bytes_stored"])
+        return report
+
+    def collect_garbage(self) -> Dict:
+        """
+        Remove the hard-linked blobs no file links to any more.
+
+        Returns:
+            Dict: The number of 'blobs' removed and the 'bytes' freed.
+        """
+        removed = {"blobs": 0, "bytes": 0}
+        if self.link != "hardlink":
+            return removed
+        for blob_path in self._blob_paths():
+            stat = os.stat(blob_path)
+            if stat.st_nlink == 1:
+                os.remove(blob_path)
+                removed["blobs"] += 1
+                removed["bytes"] += stat.st_size
+        return removed
+
+    def _blob_paths(self):
+        if not os.path.isdir(self.store_path):
+            return
+        for prefix in sorted(os.listdir(self.store_path)):
+            prefix_path = os.path.join(self.store_path, prefix)
+            for name in sorted(os.listdir(prefix_path)):
+                yield os.path.join(prefix_path, name)
+
+# ==================================================================================== END BLOBS ====================================================================================
+
+
+# ==================================================================================== BEGIN DAEMON ====================================================================================
+
+_DAEMON_MANAGERS = {"show": ShowManager, "shot": ShotManager, "asset": AssetManager}
+# The constructor arguments and options a client may pass for each manager.
+_DAEMON_ARGUMENTS = {"show": 2, "shot": 1, "asset": 1}
+_DAEMON_OPTIONS = {"show": (), "shot": (), "asset": ("concurrency", "lock_timeout", "retries")}
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _DaemonRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        # One client connection: requests are answered in order until the client disconnects.
+        daemon = self.server.show_daemon
+        uid = peer_uid(self.request)
+        if uid is not None and uid != os.getuid():
+            return  # only processes of the daemon's user are answered
+        with daemon.lock:
+            daemon.counters["connections"] += 1
+            daemon.connections.add(self.request)
+        try:
+            self._answer(daemon)
+        finally:
+            with daemon.lock:
+                daemon.connections.discard(self.request)
+
+    def _answer(self, daemon) -> None:
+        while True:
+            try:
+                request = receive_message(self.request)
+            except (OSError, ValueError):
+                return  # a malformed message ends the connection
+            if request is None:
+                return
+            try:
+                send_message(self.request, daemon.serve(request))
+            except OSError:
+                return
+
+
+class ShowShotDaemon:
+    def __init__(self, studio_path: str, socket_path: str = None, max_entries: int = 100000,
+                 preload: bool = True, watch: bool = True):
+        """
+        Serve the managers of a studio to other processes over a Unix domain socket, with warm caches.
+
+        The daemon keeps one CachedBackend shared by every manager it serves, so each file is
+        parsed once and then served from memory (still checked against its mtime and size),
+        and keeps the show and search indexes open. Writes are flushed before each call returns.
+        A ShowWatcher per show drops the documents other processes change and keeps the indexes
+        up to date. Use ShowManagerClient, ShotManagerClient and AssetManagerClient to call it.
+
+        Requests and results are JSON (see ShowShotClient.encode_value). Only processes of the
+        user running the daemon are answered, and only the managers' public methods are served.
+
+        Example:
+            with ShowShotDaemon("<base>") as daemon:
+                daemon.serve_forever()
+
+        Args:
+            studio_path (str): The directory holding the shows, the 'directory_path' of a ShowManager.
+            socket_path (str, optional): The socket to listen on. Defaults to '<studio_path>/.showshot.sock',
+                where the clients look for it.
+            max_entries (int): The maximum number of documents held in memory.
+            preload (bool): Read every show's documents into memory when starting, instead of on first use.
+            watch (bool): Watch the shows for changes made by other processes.
+        """
+        self.studio_path = os.path.abspath(studio_path)
+        self.socket_path = socket_path or os.path.join(self.studio_path, DAEMON_SOCKET_NAME)
+        self.backend = CachedBackend(JsonTreeBackend(), max_entries=max_entries)
+        self.preload = preload
+        self.watch = watch
+        self.lock = threading.Lock()
+        self.managers = {}
+        self.shows = {}  # show name -> its ShowWatcher, or None
+        self.allowed_methods = {kind: set(_public_methods(manager_class)) for kind, manager_class in _DAEMON_MANAGERS.items()}
+        self.counters = {"connections": 0, "requests": 0, "errors": 0}
+        self.connections = set()
+        self.server = None
+        self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self) -> "ShowShotDaemon":
+        """
+        Open the shows and start answering requests in a background thread.
+
+        Returns:
+            ShowShotDaemon: The daemon itself.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket.
+        """
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise RuntimeError(f"A daemon is already listening on '{self.socket_path}'.")
+            except OSError:
+                os.remove(self.socket_path)  # left behind by a daemon that was killed
+            finally:
+                probe.close()
+        for entry in os.scandir(self.studio_path):
+            if entry.is_dir() and not entry.name.startswith("."):
+                self._open_show(entry.name)
+
+        self.server = _DaemonServer(self.socket_path, _DaemonRequestHandler)
+        os.chmod(self.socket_path, 0o600)
+        self.server.show_daemon = self
+        self.thread = threading.Thread(target=self.server.serve_forever, name="ShowShotDaemon", daemon=True)
+        self.thread.start()
+        _emit(f"Daemon serving '{self.studio_path}' on '{self.socket_path}' ({len(self.shows)} shows).")
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Answer requests until stop() is called or the process is interrupted.
+        """
+        if self.server is None:
+            self.start()
+        try:
+            while self.thread.is_alive():
+                self.thread.join(0.5)
+        except KeyboardInterrupt:
+            self.stop()
+
+    def stop(self) -> None:
+        """
+        Stop answering requests, stop the watchers, write out pending documents and remove the socket.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            with self.lock:
+                connections = list(self.connections)
+            for connection in connections:  # clients connected to this daemon fall back to direct access
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+        with self.lock:
+            watchers, self.shows = [watcher for watcher in self.shows.values() if watcher is not None], {}
+        for watcher in watchers:
+            watcher.stop()
+        self.backend.close()
+
+    def stats(self) -> Dict:
+        """
+        Get the daemon's counters.
+
+        Returns:
+            Dict: The number of 'connections', 'requests' and 'errors', the 'shows' opened, and the 'cache' statistics.
+        """
+        with self.lock:
+            return dict(self.counters, shows=sorted(self.shows), cache=self.backend.stats())
+
+    def serve(self, request: Dict) -> Dict:
+        """
+        Run one client request.
+
+        Args:
+            request (Dict): The 'manager' ('show', 'shot' or 'asset'), its constructor 'arguments' and
+                'options', the 'method' name, and the method's encoded 'args' and 'kwargs'.
+
+        Returns:
+            Dict: The 'status' ('ok' or 'error'), the encoded 'result' or the 'error' as [type name, message],
+            and the [message, level] pairs the managers emitted during the call as 'messages', including
+            those emitted by the worker threads the call writes documents with.
+        """
+        with self.lock:
+            self.counters["requests"] += 1
+        messages = []
+        _captured_messages.messages = messages
+        try:
+            kind, method = request.get("manager"), request.get("method")
+            # The method is checked before anything is built from the rest of the request.
+            if kind not in _DAEMON_MANAGERS or not isinstance(method, str) or method not in self.allowed_methods[kind]:
+                raise AttributeError(f"The daemon does not serve '{method}' of the {kind} manager.")
+            arguments, options = request.get("arguments"), request.get("options") or {}
+            if (not isinstance(arguments, list) or len(arguments) != _DAEMON_ARGUMENTS[kind]
+                    or not all(isinstance(argument, str) for argument in arguments)
+                    or not isinstance(options, dict) or not set(options) <= set(_DAEMON_OPTIONS[kind])):
+                raise ValueError(f"Invalid arguments for the {kind} manager.")
+            args, kwargs = decode_value(request.get("args") or []), decode_value(request.get("kwargs") or {})
+            if not isinstance(args, list) or not isinstance(kwargs, dict):
+                raise ValueError(f"Invalid arguments for '{method}'.")
+            manager = self._manager(kind, tuple(arguments), options)
+            try:
+                result = getattr(manager, method)(*args, **kwargs)
+            finally:
+                self.backend.flush()
+            try:
+                result = encode_value(result)
+            except TypeError as error:
+                raise TypeError(f"The result of '{method}' can't be sent to the client: {error}") from None
+            return {"status": "ok", "result": result, "messages": messages}
+        except Exception as error:
+            with self.lock:
+                self.counters["errors"] += 1
+            return {"status": "error", "error": [type(error).__name__, str(error)], "messages": messages}
+        finally:
+            _captured_messages.messages = None
+
+    def _manager(self, kind: str, arguments: tuple, options: Dict):
+        key = (kind, arguments, tuple(sorted(options.items())))
+        manager = self.managers.get(key)
+        if manager is None:
+            path = os.path.join(*arguments) if kind == "show" else arguments[0]
+            relative_path = os.path.relpath(os.path.abspath(path), self.studio_path)
+            if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+                raise ValueError(f"'{path}' is not in the studio '{self.studio_path}' served by the daemon.")
+            if relative_path != os.curdir:
+                self._open_show(relative_path.split(os.sep)[0])
+            manager = _DAEMON_MANAGERS[kind](*arguments, backend=self.backend, **options)
+            with self.lock:
+                manager = self.managers.setdefault(key, manager)
+        return manager
+
+    def _open_show(self, show_name: str) -> None:
+        # Reads the show's documents into the cache and starts its watcher, once.
+        with self.lock:
+            if show_name in self.shows:
+                return
+            self.shows[show_name] = None
+        show_path = os.path.join(self.studio_path, show_name)
+        if not os.path.isdir(show_path):
+            return
+        if self.preload:
+            for root, dirs, files in self.backend.walk(show_path):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                for file_name in files:
+                    if file_name.endswith(".json"):
+                        try:
+                            self.backend.read(os.path.join(root, file_name))
+                        except (OSError, ValueError):
+                            pass
+        if self.watch:
+            watcher = ShowWatcher(show_path)
+            watcher.subscribe(cache_subscriber(self.backend))
+            watcher.subscribe(index_subscriber(self.backend))
+            watcher.subscribe(search_subscriber(show_path, self.backend))
+            watcher.start()
+            with self.lock:
+                self.shows[show_name] = watcher
+
+# ==================================================================================== END DAEMON ====================================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the managers of a studio to other processes, see ShowShotDaemon.")
+    parser.add_argument("studio_path", help="The directory holding the shows.")
+    parser.add_argument("--socket", help="The socket to listen on. Defaults to '<studio_path>/.showshot.sock'.")
+    parser.add_argument("--max-entries", type=int, default=100000, help="The maximum number of documents held in memory.")
+    parser.add_argument("--no-preload", action="store_true", help="Read documents on first use instead of when starting.")
+    parser.add_argument("--no-watch", action="store_true", help="Don't watch the shows for changes made by other processes.")
+    arguments = parser.parse_args()
+
+    # The daemon runs from the imported module, so there is a single copy of its classes and caches.
+    import ShowShotManager
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    ShowShotManager.ShowShotDaemon(arguments.studio_path, arguments.socket, arguments.max_entries,
+                                   not arguments.no_preload, not arguments.no_watch).serve_forever()
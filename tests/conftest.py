@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ShowShotManager  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def close_shared_state():
+    # The managers share open indexes and archive readers by path; each test starts without them.
+    yield
+    with ShowShotManager._open_indexes_lock:
+        indexes = list(ShowShotManager._open_indexes.values())
+        ShowShotManager._open_indexes.clear()
+    for index in indexes:
+        index.close()
+    with ShowShotManager._open_search_indexes_lock:
+        search_indexes = list(ShowShotManager._open_search_indexes.values())
+        ShowShotManager._open_search_indexes.clear()
+    for index in search_indexes:
+        index.close()
+    with ShowShotManager._open_archives_lock:
+        readers = list(ShowShotManager._open_archives.values())
+        ShowShotManager._open_archives.clear()
+    for reader in readers:
+        reader.close()
+
+
+@pytest.fixture
+def studio(tmp_path):
+    """A studio directory holding the show 'Animal_Kingdom' with the subdirectory 'Dogs' and one shot."""
+    show_manager = ShowShotManager.ShowManager(str(tmp_path), "Animal_Kingdom")
+    show_manager.create_directory(str(tmp_path), "Animal_Kingdom")
+    show_manager.create_subdirectories(["Dogs"])
+    shot_manager = ShowShotManager.ShotManager(os.path.join(str(tmp_path), "Animal_Kingdom", "Dogs"))
+    shot_manager.create_character_info("doggo1", "Buddy", {"age": 3, "breed": "Beagle", "assets": ["Prop_collar"]})
+    return tmp_path
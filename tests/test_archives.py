@@ -0,0 +1,140 @@
+import os
+import zipfile
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import ATOMIC_TEMP_SUFFIX, ArchiveWriter, ShotManager, ShowManager
+
+
+def _members(tmp_path):
+    texture = tmp_path / "texture.png"
+    texture.write_bytes(os.urandom(4096))
+    return [("Dogs/doggo1.json", b'{"name": "Buddy"}' * 100), ("Dogs/Prop/texture.png", str(texture))]
+
+
+@pytest.mark.parametrize("raw_writes", [True, False])
+def test_archive_writer_compresses_by_file_type(tmp_path, monkeypatch, raw_writes):
+    monkeypatch.setattr(ShowShotManager, "_ZIPFILE_RAW_WRITES", raw_writes)
+    progress = []
+    members = _members(tmp_path)
+    zip_file_path = str(tmp_path / "show.zip")
+
+    stats = ArchiveWriter("deflate", level=6, workers=2, progress=lambda *args: progress.append(args)).write(zip_file_path, members)
+
+    with zipfile.ZipFile(zip_file_path) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.read("Dogs/doggo1.json") == members[0][1]
+        assert zip_file.getinfo("Dogs/doggo1.json").compress_type == zipfile.ZIP_DEFLATED
+        assert zip_file.getinfo("Dogs/Prop/texture.png").compress_type == zipfile.ZIP_STORED
+    assert stats["files"] == 2 and stats["bytes_in"] == 1700 + 4096
+    assert progress[-1] == (2, 2, stats["bytes_in"], stats["bytes_in"])
+
+
+def test_archive_writer_streams_large_members(tmp_path):
+    members = _members(tmp_path)
+    zip_file_path = str(tmp_path / "show.zip")
+    ArchiveWriter("lzma", max_member_size=1024).write(zip_file_path, members)
+    with zipfile.ZipFile(zip_file_path) as zip_file:
+        assert zip_file.read("Dogs/Prop/texture.png") == (tmp_path / "texture.png").read_bytes()
+
+
+def test_archive_writer_rejects_unknown_compression():
+    with pytest.raises(ValueError):
+        ArchiveWriter("zstd")
+
+
+def test_interrupted_archive_leaves_nothing_behind(tmp_path):
+    def interrupt(files_done, *_):
+        raise KeyboardInterrupt
+
+    zip_file_path = str(tmp_path / "show.zip")
+    with pytest.raises(KeyboardInterrupt):
+        ArchiveWriter(progress=interrupt).write(zip_file_path, _members(tmp_path))
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith((".zip", ATOMIC_TEMP_SUFFIX))]
+
+
+def test_zip_show_archives_the_show(studio):
+    stats = ShowManager(str(studio), "Animal_Kingdom").zip_show("Animal_Kingdom.zip", compression="bzip2")
+    with zipfile.ZipFile(str(studio / "Animal_Kingdom.zip")) as zip_file:
+        assert "Dogs/doggo1.json" in zip_file.namelist()
+    assert stats["files"] >= 1
+
+
+def test_archived_shows_are_read_without_extracting(studio, capsys):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    show_manager.zip_show("Animal_Kingdom.zip")
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+
+    document = show_manager.read_json_from_zip("Animal_Kingdom.zip", "Dogs/doggo1.json")
+    document["age"] = 99
+    assert show_manager.read_json_from_zip("Animal_Kingdom.zip", "Dogs/doggo1.json")["age"] == 3
+
+    backend = show_manager.archive_backend("Animal_Kingdom.zip")
+    shot_manager = ShotManager(dogs_path, backend=backend)
+    shot_manager.get_json_file_info("doggo1.json")["age"] = 99
+    assert shot_manager.get_json_file_info("doggo1.json")["age"] == 3
+    assert shot_manager.find_assets_by_shot("doggo1") == ["Prop_collar"]
+
+    show_manager.read_data_from_zip("Animal_Kingdom.zip", pattern="Dogs/*.json")
+    assert '"name": "Buddy"' in capsys.readouterr().out
+
+
+def test_archive_backend_is_read_only_and_reports_missing_members(studio, capsys):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    show_manager.zip_show("Animal_Kingdom.zip")
+    backend = show_manager.archive_backend("Animal_Kingdom.zip")
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+
+    with pytest.raises(PermissionError):
+        ShotManager(dogs_path, backend=backend).edit_json_file("doggo1.json", {"name": "Rex"})
+    with pytest.raises(FileNotFoundError):
+        backend.read(os.path.join(dogs_path, "missing.json"))
+    assert show_manager.read_json_from_zip("Animal_Kingdom.zip", "Dogs/missing.json") is None
+    assert "does not exist in ZIP file" in capsys.readouterr().out
+
+
+def test_shared_readers_are_capped_and_reopen_when_evicted(studio, monkeypatch):
+    monkeypatch.setattr(ShowShotManager, "MAX_OPEN_ARCHIVES", 2)
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    for number in range(3):
+        show_manager.zip_show(f"archive{number}.zip")
+    first = ShowShotManager.open_archive(str(studio / "archive0.zip"))
+    ShowShotManager.open_archive(str(studio / "archive1.zip"))
+    ShowShotManager.open_archive(str(studio / "archive2.zip"))
+
+    assert len(ShowShotManager._open_archives) == 2 and first.zip_file is None
+    assert first.read_json("Dogs/doggo1.json")["name"] == "Buddy"
+
+
+def test_incremental_archives_restore_each_point_in_time(studio):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    shot_manager = ShotManager(dogs_path)
+    shot_manager.create_character_info("doggo2", "Rex", {"age": 5})
+    full = show_manager.zip_show_incremental("full.zip")
+
+    shot_manager.edit_json_file("doggo1.json", {"name": "Buddy", "age": 4})
+    shot_manager.delete_json_file("doggo2.json")
+    delta = show_manager.zip_show_incremental("delta.zip")
+
+    assert (full["changed"], full["deleted"]) == (2, 0)
+    assert (delta["changed"], delta["deleted"], delta["unchanged"]) == (1, 1, 0)
+    with zipfile.ZipFile(str(studio / "delta.zip")) as zip_file:
+        assert sorted(zip_file.namelist()) == [ShowShotManager.ARCHIVE_MANIFEST_NAME, "Dogs/doggo1.json"]
+
+    assert show_manager.restore_show(str(studio / "then"), "full.zip")
+    assert sorted(os.listdir(str(studio / "then" / "Dogs"))) == ["doggo1.json", "doggo2.json"]
+    assert show_manager.restore_show(str(studio / "now"))
+    assert os.listdir(str(studio / "now" / "Dogs")) == ["doggo1.json"]
+    assert ShotManager(str(studio / "now" / "Dogs")).get_json_file_info("doggo1.json")["age"] == 4
+
+
+def test_restore_show_refuses_bad_targets(studio, capsys):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    assert not show_manager.restore_show(str(studio / "restored"))
+    show_manager.zip_show_incremental("full.zip")
+    assert not show_manager.restore_show(str(studio / "restored"), "other.zip")
+    assert not show_manager.restore_show(os.path.join(str(studio), "Animal_Kingdom"))
+    output = capsys.readouterr().out
+    assert "No incremental archives found" in output and "is not part of" in output and "is not empty" in output
@@ -0,0 +1,41 @@
+import os
+
+import ShowShotManager
+from ShowShotManager import AssetManager, INDEX_FILE_NAME, JsonTreeBackend, get_show_index
+
+
+def _add_bone(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+    assets_manager = AssetManager(show_path)
+    assets_manager.create_folders(["Dogs/Prop"])
+    assets_manager.create_json_file("Dogs/Prop", {"name": "bone", "Shots": ["doggo1"]}, "bone.json")
+    return assets_manager
+
+
+def test_delete_asset_folder_updates_the_show_index(studio):
+    assets_manager = _add_bone(studio)
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    assert get_show_index(dogs_path).get_shots_for_asset("Prop_bone") == ["doggo1"]
+
+    assets_manager.delete_asset_folder("Dogs/Prop")
+
+    assert not os.path.exists(os.path.join(dogs_path, "Prop"))
+    assert get_show_index(dogs_path).get_shots_for_asset("Prop_bone") == []
+
+
+def test_delete_asset_folder_from_the_studio_closes_the_deleted_show(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    _add_bone(studio)
+    get_show_index(dogs_path)
+
+    AssetManager(str(studio)).delete_asset_folder("Animal_Kingdom/Dogs")
+
+    assert not os.path.exists(dogs_path)
+    assert not os.path.exists(os.path.join(str(studio), INDEX_FILE_NAME))
+    assert not os.path.exists(os.path.join(str(studio), "Animal_Kingdom", INDEX_FILE_NAME))
+    assert JsonTreeBackend().index_key(dogs_path) not in ShowShotManager._open_indexes
+
+
+def test_delete_missing_asset_folder_warns(studio, capsys):
+    AssetManager(os.path.join(str(studio), "Animal_Kingdom")).delete_asset_folder("Dogs/Missing")
+    assert "Folder 'Dogs/Missing' does not exist." in capsys.readouterr().out
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+import ShowShotManager
+
+from ShowShotManager import AsyncAssetManager, AsyncShotManager, AsyncShowManager
+
+
+def test_async_managers_read_concurrently(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+
+    async def main():
+        async with AsyncShotManager(os.path.join(show_path, "Dogs"), max_concurrency=4) as shot_manager:
+            await shot_manager.create_character_info("doggo2", "Rex", {"age": 5})
+            shots = await shot_manager.get_json_files_info()
+        async with AsyncShowManager(str(studio), "Animal_Kingdom") as show_manager:
+            loaded = await show_manager.load_shots()
+        async with AsyncAssetManager(show_path) as assets_manager:
+            await assets_manager.create_folders(["Dogs/Prop"])
+            await assets_manager.create_json_file("Dogs/Prop", {"name": "bone", "Shots": ["doggo2"]}, "bone.json")
+            assets = await assets_manager.read_json_files("Dogs/Prop")
+        return shots, loaded, assets
+
+    shots, loaded, assets = asyncio.run(main())
+    assert sorted(shots) == ["doggo1.json", "doggo2.json"] and shots["doggo2.json"]["age"] == 5
+    assert loaded["Dogs"] == shots
+    assert assets == {"bone.json": {"name": "bone", "Shots": ["doggo2"]}}
+
+
+def test_async_errors_reach_the_caller(studio):
+    async def main():
+        async with AsyncShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs")) as shot_manager:
+            return await shot_manager.get_json_files_info(["missing.json"])
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(main())
+
+
+def test_async_calls_keep_the_callers_captured_messages(studio, capsys, monkeypatch):
+    messages = []
+    monkeypatch.setattr(ShowShotManager._captured_messages, "messages", messages, raising=False)
+
+    async def main():
+        async with AsyncShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs")) as shot_manager:
+            await shot_manager.create_character_info("doggo2", "Rex", {"age": 5})
+
+    asyncio.run(main())
+    assert [message for message, _ in messages] == [
+        f"Character file '{os.path.join(str(studio), 'Animal_Kingdom', 'Dogs', 'doggo2.json')}' created successfully!"
+    ]
+    assert capsys.readouterr().out == ""
+
+
+def test_async_calls_never_exceed_max_concurrency(studio):
+    lock = threading.Lock()
+    running = [0, 0]  # now, most at once
+
+    def work():
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    async def main():
+        async with AsyncShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"), max_concurrency=2) as shot_manager:
+            await asyncio.gather(*(shot_manager._run(work) for _ in range(8)))
+
+    asyncio.run(main())
+    assert running[1] == 2
@@ -0,0 +1,143 @@
+import json
+import os
+import stat
+import threading
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import ATOMIC_TEMP_SUFFIX, JsonTreeBackend, atomic_write
+
+
+def _temp_files(directory):
+    return [name for name in os.listdir(directory) if name.endswith(ATOMIC_TEMP_SUFFIX)]
+
+
+def test_atomic_write_replaces_the_file_and_keeps_its_mode(tmp_path):
+    path = str(tmp_path / "doggo1.json")
+    umask = os.umask(0o022)
+    try:
+        atomic_write(path, b'{"age": 3}')
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+        os.chmod(path, 0o640)
+        atomic_write(path, b'{"age": 4}', fsync=True)
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    with open(path) as file:
+        assert json.load(file) == {"age": 4}
+    assert _temp_files(str(tmp_path)) == []
+
+
+def test_failed_atomic_write_leaves_the_old_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "doggo1.json")
+    atomic_write(path, b'{"age": 3}')
+
+    def fail(source, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ShowShotManager.os, "replace", fail)
+    with pytest.raises(OSError):
+        atomic_write(path, b'{"age": 4}')
+    monkeypatch.undo()
+    with open(path) as file:
+        assert json.load(file) == {"age": 3}
+    assert _temp_files(str(tmp_path)) == []
+
+
+def test_group_durability_commits_a_transaction_together(tmp_path):
+    backend = JsonTreeBackend(durability="group")
+    first, second = str(tmp_path / "a.json"), str(tmp_path / "b.json")
+    with backend.transaction():
+        backend.write(first, {"name": "a"})
+        backend.write(second, {"name": "b"})
+        assert not os.path.exists(first)
+    assert backend.read(first) == {"name": "a"} and backend.read(second) == {"name": "b"}
+
+    with pytest.raises(RuntimeError):
+        with backend.transaction():
+            backend.write(first, {"name": "changed"})
+            raise RuntimeError("interrupted")
+    assert backend.read(first) == {"name": "a"}
+    assert _temp_files(str(tmp_path)) == []
+
+
+def test_group_transactions_belong_to_their_thread(tmp_path):
+    backend = JsonTreeBackend(durability="group")
+    mine, other = str(tmp_path / "mine.json"), str(tmp_path / "other.json")
+    opened, written = threading.Event(), threading.Event()
+
+    def other_thread():
+        opened.wait()
+        backend.write(other, {"name": "other"})  # not part of the open transaction: on disk at once
+        written.set()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    with pytest.raises(RuntimeError):
+        with backend.transaction():
+            backend.write(mine, {"name": "mine"})
+            opened.set()
+            written.wait()
+            assert os.path.exists(other)
+            raise RuntimeError("interrupted")
+    thread.join()
+    assert backend.read(other) == {"name": "other"} and not os.path.exists(mine)
+
+    # A thread's outermost block commits its writes, whatever other threads have open.
+    held, release = threading.Event(), threading.Event()
+
+    def hold_transaction():
+        with backend.transaction():
+            held.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_transaction)
+    holder.start()
+    held.wait()
+    with backend.transaction():
+        backend.write(mine, {"name": "mine"})
+    assert os.path.exists(mine)
+    release.set()
+    holder.join()
+    assert _temp_files(str(tmp_path)) == []
+
+
+def test_failed_inner_block_discards_only_its_own_writes(tmp_path):
+    backend = JsonTreeBackend(durability="group")
+    outer, inner = str(tmp_path / "outer.json"), str(tmp_path / "inner.json")
+    with backend.transaction():
+        backend.write(outer, {"name": "outer"})
+        with pytest.raises(RuntimeError):
+            with backend.transaction():
+                backend.write(inner, {"name": "inner"})
+                backend.write(outer, {"name": "changed"})
+                raise RuntimeError("interrupted")
+        assert backend.read(outer) == {"name": "outer"} and not backend.exists(inner)
+        ShowShotManager._write_documents(backend, {str(tmp_path / f"{index}.json"): {"index": index} for index in range(8)}, 4)
+        assert not os.path.exists(outer) and not os.path.exists(str(tmp_path / "0.json"))
+    assert backend.read(outer) == {"name": "outer"} and not os.path.exists(inner)
+    assert [backend.read(str(tmp_path / f"{index}.json"))["index"] for index in range(8)] == list(range(8))
+    assert _temp_files(str(tmp_path)) == []
+
+
+def test_unknown_durability_is_rejected():
+    with pytest.raises(ValueError):
+        JsonTreeBackend(durability="sometimes")
+
+
+def test_writer_threads_keep_the_callers_captured_messages(tmp_path, monkeypatch):
+    backend = JsonTreeBackend()
+    write = backend.write
+
+    def write_and_report(path, data):
+        write(path, data)
+        ShowShotManager._emit(f"wrote {os.path.basename(path)}")
+
+    monkeypatch.setattr(backend, "write", write_and_report)
+    messages = []
+    monkeypatch.setattr(ShowShotManager._captured_messages, "messages", messages, raising=False)
+    documents = {str(tmp_path / f"doggo{number}.json"): {"age": number} for number in range(4)}
+    assert ShowShotManager._write_documents(backend, documents, workers=4) == {}
+    assert sorted(message for message, _ in messages) == [f"wrote doggo{number}.json" for number in range(4)]
@@ -0,0 +1,43 @@
+import os
+
+from ShowShotManager import AssetManager, ShotManager
+
+
+def test_create_many_shots_writes_and_indexes_every_record(studio):
+    shot_manager = ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"))
+    results = shot_manager.create_many([
+        {"file_name": "doggo2", "character_name": "Rex", "info": {"age": 2, "assets": ["Prop_bone"]}},
+        ("doggo3", "Max", {"breed": "Husky"}),
+    ], workers=2)
+
+    assert [result["status"] for result in results] == ["created", "created"]
+    assert shot_manager.get_json_file_info("doggo3.json")["breed"] == "Husky"
+    assert shot_manager.find_shots_by_asset("Prop_bone") == ["doggo2"]
+
+
+def test_create_many_shots_reports_invalid_and_existing_records(studio):
+    shot_manager = ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"))
+    results = shot_manager.create_many([
+        ("doggo1", "Buddy", {}),
+        ("../escape", "Rex", {}),
+        ("doggo4", "Max", {"assets": "Prop_bone"}),
+        ("doggo5", "Rex", {}),
+        ("doggo5", "Rex", {}),
+    ])
+
+    assert [result["status"] for result in results] == ["exists", "invalid", "invalid", "created", "exists"]
+    assert all(result["message"] for result in results if result["status"] != "created")
+    assert not os.path.exists(os.path.join(str(studio), "Animal_Kingdom", "escape.json"))
+
+
+def test_create_many_assets_across_folders(studio):
+    assets_manager = AssetManager(os.path.join(str(studio), "Animal_Kingdom"))
+    results = assets_manager.create_many([
+        {"folder_name": "Dogs/Prop", "file_name": "bone.json", "data": {"name": "bone", "Shots": ["doggo1"]}},
+        ("Dogs/Environment", {"name": "Kennel", "Shots": []}, "kennel.json"),
+        ("Dogs/Prop", {"name": "bad"}, "bad.txt"),
+    ])
+
+    assert [result["status"] for result in results] == ["created", "created", "invalid"]
+    assert assets_manager.find_shots_by_asset("Dogs/Prop", "bone.json") == ["doggo1"]
+    assert os.path.exists(os.path.join(str(studio), "Animal_Kingdom", "Dogs", "Environment", "kennel.json"))
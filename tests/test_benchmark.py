@@ -0,0 +1,51 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ShowShotBenchmark import benchmark_methods, compare_benchmarks, generate_show, time_calls
+
+BENCHMARK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ShowShotBenchmark.py")
+
+
+def test_generate_show_follows_the_dogs_layout(tmp_path):
+    created = generate_show(str(tmp_path), "Synthetic", shots=10, categories=2, assets_per_category=3, references=2)
+    assert created["files"] == 1 + 2 + 2 * 3 + 10
+    with open(tmp_path / "Synthetic" / "character0.json") as file:
+        shot = json.load(file)
+    assert len(shot["assets"]) == 2 and shot["assets"][0].startswith("Category")
+
+
+def test_benchmark_methods_times_every_manager_method(tmp_path):
+    report = benchmark_methods(str(tmp_path), shots=20, categories=2, assets_per_category=5, references=2,
+                               repeats=8, archive_repeats=2)
+    classes = {method.split(".")[0] for method in report["methods"]}
+    assert classes == {"ShowManager", "ShotManager", "AssetManager"}
+    assert report["methods"]["ShotManager.create_character_info"]["calls"] == 8
+    assert all(result["ops_per_second"] > 0 and result["p50_ms"] <= result["p99_ms"] for result in report["methods"].values())
+    assert compare_benchmarks(report, report) == []
+
+
+def test_regressions_are_found_and_fail_the_command(tmp_path):
+    baseline = {"methods": {"ShotManager.get_json_files": {"ops_per_second": 1e12}}}
+    current = {"methods": {"ShotManager.get_json_files": {"ops_per_second": 100.0}, "ShotManager.query": {"ops_per_second": 1.0}}}
+    assert [regression["method"] for regression in compare_benchmarks(baseline, current)] == ["ShotManager.get_json_files"]
+
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+    completed = subprocess.run(
+        [sys.executable, BENCHMARK, "--methods", "--sequences", "1", "--shots", "10", "--categories", "1", "--assets", "3",
+         "--references", "1", "--repeats", "6", "--baseline", str(tmp_path / "baseline.json")],
+        capture_output=True, text=True, cwd=str(tmp_path), timeout=300,
+    )
+    assert completed.returncode == 1, completed.stderr
+    assert '"method": "ShotManager.get_json_files"' in completed.stdout
+
+
+def test_time_calls_lets_failures_through(tmp_path):
+    def fail(path):
+        raise FileNotFoundError(path)
+
+    with pytest.raises(FileNotFoundError):
+        time_calls(fail, [(str(tmp_path / "missing.json"),)])
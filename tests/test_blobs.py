@@ -0,0 +1,86 @@
+import json
+import os
+import zipfile
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import ARCHIVE_LINKS_NAME, AssetManager, BlobStore, ShotManager, ShowManager
+
+SHARED = {"name": "Shared", "age": 4, "breed": "Beagle", "assets": ["Prop_collar"]}
+
+
+@pytest.fixture
+def copies(studio):
+    # The same shot file in two subdirectories of two shows.
+    paths = [os.path.join(str(studio), "Animal_Kingdom", "Dogs", "shared.json"),
+             os.path.join(str(studio), "Animal_Kingdom", "Pups", "shared.json"),
+             os.path.join(str(studio), "Farm", "Cows", "shared.json")]
+    for path in paths:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(SHARED, file, indent=4)
+    return paths
+
+
+def test_identical_files_are_stored_once_until_edited(studio, copies):
+    first = ShowManager(str(studio), "Animal_Kingdom").deduplicate()
+    second = ShowManager(str(studio), "Farm").deduplicate()
+    assert (first["stored"], first["linked"], second["linked"]) == (2, 1, 1)
+    assert len({os.stat(path).st_ino for path in copies}) == 1
+    assert ShowManager(str(studio), "Farm").deduplicate()["already_linked"] == 1
+
+    store = BlobStore(str(studio))
+    report = store.report()
+    assert (report["blobs"], report["links"]) == (2, 4)
+    assert report["bytes_reclaimed"] == 2 * os.path.getsize(copies[0])
+
+    ShotManager(os.path.dirname(copies[0])).edit_json_file("shared.json", dict(SHARED, age=5))
+    with open(copies[1]) as file:
+        assert json.load(file)["age"] == 4
+    for path in copies[1:]:
+        os.remove(path)
+    assert store.collect_garbage()["blobs"] == 1
+    assert store.report()["unreferenced"] == 0
+
+
+def test_archives_store_deduplicated_files_once_when_asked(studio, copies):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    show_manager.deduplicate()
+    assert show_manager.zip_show("Plain.zip")["deduplicated"] == 0
+    with zipfile.ZipFile(str(studio / "Plain.zip")) as zip_file:
+        assert ARCHIVE_LINKS_NAME not in zip_file.namelist()
+        assert [json.loads(zip_file.read(name)) for name in ("Dogs/shared.json", "Pups/shared.json")] == [SHARED, SHARED]
+
+    stats = show_manager.zip_show("Animal_Kingdom.zip", dedupe_links=True)
+    assert stats["deduplicated"] == 1
+    with zipfile.ZipFile(str(studio / "Animal_Kingdom.zip")) as zip_file:
+        links = json.loads(zip_file.read(ARCHIVE_LINKS_NAME))
+        assert len([name for name in zip_file.namelist() if name.endswith("/shared.json")]) == 1
+    assert sorted([*links, *links.values()]) == ["Dogs/shared.json", "Pups/shared.json"]
+    for member_name in sorted([*links, *links.values()]):
+        assert show_manager.read_json_from_zip("Animal_Kingdom.zip", member_name) == SHARED
+
+
+def test_unsupported_links_and_missing_folders_are_reported(studio, copies, monkeypatch, capsys):
+    with pytest.raises(ValueError, match="Unknown link mode"):
+        BlobStore(str(studio), "symlink")
+
+    def no_reflinks(source_path, target_path):
+        raise OSError(95, "Operation not supported", target_path)
+
+    monkeypatch.setattr(ShowShotManager, "_reflink", no_reflinks)
+    report = AssetManager(os.path.join(str(studio), "Animal_Kingdom")).deduplicate(["Dogs", "Cats"], link="reflink")
+    assert "Folder 'Cats' does not exist." in capsys.readouterr().out
+    assert report["stored"] == 0 and len(report["errors"]) == 2
+    assert os.stat(copies[0]).st_nlink == 1
+
+
+def test_zipped_asset_folders_keep_every_copy_by_default(studio, copies):
+    assets = AssetManager(os.path.join(str(studio), "Animal_Kingdom"))
+    os.link(copies[0], os.path.join(os.path.dirname(copies[0]), "shared_copy.json"))
+    assets.zip_asset_folders(["Dogs"])
+    assert not os.path.exists(os.path.dirname(copies[0]))
+    with zipfile.ZipFile(os.path.join(str(studio), "Animal_Kingdom", "Dogs.zip")) as zip_file:
+        assert ARCHIVE_LINKS_NAME not in zip_file.namelist()
+        assert json.loads(zip_file.read("shared_copy.json")) == json.loads(zip_file.read("shared.json")) == SHARED
@@ -0,0 +1,65 @@
+import json
+import os
+import time
+
+import pytest
+
+from ShowShotManager import CachedBackend, ShotManager
+
+
+def _read(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def test_cached_writes_reach_the_disk_when_flushed(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    shot_path = os.path.join(dogs_path, "doggo1.json")
+    with CachedBackend(max_dirty=10, flush_interval=None) as cache:
+        shot_manager = ShotManager(dogs_path, backend=cache)
+        info = shot_manager.get_json_file_info("doggo1.json")
+        info["age"] = 4
+        shot_manager.edit_json_file("doggo1.json", info)
+        assert shot_manager.get_json_file_info("doggo1.json")["age"] == 4
+        assert _read(shot_path)["age"] == 3
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["dirty"]) == (1, 1, 1)
+    assert _read(shot_path)["age"] == 4
+    assert cache.flusher is None
+
+
+def test_cache_sees_edits_made_on_disk_and_evicts(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    cache = CachedBackend(max_entries=1, flush_interval=None)
+    shot_manager = ShotManager(dogs_path, backend=cache)
+    shot_manager.create_character_info("doggo2", "Rex", {})
+    assert shot_manager.get_json_file_info("doggo1.json")["name"] == "Buddy"
+    assert cache.stats()["evictions"] == 1 and cache.stats()["dirty"] == 0
+    assert os.path.exists(os.path.join(dogs_path, "doggo2.json"))
+
+    time.sleep(0.01)
+    with open(os.path.join(dogs_path, "doggo1.json"), 'w') as file:
+        json.dump({"name": "Max"}, file)
+    assert shot_manager.get_json_file_info("doggo1.json") == {"name": "Max"}
+
+
+def test_background_flusher_writes_aged_documents(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    cache = CachedBackend(flush_interval=0.05)
+    ShotManager(dogs_path, backend=cache).edit_json_file("doggo1.json", {"name": "Buddy", "age": 5})
+    deadline = time.monotonic() + 5
+    while cache.stats()["dirty"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _read(os.path.join(dogs_path, "doggo1.json"))["age"] == 5
+    cache.close()
+    assert cache.flusher is None
+
+
+def test_failed_flush_keeps_documents_dirty(tmp_path):
+    cache = CachedBackend(flush_interval=None)
+    path = str(tmp_path / "gone" / "doggo1.json")
+    cache.write(path, {"name": "Buddy"})
+    with pytest.raises(OSError):
+        cache.flush()
+    assert cache.stats()["dirty"] == 1
+    assert cache.read(path) == {"name": "Buddy"}
@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import (
+    BINARY_MAGIC, CODECS, BinaryCodec, JsonTreeBackend, SQLiteBackend, decode_document, get_codec, sidecar_path,
+)
+
+DOCUMENT = {"name": "Buddy", "age": 3, "good": True, "assets": ["Prop_collar", "Prop_bone"], "notes": None}
+needs_msgpack = pytest.mark.skipif(not BinaryCodec.available(), reason="msgpack is not installed")
+
+
+@pytest.mark.parametrize("name", [
+    pytest.param(name, marks=needs_msgpack if CODECS[name].binary else ()) for name in sorted(CODECS)
+])
+def test_every_codec_round_trips_and_is_readable_by_decode_document(name):
+    payload = get_codec(name).encode(DOCUMENT)
+    assert get_codec(name).decode(payload) == DOCUMENT
+    assert decode_document(payload) == DOCUMENT
+
+
+@needs_msgpack
+def test_sidecar_is_used_until_the_json_file_changes(tmp_path):
+    path = str(tmp_path / "doggo1.json")
+    backend = JsonTreeBackend(codec="fast", sidecar=True)
+    backend.write(path, DOCUMENT)
+    assert os.path.isfile(sidecar_path(path))
+    with open(sidecar_path(path), "r+b") as file:  # tamper with the copy: a matching sidecar is trusted
+        payload = file.read().replace(b"Buddy", b"Buzzy")
+        file.seek(0)
+        file.write(payload)
+    assert backend.read(path)["name"] == "Buzzy"
+
+    with open(path, "w") as file:
+        json.dump(dict(DOCUMENT, name="Rex", age=10), file)
+    assert backend.read(path)["name"] == "Rex"
+
+
+@needs_msgpack
+def test_corrupt_sidecars_fall_back_to_the_json_file(tmp_path):
+    path = str(tmp_path / "doggo1.json")
+    backend = JsonTreeBackend(sidecar=True)
+    backend.write(path, DOCUMENT)
+    with open(sidecar_path(path), "r+b") as file:
+        header = file.read(16)
+        file.seek(0)
+        file.truncate()
+        file.write(header + BINARY_MAGIC + b"m\xc1\xc1")  # 0xc1 is never valid msgpack
+    assert backend.read(path) == DOCUMENT
+    with pytest.raises(ValueError, match="Corrupt binary document"):
+        CODECS["binary"].decode(BINARY_MAGIC + b"m\xc1")
+
+
+@needs_msgpack
+def test_sqlite_documents_are_readable_whatever_the_codec(tmp_path):
+    binary = SQLiteBackend(str(tmp_path / "catalog.db"), str(tmp_path), codec="binary")
+    binary.write(str(tmp_path / "doggo1.json"), DOCUMENT)
+    binary.close()
+    assert SQLiteBackend(str(tmp_path / "catalog.db"), str(tmp_path)).read(str(tmp_path / "doggo1.json")) == DOCUMENT
+
+
+def test_unknown_or_binary_codecs_are_rejected_where_they_cannot_work():
+    with pytest.raises(ValueError, match="Unknown codec"):
+        get_codec("yaml")
+    with pytest.raises(ValueError, match="sidecar=True" if BinaryCodec.available() else "needs msgpack"):
+        JsonTreeBackend(codec="binary")
+    with pytest.raises(ValueError, match="Not a binary document"):
+        CODECS["binary"].decode(b"{}")
+    with pytest.raises(ValueError, match="Not a binary document"):
+        CODECS["binary"].decode(BINARY_MAGIC)
+    with pytest.raises(ValueError, match="format this library doesn't read"):
+        CODECS["binary"].decode(BINARY_MAGIC + b"M\x04\xe3")  # the marshal format of earlier versions
+
+
+def test_binary_storage_needs_msgpack(tmp_path, monkeypatch):
+    monkeypatch.setattr(ShowShotManager, "msgpack", None)
+    with pytest.raises(ValueError, match="need msgpack"):
+        JsonTreeBackend(sidecar=True)
+    with pytest.raises(ValueError, match="needs msgpack"):
+        SQLiteBackend(str(tmp_path / "catalog.db"), str(tmp_path), codec="binary")
+    with pytest.raises(ValueError, match="need msgpack"):
+        CODECS["binary"].encode(DOCUMENT)
@@ -0,0 +1,44 @@
+import concurrent.futures
+import os
+
+import pytest
+
+from ShowShotManager import AssetManager, ConflictError, DocumentLock, JsonTreeBackend, LockTimeout, update_document
+
+
+def _asset_path(studio):
+    assets_manager = AssetManager(os.path.join(str(studio), "Animal_Kingdom"))
+    assets_manager.create_folders(["Dogs/Prop"])
+    assets_manager.create_json_file("Dogs/Prop", {"name": "collar", "Shots": []}, "collar.json")
+    return os.path.join(str(studio), "Animal_Kingdom", "Dogs", "Prop", "collar.json")
+
+
+@pytest.mark.parametrize("concurrency", ["lock", "optimistic"])
+def test_concurrent_updates_keep_every_change(studio, concurrency):
+    _asset_path(studio)
+    assets_manager = AssetManager(os.path.join(str(studio), "Animal_Kingdom"), concurrency=concurrency, retries=1000)
+    shots = [f"doggo{number}" for number in range(40)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda shot: assets_manager.add_shots_key_values("Dogs/Prop", "collar.json", [shot]), shots))
+    assert sorted(assets_manager.get_shots_key_values("Dogs/Prop", "collar.json")) == sorted(shots)
+
+
+def test_lock_timeout_when_the_document_is_held(studio):
+    path = _asset_path(studio)
+    with DocumentLock(path):
+        with pytest.raises(LockTimeout):
+            update_document(JsonTreeBackend(), path, lambda data: None, "lock", timeout=0.05)
+
+
+def test_optimistic_update_gives_up_on_conflicts(studio):
+    path = _asset_path(studio)
+    backend = JsonTreeBackend()
+
+    def mutate_while_someone_else_writes(data):
+        backend.write(path, dict(backend.read(path), Shots=backend.read(path)["Shots"] + ["other"]))
+        data["Shots"].append("mine")
+
+    with pytest.raises(ConflictError):
+        update_document(backend, path, mutate_while_someone_else_writes, "optimistic", retries=2)
+    with pytest.raises(ValueError):
+        update_document(backend, path, lambda data: None, "pessimistic")
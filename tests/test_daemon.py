@@ -0,0 +1,84 @@
+import collections
+import os
+import socket
+
+import pytest
+
+from ShowShotClient import ShotManagerClient, decode_value, encode_value
+from ShowShotManager import Page, ShowShotDaemon
+
+
+@pytest.fixture
+def daemon(studio, monkeypatch):
+    monkeypatch.delenv("SHOWSHOT_SOCKET", raising=False)
+    with ShowShotDaemon(str(studio), watch=False) as daemon:
+        yield daemon
+
+
+def dogs_path(studio):
+    return os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+
+
+def test_values_round_trip_through_json():
+    Point = collections.namedtuple("Point", ["x", "y"])
+    value = {"where": {"age": (">=", 3)}, "page": Page(["doggo1.json"], None), (1, 2): Point(1, [2])}
+    decoded = decode_value(encode_value(value))
+    assert decoded == value and type(decoded["page"]).__name__ == "Page" and decoded["page"].cursor is None
+    assert decode_value(encode_value({"__tuple__": 1})) == {"__tuple__": 1}
+    with pytest.raises(TypeError, match="can't be sent"):
+        encode_value({1, 2})
+
+
+def test_clients_are_served_by_the_daemon(studio, daemon, capsys):
+    with ShotManagerClient(dogs_path(studio)) as client:
+        assert client.daemon_running()
+        client.create_character_info("doggo2", "Rex", {"age": 5})
+        assert "doggo2.json' created successfully!" in capsys.readouterr().out
+        assert client.get_json_file_info("doggo2.json")["name"] == "Rex"
+        assert client.page_shots(limit=1) == Page(["doggo1.json"], "doggo1.json")
+        assert client.query({"age": (">=", 4)}, ["name"])[0]["data"] == {"name": "Rex"}
+    stats = daemon.stats()
+    assert (stats["connections"], stats["requests"], stats["errors"]) == (1, 4, 0)
+    assert stats["shows"] == ["Animal_Kingdom"]
+
+
+def test_daemon_refuses_unserved_methods_and_paths_outside_the_studio(studio, daemon, tmp_path_factory):
+    request = {"manager": "shot", "arguments": [dogs_path(studio)], "method": "__init__", "args": [], "kwargs": {}}
+    assert daemon.serve(request)["error"][0] == "AttributeError"
+    assert daemon.serve(dict(request, manager="episode", method="get_json_files"))["error"][0] == "AttributeError"
+    outside = str(tmp_path_factory.mktemp("elsewhere"))
+    response = daemon.serve(dict(request, arguments=[outside], method="get_json_files"))
+    assert response["error"] == ["ValueError", f"'{outside}' is not in the studio '{daemon.studio_path}' served by the daemon."]
+    assert daemon.stats()["errors"] == 3
+
+    with ShotManagerClient(dogs_path(studio)) as client:
+        with pytest.raises(TypeError):
+            client.get_json_file_info()
+
+
+def test_clients_fall_back_to_direct_access_without_a_daemon(studio, monkeypatch):
+    monkeypatch.delenv("SHOWSHOT_SOCKET", raising=False)
+    client = ShotManagerClient(dogs_path(studio))
+    assert not client.daemon_running()
+    assert client.get_json_file_info("doggo1.json")["name"] == "Buddy"
+
+    daemon = ShowShotDaemon(str(studio), watch=False).start()
+    assert client.daemon_running()
+    daemon.stop()
+    assert not os.path.exists(daemon.socket_path)
+    assert client.get_json_file_info("doggo1.json")["name"] == "Buddy"
+    assert not client.daemon_running()
+
+
+def test_second_daemon_is_refused_and_stale_sockets_are_replaced(studio, daemon):
+    with pytest.raises(RuntimeError, match="already listening"):
+        ShowShotDaemon(str(studio), watch=False).start()
+    daemon.stop()
+
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(daemon.socket_path)  # a socket file nobody listens on, as a killed daemon leaves
+    stale.close()
+    with ShowShotDaemon(str(studio), watch=False) as restarted:
+        with ShotManagerClient(dogs_path(studio)) as client:
+            assert client.get_json_file_info("doggo1.json")["name"] == "Buddy"
+        assert restarted.stats()["requests"] == 1
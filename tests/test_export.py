@@ -0,0 +1,60 @@
+import csv
+import json
+import os
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import JsonTreeBackend, ShowManager, export_show
+
+
+@pytest.fixture
+def show_path(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+    os.makedirs(os.path.join(show_path, "Dogs", "Prop"))
+    JsonTreeBackend().write(os.path.join(show_path, "Dogs", "Prop", "collar.json"),
+                            {"name": "collar", "Shots": ["doggo1"], "color": "red"})
+    return show_path
+
+
+def test_export_jsonl_with_edges_from_a_directory_and_an_archive(studio, show_path, tmp_path_factory):
+    output = tmp_path_factory.mktemp("export")
+    assert export_show(show_path, str(output / "records.jsonl"), edges_path=str(output / "edges.jsonl")) == {
+        "records": 2, "edges": 2}
+    with open(output / "records.jsonl") as file:
+        records = [json.loads(line) for line in file]
+    assert [(record["kind"], record["category"], record["file"]) for record in records] == [
+        ("shot", "", "doggo1.json"), ("asset", "Prop", "collar.json")]
+    with open(output / "edges.jsonl") as file:
+        assert sorted(json.loads(line)["declared_by"] for line in file) == ["asset", "shot"]
+
+    ShowManager(str(studio), "Animal_Kingdom").zip_show("Animal_Kingdom.zip")
+    export_show(os.path.join(str(studio), "Animal_Kingdom.zip"), str(output / "archived.jsonl"))
+    with open(output / "archived.jsonl") as file:
+        assert [json.loads(line) for line in file] == records
+
+
+def test_export_csv_flattens_lists_and_extra_keys(show_path, tmp_path_factory):
+    output = str(tmp_path_factory.mktemp("export") / "records.csv")
+    export_show(show_path, output, "csv")
+    with open(output, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["assets"] == '["Prop_collar"]' and rows[0]["breed"] == "Beagle"
+    assert rows[1]["Shots"] == '["doggo1"]' and rows[1]["extra"] == '{"color":"red"}'
+
+
+def test_failed_export_keeps_the_previous_output(show_path, tmp_path_factory, monkeypatch):
+    output = tmp_path_factory.mktemp("export")
+    (output / "records.jsonl").write_text("previous\n")
+
+    def broken_records(source_path, backend=None):
+        yield from ()
+        raise OSError("disk gone")
+
+    monkeypatch.setattr(ShowShotManager, "iter_show_records", broken_records)
+    with pytest.raises(OSError, match="disk gone"):
+        export_show(show_path, str(output / "records.jsonl"))
+    assert os.listdir(output) == ["records.jsonl"]
+    assert (output / "records.jsonl").read_text() == "previous\n"
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export_show(show_path, str(output / "records.xml"), "xml")
@@ -0,0 +1,85 @@
+import json
+import os
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import export_show, get_show_index, import_show, iter_show_records
+
+
+def write_lines(path, rows):
+    with open(path, "w") as file:
+        file.writelines(row if isinstance(row, str) else json.dumps(row) + "\n" for row in rows)
+
+
+def shot_row(number):
+    return {"show": "Dogs", "kind": "shot", "file": f"doggo{number}.json",
+            "data": {"name": f"Dog {number}", "assets": ["Prop_collar"]}}
+
+
+@pytest.mark.parametrize("export_format", ["jsonl", "csv"])
+def test_import_recreates_an_exported_show(studio, tmp_path_factory, export_format):
+    folder = tmp_path_factory.mktemp("breakdown")
+    breakdown = str(folder / f"breakdown.{export_format}")
+    export_show(os.path.join(str(studio), "Animal_Kingdom"), breakdown, export_format)
+    copy_path = str(folder / "Copy")
+
+    report = import_show(breakdown, copy_path, workers=2)
+
+    assert (report["rows"], report["created"], report["problems"]) == (1, 1, [])
+    assert [record["data"] for record in iter_show_records(copy_path)] == [
+        {"name": "Buddy", "age": 3, "breed": "Beagle", "assets": ["Prop_collar"]}]
+    assert get_show_index(os.path.join(copy_path, "Dogs")).get_shots_for_asset("Prop_collar") == ["doggo1"]
+    assert import_show(breakdown, copy_path)["exists"] == 1
+
+
+def test_invalid_rows_are_reported_and_skipped(tmp_path):
+    breakdown = str(tmp_path / "breakdown.jsonl")
+    write_lines(breakdown, [
+        shot_row(1),
+        "{broken\n",
+        dict(shot_row(2), kind="prop"),
+        {"show": "Dogs", "kind": "asset", "category": "../Prop", "file": "collar.json", "data": {}},
+    ])
+
+    report = import_show(breakdown, str(tmp_path / "Show"))
+
+    assert (report["rows"], report["created"], report["invalid"]) == (4, 1, 3)
+    assert [problem["row"] for problem in report["problems"]] == [2, 3, 4]
+    assert report["problems"][0]["message"].startswith("Invalid JSON")
+
+
+def test_interrupted_import_resumes_from_its_checkpoint(tmp_path, monkeypatch):
+    breakdown = str(tmp_path / "breakdown.jsonl")
+    write_lines(breakdown, [shot_row(number) for number in range(1, 6)])
+    checkpoint = str(tmp_path / "import.checkpoint")
+    write_documents = ShowShotManager._write_documents
+    calls = []
+
+    def interrupted(backend, documents, workers=None):
+        calls.append(sorted(os.path.basename(path) for path in documents))
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return write_documents(backend, documents, workers)
+
+    monkeypatch.setattr(ShowShotManager, "_write_documents", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        import_show(breakdown, str(tmp_path / "Show"), checkpoint_path=checkpoint, batch_size=2)
+    monkeypatch.setattr(ShowShotManager, "_write_documents", write_documents)
+
+    report = import_show(breakdown, str(tmp_path / "Show"), checkpoint_path=checkpoint, batch_size=2)
+
+    assert (report["resumed_from"], report["rows"], report["created"]) == (2, 5, 5)
+    assert sorted(name for name in os.listdir(tmp_path / "Show" / "Dogs") if name.endswith(".json")) == [f"doggo{number}.json" for number in range(1, 6)]
+    assert not os.path.exists(checkpoint)
+
+
+def test_checkpoint_of_another_import_is_refused(tmp_path):
+    breakdown = str(tmp_path / "breakdown.jsonl")
+    write_lines(breakdown, [shot_row(1)])
+    checkpoint = str(tmp_path / "import.checkpoint")
+    write_lines(checkpoint, [{"source": "/elsewhere.jsonl", "show_path": str(tmp_path / "Show"), "row": 1, "report": {}}])
+    with pytest.raises(ValueError, match="belongs to another import"):
+        import_show(breakdown, str(tmp_path / "Show"), checkpoint_path=checkpoint)
+    with pytest.raises(ValueError, match="Unknown import format"):
+        import_show(str(tmp_path / "breakdown.xml"), str(tmp_path / "Show"))
@@ -0,0 +1,39 @@
+import os
+
+import ShowShotManager
+from ShowShotManager import AssetManager, INDEX_FILE_NAME, ShotManager
+
+
+def test_reverse_index_follows_shot_and_asset_writes(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+    dogs_path = os.path.join(show_path, "Dogs")
+    shot_manager = ShotManager(dogs_path)
+    assets_manager = AssetManager(show_path)
+    assets_manager.create_folders(["Dogs/Prop"])
+    assets_manager.create_json_file("Dogs/Prop", {"name": "bone", "Shots": ["doggo2"]}, "bone.json")
+
+    assert shot_manager.find_assets_by_shot("doggo1.json") == ["Prop_collar"]
+    assert shot_manager.find_shots_by_asset("Prop_bone") == ["doggo2"]
+    assert assets_manager.find_shots_by_asset("Dogs/Prop", "bone.json") == ["doggo2"]
+
+    shot_manager.edit_json_file("doggo1.json", {"name": "Buddy", "assets": ["Prop_bone"]})
+
+    assert shot_manager.find_assets_by_shot("doggo1") == ["Prop_bone"]
+    assert shot_manager.find_shots_by_asset("Prop_collar") == []
+    assert assets_manager.find_shots_by_asset("Dogs/Prop", "bone.json") == ["doggo1", "doggo2"]
+    assert os.path.exists(os.path.join(dogs_path, INDEX_FILE_NAME))
+
+
+def test_reverse_index_is_rebuilt_from_the_files(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    ShotManager(dogs_path).find_assets_by_shot("doggo1")
+    ShowShotManager.close_show_index(dogs_path)
+    os.remove(os.path.join(dogs_path, INDEX_FILE_NAME))
+
+    assert ShotManager(dogs_path).find_shots_by_asset("Prop_collar") == ["doggo1"]
+
+
+def test_reverse_index_lookups_of_unknown_names_are_empty(studio):
+    shot_manager = ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"))
+    assert shot_manager.find_assets_by_shot("nobody.json") == []
+    assert shot_manager.find_shots_by_asset("Prop_nothing") == []
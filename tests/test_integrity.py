@@ -0,0 +1,57 @@
+import json
+import os
+
+from ShowShotManager import JsonTreeBackend, ShowManager, check_show_integrity
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump(data, file)
+
+
+def _read(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def test_check_integrity_reports_and_repairs_references(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    _write(os.path.join(dogs_path, "Prop", "collar.json"), {"name": "collar", "Shots": ["doggo2"]})
+
+    reports = ShowManager(str(studio), "Animal_Kingdom").check_integrity(repair=True)
+
+    report = reports["Dogs"]
+    assert (report["shots"], report["assets"], report["repaired"]) == (1, 1, 1)
+    assert report["one_sided"] == [{"file": "doggo1.json", "kind": "shot", "reference": "Prop_collar"}]
+    assert report["dangling"] == [{"file": "Prop/collar.json", "kind": "asset", "reference": "doggo2"}]
+    assert _read(os.path.join(dogs_path, "Prop", "collar.json"))["Shots"] == ["doggo1"]
+    assert check_show_integrity(dogs_path)["one_sided"] == []
+
+
+def test_check_integrity_repairs_null_and_malformed_reference_lists(studio):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    _write(os.path.join(dogs_path, "doggo2.json"), {"name": "Rex", "assets": None})
+    _write(os.path.join(dogs_path, "Prop", "collar.json"), {"name": "collar", "Shots": "doggo1"})
+    _write(os.path.join(dogs_path, "Prop", "bone.json"), {"name": "bone", "Shots": ["doggo2"]})
+
+    report = check_show_integrity(dogs_path, repair=True)
+
+    assert report["repaired"] == 2
+    assert _read(os.path.join(dogs_path, "doggo2.json"))["assets"] == ["Prop_bone"]
+    assert _read(os.path.join(dogs_path, "Prop", "collar.json"))["Shots"] == ["doggo1"]
+    assert check_show_integrity(dogs_path)["one_sided"] == []
+
+
+def test_check_integrity_skips_broken_files_and_counts_only_written_repairs(studio, monkeypatch):
+    dogs_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    with open(os.path.join(dogs_path, "broken.json"), 'w') as file:
+        file.write("{not json")
+    _write(os.path.join(dogs_path, "Prop", "collar.json"), {"name": "collar", "Shots": []})
+    monkeypatch.setattr(JsonTreeBackend, "write", lambda self, path, data: (_ for _ in ()).throw(OSError("read-only")))
+
+    report = check_show_integrity(dogs_path, repair=True)
+
+    assert (report["shots"], report["repaired"]) == (1, 0)
+    assert report["one_sided"] == [{"file": "doggo1.json", "kind": "shot", "reference": "Prop_collar"}]
+    assert _read(os.path.join(dogs_path, "Prop", "collar.json"))["Shots"] == []
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from ShowShotManager import JsonTreeBackend, SQLiteBackend, ShotManager, ShowManager
+
+
+@pytest.fixture(params=["tree", "sqlite"])
+def shot_manager(request, tmp_path):
+    backend = JsonTreeBackend() if request.param == "tree" else SQLiteBackend(str(tmp_path / "catalog.db"), str(tmp_path))
+    shot_manager = ShotManager(str(tmp_path / "Show" / "Dogs"), backend)
+    for index in range(25):
+        shot_manager.create_character_info(f"doggo{index:02}", f"Dog {index}", {})
+    yield shot_manager
+    if request.param == "sqlite":
+        backend.close()
+
+
+def collect_pages(page_function, **kwargs):
+    names, cursor = [], None
+    while True:
+        page = page_function(limit=10, cursor=cursor, **kwargs)
+        names.extend(page.items)
+        cursor = page.cursor
+        if cursor is None:
+            return names
+
+
+def test_pages_cover_every_name_once_in_order(shot_manager):
+    expected = [f"doggo{index:02}.json" for index in range(25)]
+    assert collect_pages(shot_manager.page_shots) == expected
+    assert collect_pages(shot_manager.page_shots, descending=True) == expected[::-1]
+    assert sorted(shot_manager.iter_shots("doggo1*.json")) == expected[10:20]
+
+
+def test_pages_stay_consistent_when_files_change_in_between(shot_manager):
+    first = shot_manager.page_shots(limit=10)
+    shot_manager.delete_json_file("doggo00.json")
+    shot_manager.create_character_info("aardvark", "Early", {})
+    shot_manager.create_character_info("doggo99", "Late", {})
+    rest, cursor = [], first.cursor
+    while cursor is not None:
+        page = shot_manager.page_shots(limit=10, cursor=cursor)
+        rest.extend(page.items)
+        cursor = page.cursor
+    assert first.items[-1] == "doggo09.json"
+    assert rest == [f"doggo{index:02}.json" for index in range(10, 25)] + ["doggo99.json"]
+
+
+def test_invalid_limits_and_missing_folders(studio):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    assert show_manager.page_subdirectories(limit=1) == (["Dogs"], None)
+    with pytest.raises(ValueError, match="at least 1"):
+        show_manager.page_subdirectories(limit=0)
+    assert ShotManager(os.path.join(str(studio), "Missing")).page_shots() == ([], None)
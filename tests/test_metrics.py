@@ -0,0 +1,71 @@
+import io
+import json
+import logging
+import os
+
+import pytest
+
+import ShowShotManager
+from ShowShotManager import (
+    METRICS, ShotManager, configure_output, disable_metrics, enable_metrics, start_capture, stop_capture,
+)
+
+
+@pytest.fixture
+def metrics():
+    METRICS.reset()
+    enable_metrics()
+    yield METRICS
+    disable_metrics()
+    METRICS.reset()
+
+
+@pytest.fixture
+def json_log():
+    stream = io.StringIO()
+    handlers = list(ShowShotManager.logger.handlers)
+    configure_output("log", json_stream=stream, level=logging.DEBUG)
+    yield stream
+    configure_output("print")
+    ShowShotManager.logger.handlers[:] = handlers
+    ShowShotManager.logger.setLevel(logging.NOTSET)
+
+
+def test_enabled_metrics_time_calls_and_count_documents(studio, metrics):
+    shot_manager = ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"))
+    shot_manager.get_json_file_info("doggo1.json")
+    with pytest.raises(TypeError):
+        shot_manager.get_json_file_info()
+
+    snapshot = metrics.snapshot()
+    operation = snapshot["operations"]["ShotManager.get_json_file_info"]
+    assert (operation["count"], operation["errors"]) == (2, 1)
+    assert snapshot["counters"]["documents_parsed"] >= 1
+    assert 'showshot_operation_seconds_count{operation="ShotManager.get_json_file_info"} 2' in metrics.to_prometheus()
+
+    disable_metrics()
+    shot_manager.get_json_file_info("doggo1.json")
+    assert metrics.snapshot()["operations"]["ShotManager.get_json_file_info"]["count"] == 2
+    assert ShotManager.get_json_file_info is vars(ShotManager)["get_json_file_info"]
+
+
+def test_messages_are_logged_as_json_with_their_operation(studio, metrics, json_log, capsys):
+    ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs")).delete_json_file("missing.json")
+    entries = [json.loads(line) for line in json_log.getvalue().splitlines()]
+    warning = next(entry for entry in entries if entry["level"] == "WARNING")
+    assert warning["operation"] == "ShotManager.delete_json_file" and "missing.json" in warning["message"]
+    assert any(entry["level"] == "DEBUG" and "seconds" in entry for entry in entries)
+    assert capsys.readouterr().out == ""
+
+
+def test_captures_and_output_modes_reject_misuse():
+    with pytest.raises(ValueError, match="Unknown output mode"):
+        configure_output("email")
+    with pytest.raises(RuntimeError, match="No capture is running"):
+        stop_capture()
+    start_capture("tracemalloc")
+    with pytest.raises(RuntimeError, match="already running"):
+        start_capture("cprofile")
+    assert stop_capture(limit=3).startswith("Peak traced memory")
+    with pytest.raises(ValueError, match="Unknown capture mode"):
+        start_capture("perf")
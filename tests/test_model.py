@@ -0,0 +1,32 @@
+import os
+
+from ShowShotManager import JsonTreeBackend, get_show_index, load_show_model, save_show_model
+
+
+def test_show_model_round_trips_the_json_schema(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    backend = JsonTreeBackend()
+    backend.write(os.path.join(show_path, "doggo2.json"), {"name": "Rex", "assets": ["Prop_collar"], "owner": "Ann"})
+    os.makedirs(os.path.join(show_path, "Prop"))
+    backend.write(os.path.join(show_path, "Prop", "collar.json"), {"name": "collar", "Shots": ["doggo1", "doggo2"], "color": "red"})
+
+    show = load_show_model(show_path)
+    assert len(show.references) == 3  # Prop_collar, doggo1 and doggo2, each stored once
+    assert show.shots["doggo2.json"].extra == {"owner": "Ann"}
+    assert show.assets["Prop/collar.json"].shots == ["doggo1", "doggo2"]
+
+    show.shots["doggo1.json"].assets = ["Prop_collar", "Prop_bone"]
+    assert save_show_model(show, show_path) == {}
+    assert load_show_model(show_path).to_json_documents() == show.to_json_documents()
+    assert show.to_json_documents()["doggo2.json"] == {"name": "Rex", "assets": ["Prop_collar"], "owner": "Ann"}
+    assert get_show_index(show_path).get_shots_for_asset("Prop_bone") == ["doggo1"]
+
+
+def test_failed_writes_are_returned_and_left_out_of_the_index(studio, monkeypatch):
+    show_path = os.path.join(str(studio), "Animal_Kingdom", "Dogs")
+    show = load_show_model(show_path)
+    show.shots["doggo1.json"].assets = ["Prop_bone"]
+    monkeypatch.setattr(JsonTreeBackend, "write", lambda self, path, data: (_ for _ in ()).throw(OSError("disk full")))
+    errors = save_show_model(show, show_path)
+    assert list(errors) == [os.path.join(show_path, "doggo1.json")] and isinstance(errors[os.path.join(show_path, "doggo1.json")], OSError)
+    assert get_show_index(show_path).get_shots_for_asset("Prop_bone") == []
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from ShowShotManager import ShotManager, ShowManager
+
+
+@pytest.fixture
+def dogs(studio):
+    shot_manager = ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"))
+    shot_manager.create_character_info("doggo2", "Max", {"age": 5, "breed": "Golden Retriever", "assets": ["Prop_ball"]})
+    shot_manager.create_character_info("doggo3", "Bella", {"age": 2, "breed": "Golden Retriever", "assets": ["Set_park"]})
+    return shot_manager
+
+
+def test_query_filters_on_fields_and_list_contents(studio, dogs):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    results = show_manager.query({"breed": "Golden Retriever", "assets": ("glob", "Prop_*")}, fields=["name", "age"])
+    assert results == [{"show": "Dogs", "file": "doggo2.json", "kind": "shot", "data": {"name": "Max", "age": 5}}]
+    assert [result["file"] for result in dogs.query({"age": (">=", 3)})] == ["doggo1.json", "doggo2.json"]
+    assert [result["file"] for result in dogs.query({"assets": ["Prop_collar"]})] == ["doggo1.json"]
+    assert [result["file"] for result in dogs.query({"breed": ("!=", "Beagle")})] == ["doggo2.json", "doggo3.json"]
+
+
+def test_query_follows_updates_and_spans_shows(studio, dogs):
+    dogs.edit_json_file("doggo3.json", {"name": "Bella", "breed": "Beagle"})
+    farm = ShowManager(str(studio), "Farm")
+    farm.create_directory(str(studio), "Farm")
+    farm.create_subdirectories(["Cows"])
+    ShotManager(os.path.join(str(studio), "Farm", "Cows")).create_character_info("cow1", "Daisy", {"breed": "Beagle"})
+    results = ShowManager(str(studio), "Animal_Kingdom").query({"breed": "Beagle"}, fields=["name"], all_shows=True)
+    assert sorted(result["data"]["name"] for result in results) == ["Bella", "Buddy", "Daisy"]
+
+
+def test_query_rejects_unknown_operators(dogs):
+    with pytest.raises(ValueError, match="Invalid condition"):
+        dogs.query({"age": ("~", 3)})
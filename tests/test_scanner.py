@@ -0,0 +1,27 @@
+import json
+import os
+
+from ShowShotManager import ShowSnapshot, scan_shows
+
+
+def test_rescan_reuses_unchanged_directories(studio, tmp_path_factory):
+    snapshot = scan_shows(str(studio), workers=2)
+    assert snapshot.shows() == ["Animal_Kingdom"]
+    assert snapshot.categories("Animal_Kingdom") == ["Dogs"]
+    assert [name for name, _, _ in snapshot.asset_files("Animal_Kingdom")] == ["Dogs/doggo1.json"]
+
+    snapshot_path = str(tmp_path_factory.mktemp("snapshots") / "snapshot.json")
+    snapshot.save(snapshot_path)
+    with open(os.path.join(str(studio), "Animal_Kingdom", "Dogs", "doggo2.json"), "w") as file:
+        json.dump({"name": "Rex"}, file)
+    rescanned = scan_shows(str(studio), ShowSnapshot.load(snapshot_path))
+    assert rescanned.stats == {"listed": 1, "reused": 2}
+    assert [name for name, _, _ in rescanned.asset_files("Animal_Kingdom", "Dogs")] == ["Dogs/doggo1.json", "Dogs/doggo2.json"]
+
+
+def test_missing_or_stale_snapshots_mean_a_full_scan(studio, tmp_path):
+    assert ShowSnapshot.load(str(tmp_path / "missing.json")) is None
+    stale = ShowSnapshot.from_dict({"version": -1, "directory_path": str(studio), "directories": {"": [0, [], []]}})
+    assert stale.directories == {}
+    assert scan_shows(str(studio), stale).stats == {"listed": 3, "reused": 0}
+    assert scan_shows(str(tmp_path / "missing")).directories == {}
@@ -0,0 +1,46 @@
+import json
+import os
+
+import pytest
+
+from ShowShotManager import AssetManager, ShotManager, ShowManager, get_search_index
+
+
+@pytest.fixture
+def show_manager(studio):
+    show_manager = ShowManager(str(studio), "Animal_Kingdom")
+    show_manager.create_json_file("Dogs", "description.json", {"Description": "Dogs of the Café, a golden retriever story"})
+    assets = AssetManager(os.path.join(str(studio), "Animal_Kingdom"))
+    assets.create_folders(["Dogs/Prop"])
+    assets.create_json_file("Dogs/Prop", {"name": "Staff1", "additional_info": "An environment prop", "Shots": ["doggo1"]},
+                            "Staff1.json")
+    return show_manager
+
+
+def test_search_ranks_matches_and_follows_manager_writes(studio, show_manager):
+    results = show_manager.search("golden retr*")
+    assert [(result["path"], result["kind"]) for result in results] == [("Dogs/description.json", "description")]
+    assert "[golden] [retriever]" in results[0]["snippet"]
+    assert [result["path"] for result in show_manager.search("cafe")] == ["Dogs/description.json"]
+    assert [result["path"] for result in show_manager.search("env", kind="asset", prefix=True)] == ["Dogs/Prop/Staff1.json"]
+
+    shot_manager = ShotManager(os.path.join(str(studio), "Animal_Kingdom", "Dogs"))
+    shot_manager.create_character_info("doggo2", "Rex", {"breed": "Golden Retriever"})
+    assert [result["path"] for result in show_manager.search("golden", kind="shot")] == ["Dogs/doggo2.json"]
+    shot_manager.delete_json_file("doggo2.json")
+    assert show_manager.search("golden", kind="shot") == []
+
+
+def test_refresh_picks_up_outside_edits_only(studio, show_manager):
+    index = get_search_index(os.path.join(str(studio), "Animal_Kingdom"))
+    with open(os.path.join(str(studio), "Animal_Kingdom", "Dogs", "doggo1.json"), "w") as file:
+        json.dump({"name": "Buddy", "breed": "Dalmatian"}, file)
+    assert index.refresh() == {"added": 0, "updated": 1, "removed": 0, "documents": 3}
+    assert [result["path"] for result in show_manager.search("dalmatian")] == ["Dogs/doggo1.json"]
+    assert index.refresh()["updated"] == 0
+
+
+def test_search_rejects_unknown_kinds_and_ignores_empty_queries(show_manager):
+    with pytest.raises(ValueError, match="Unknown kind"):
+        show_manager.search("dogs", kind="episode")
+    assert show_manager.search("  *** ") == []
@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from ShowShotManager import AssetManager, SQLiteBackend, ShotManager, ShowIndex, ShowManager, get_show_index
+
+
+def test_sqlite_import_tree_refreshes_open_show_indexes(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+    dogs_path = os.path.join(show_path, "Dogs")
+    backend = SQLiteBackend(os.path.join(str(studio), "catalog.db"), show_path)
+    assert backend.import_tree() == 1
+    shot_manager = ShotManager(dogs_path, backend=backend)
+    assert [row["file"] for row in shot_manager.query({"breed": "Beagle"})] == ["doggo1.json"]
+    index = get_show_index(dogs_path, backend)
+
+    with open(os.path.join(dogs_path, "doggo2.json"), 'w') as file:
+        json.dump({"name": "Rex", "breed": "Beagle"}, file)
+    assert backend.import_tree() == 2
+
+    assert get_show_index(dogs_path, backend) is not index
+    assert sorted(row["file"] for row in shot_manager.query({"breed": "Beagle"})) == ["doggo1.json", "doggo2.json"]
+    backend.close()
+
+
+def test_sqlite_import_tree_rejects_invalid_json(studio):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+    backend = SQLiteBackend(os.path.join(str(studio), "catalog.db"), show_path)
+    with open(os.path.join(show_path, "Dogs", "broken.json"), 'w') as file:
+        file.write("{not json")
+    with pytest.raises(ValueError):
+        backend.import_tree()
+    backend.close()
+
+
+def test_managers_work_on_a_sqlite_catalog_and_export_it(tmp_path):
+    show_path = os.path.join(str(tmp_path), "Animal_Kingdom")
+    backend = SQLiteBackend(os.path.join(str(tmp_path), "catalog.db"), show_path)
+    show_manager = ShowManager(str(tmp_path), "Animal_Kingdom", backend=backend)
+    show_manager.create_subdirectories(["Dogs", "Cats"])
+    shot_manager = ShotManager(os.path.join(show_path, "Dogs"), backend=backend)
+    shot_manager.create_character_info("doggo1", "Buddy", {"age": 3})
+
+    assert not os.path.exists(show_path)
+    assert show_manager.get_subdirectories() == ["Cats", "Dogs"]
+    assert shot_manager.get_json_file_info("doggo1.json")["age"] == 3
+
+    assert backend.export_tree(os.path.join(str(tmp_path), "export")) == 1
+    with open(os.path.join(str(tmp_path), "export", "Dogs", "doggo1.json")) as file:
+        assert json.load(file)["name"] == "Buddy"
+    backend.close()
+
+
+def test_sqlite_transaction_rolls_back_on_error(tmp_path):
+    show_path = os.path.join(str(tmp_path), "Animal_Kingdom")
+    backend = SQLiteBackend(os.path.join(str(tmp_path), "catalog.db"), show_path)
+    shot_manager = ShotManager(os.path.join(show_path, "Dogs"), backend=backend)
+    shot_manager.create_character_info("doggo1", "Buddy", {"age": 3})
+
+    with pytest.raises(RuntimeError):
+        with backend.transaction():
+            shot_manager.edit_json_file("doggo1.json", {"name": "Buddy", "age": 4})
+            raise RuntimeError("interrupted")
+
+    assert shot_manager.get_json_file_info("doggo1.json")["age"] == 3
+    with pytest.raises(ValueError):
+        backend.read(os.path.join(str(tmp_path), "elsewhere", "doggo1.json"))
+    backend.close()
+
+
+def test_sqlite_shots_update_rolls_back_when_the_index_fails(tmp_path, monkeypatch):
+    show_path = os.path.join(str(tmp_path), "Animal_Kingdom")
+    backend = SQLiteBackend(os.path.join(str(tmp_path), "catalog.db"), show_path)
+    assets_manager = AssetManager(show_path, backend=backend)
+    assets_manager.create_folders(["Dogs/Prop"])
+    assets_manager.create_json_file("Dogs/Prop", {"name": "bone", "Shots": ["doggo1"]}, "bone.json")
+
+    def fail(*args):
+        raise RuntimeError("index unavailable")
+
+    monkeypatch.setattr(ShowIndex, "set_asset_document", fail)
+    with pytest.raises(RuntimeError):
+        assets_manager.update_shots_key("Dogs/Prop", "bone.json", ["doggo2"])
+    with pytest.raises(RuntimeError):
+        assets_manager.add_shots_key_values("Dogs/Prop", "bone.json", ["doggo3"])
+
+    assert assets_manager.get_shots_key_values("Dogs/Prop", "bone.json") == ["doggo1"]
+    backend.close()
@@ -0,0 +1,45 @@
+import os
+
+from ShowShotManager import ShotManager, StudioCoordinator, _emit
+
+
+def _fail_on_farm(show_manager):
+    _emit(f"Looking at {show_manager.directory_name}")
+    if show_manager.directory_name == "Farm":
+        raise RuntimeError("no cows allowed")
+    return show_manager.get_subdirectories()
+
+
+def test_coordinator_runs_each_show_in_a_worker(studio):
+    ShotManager(os.path.join(str(studio), "Farm", "Cows")).create_character_info("cow1", "Daisy", {})
+    seen = []
+
+    report = StudioCoordinator(str(studio), workers=2).list_shows(progress=lambda result: seen.append(result["show"]))
+
+    assert sorted(seen) == ["Animal_Kingdom", "Farm"]
+    assert report["errors"] == {} and report["cancelled"] == []
+    assert report["results"] == {
+        "Animal_Kingdom": {"Dogs": {"shots": ["doggo1.json"], "assets": []}},
+        "Farm": {"Cows": {"shots": ["cow1.json"], "assets": []}},
+    }
+
+
+def test_failures_and_output_are_reported_per_show(studio):
+    os.makedirs(os.path.join(str(studio), "Farm"))
+
+    report = StudioCoordinator(str(studio), workers=2).run(_fail_on_farm)
+
+    assert report["results"] == {"Animal_Kingdom": ["Dogs"]}
+    assert "RuntimeError: no cows allowed" in report["errors"]["Farm"]
+    assert report["output"] == {"Animal_Kingdom": "Looking at Animal_Kingdom\n", "Farm": "Looking at Farm\n"}
+
+
+def test_cancel_skips_the_shows_not_started(studio):
+    for show_name in ("B", "C", "D"):
+        os.makedirs(os.path.join(str(studio), show_name))
+    coordinator = StudioCoordinator(str(studio), workers=1)
+
+    report = coordinator.list_shows(progress=lambda result: coordinator.cancel())
+
+    assert list(report["results"]) == ["Animal_Kingdom"]
+    assert report["cancelled"] == ["B", "C", "D"]
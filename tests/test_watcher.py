@@ -0,0 +1,50 @@
+import json
+import os
+
+import pytest
+
+from ShowShotManager import ShowWatcher, _Inotify, get_show_index, index_subscriber
+
+
+@pytest.fixture(params=[False, True], ids=["polling", "inotify"])
+def use_inotify(request):
+    if request.param and not _Inotify.available():
+        pytest.skip("inotify is not available")
+    return request.param
+
+
+def write_json(path, data):
+    with open(path, "w") as file:
+        json.dump(data, file)
+
+
+def test_watcher_coalesces_outside_edits_and_updates_the_index(studio, use_inotify):
+    show_path = os.path.join(str(studio), "Animal_Kingdom")
+    watcher = ShowWatcher(str(studio), use_inotify=use_inotify)
+    watcher.subscribe(index_subscriber())
+    try:
+        write_json(os.path.join(show_path, "pup.json"), {"name": "Pup", "assets": ["Prop_ball"]})
+        write_json(os.path.join(show_path, "pup.json"), {"name": "Pup", "assets": ["Prop_bone"]})
+        write_json(os.path.join(show_path, "scratch.json"), {})
+        os.remove(os.path.join(show_path, "scratch.json"))
+        events = watcher.poll(0.5)
+    finally:
+        watcher.stop()
+    assert [(event.action, event.kind, os.path.basename(event.path)) for event in events] == [
+        ("created", "shot", "pup.json")]
+    assert get_show_index(show_path).get_assets_for_shot("pup.json") == ["Prop_bone"]
+
+
+def test_failing_subscriber_is_reported_and_others_still_run(studio, capsys):
+    watcher = ShowWatcher(str(studio), use_inotify=False)
+    received = []
+
+    def broken(events):
+        raise RuntimeError("boom")
+
+    watcher.subscribe(broken)
+    watcher.subscribe(received.extend)
+    os.makedirs(os.path.join(str(studio), "Farm"))
+    watcher.poll()
+    assert [(event.action, event.kind) for event in received] == [("created", "show")]
+    assert "failed: boom" in capsys.readouterr().out